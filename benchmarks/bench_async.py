@@ -0,0 +1,162 @@
+"""
+Throughput benchmark for AsyncTodoManager against the sync TodoManager.
+
+Runs the same workload from many concurrent coroutines: each one adds a
+task, then repeatedly updates, completes, reads and re-opens it, and
+finally lists all tasks. The sync manager is called straight from the
+coroutines, blocking the loop for every call; the async facade queues
+writes to its writer thread in batches. Besides operations per second,
+a heartbeat coroutine records the worst event loop stall: with a journal
+(--data-dir, --fsync always) the sync manager holds the loop for every
+fsync, while the async facade keeps it responsive.
+
+Usage:
+    python benchmarks/bench_async.py [--coroutines N] [--rounds R]
+        [--data-dir DIR] [--fsync always|batch|never]
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from async_manager import AsyncTodoManager
+from persistence import FSYNC_POLICIES, TaskJournal
+from storage import PersistentTaskStore
+from todo_manager import TodoManager
+
+# Heartbeat period for measuring event loop stalls
+TICK = 0.001
+
+
+class SyncFacade:
+    """Awaitable wrapper calling a TodoManager directly on the event loop."""
+
+    def __init__(self, manager: TodoManager) -> None:
+        self._manager = manager
+
+    async def add_task(self, title, description=None):
+        return self._manager.add_task(title, description)
+
+    async def update_task(self, task_id, new_title=None, new_description=None):
+        return self._manager.update_task(task_id, new_title, new_description)
+
+    async def mark_complete(self, task_id):
+        return self._manager.mark_complete(task_id)
+
+    async def mark_incomplete(self, task_id):
+        return self._manager.mark_incomplete(task_id)
+
+    async def get_task(self, task_id):
+        return self._manager.get_task(task_id)
+
+    async def get_all_tasks(self):
+        return self._manager.get_all_tasks()
+
+    async def close(self):
+        self._manager.close()
+
+
+async def client(manager, index: int, rounds: int) -> int:
+    """Run one coroutine's share of the workload; return its operation count."""
+    task, _ = await manager.add_task(f"Coroutine {index}", "Benchmark task")
+    for number in range(rounds):
+        await manager.update_task(task.id, f"Coroutine {index} round {number}")
+        await manager.mark_complete(task.id)
+        await manager.get_task(task.id)
+        await manager.mark_incomplete(task.id)
+        # Give the other coroutines a turn, as a service handling requests would
+        await asyncio.sleep(0)
+    await manager.get_all_tasks()
+    return 2 + 4 * rounds
+
+
+async def heartbeat(stop: asyncio.Event, stalls: list) -> None:
+    """Record how late each TICK-long sleep wakes up."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        began = loop.time()
+        await asyncio.sleep(TICK)
+        stalls.append(loop.time() - began - TICK)
+
+
+async def run(manager, coroutines: int, rounds: int) -> tuple[float, float]:
+    """
+    Run the workload on a manager facade.
+
+    Returns:
+        A tuple of (operations per second, worst loop stall in milliseconds)
+    """
+    stop = asyncio.Event()
+    stalls = [0.0]
+    ticker = asyncio.create_task(heartbeat(stop, stalls))
+    await asyncio.sleep(0)
+
+    began = time.perf_counter()
+    counts = await asyncio.gather(
+        *(client(manager, index, rounds) for index in range(coroutines))
+    )
+    elapsed = time.perf_counter() - began
+    stop.set()
+    await ticker
+
+    tasks = await manager.get_all_tasks()
+    if [task.id for task in tasks] != list(range(1, coroutines + 1)):
+        raise AssertionError("Concurrent adds produced missing or duplicate IDs")
+    await manager.close()
+    return (sum(counts) / elapsed, max(stalls) * 1000)
+
+
+def make_manager(data_dir: str | None, fsync: str) -> TodoManager:
+    """Create an empty manager, journaled to data_dir if given."""
+    if data_dir is None:
+        return TodoManager(PersistentTaskStore())
+    return TodoManager(PersistentTaskStore(), TaskJournal(data_dir, fsync=fsync))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--coroutines", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--data-dir",
+        help="Journal tasks under this directory (a fresh subdirectory per run)",
+    )
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="batch")
+    args = parser.parse_args()
+
+    print(
+        f"Python {sys.version.split()[0]}, coroutines: {args.coroutines:,}, "
+        f"rounds: {args.rounds}, journal: {args.data_dir or 'none'}\n"
+    )
+    print(f"{'Manager':>8}  {'Ops/s':>12}  {'Worst stall':>11}")
+
+    results = {}
+    for name in ("sync", "async"):
+        directory = None
+        if args.data_dir:
+            directory = tempfile.mkdtemp(prefix=f"{name}-", dir=args.data_dir)
+        try:
+            manager = make_manager(directory, args.fsync)
+            if name == "sync":
+                facade = SyncFacade(manager)
+            else:
+                facade = AsyncTodoManager(manager)
+            ops, stall = asyncio.run(run(facade, args.coroutines, args.rounds))
+        finally:
+            if directory:
+                shutil.rmtree(directory)
+        results[name] = ops
+        print(f"{name:>8}  {ops:>12,.0f}  {stall:>9.1f}ms")
+
+    print(f"\nAsync/sync throughput: {results['async'] / results['sync']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Multi-threaded stress benchmark for ConcurrentTodoManager.
+
+Measures read throughput (get_task and iter_tasks pages) with 1, 2, 4, ...
+reader threads, with and without a concurrent writer, and checks that the
+manager is consistent afterwards. On a free-threaded (no-GIL) build read
+throughput should grow with the number of cores; with the GIL it stays flat.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--tasks N] [--seconds S]
+        [--max-threads T]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from concurrent_manager import ConcurrentTodoManager
+
+
+def gil_enabled() -> bool:
+    """Return True unless running on a free-threaded build with the GIL off."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def thread_counts(maximum: int) -> list[int]:
+    """Return 1, 2, 4, ... up to and including maximum."""
+    counts = []
+    count = 1
+    while count < maximum:
+        counts.append(count)
+        count *= 2
+    counts.append(maximum)
+    return counts
+
+
+def run_readers(manager, readers: int, seconds: float, task_count: int, writer: bool):
+    """
+    Run reader threads (and optionally one writer) for a fixed time.
+
+    Returns:
+        A tuple of (read operations per second, write operations per second)
+    """
+    stop = threading.Event()
+    start = threading.Barrier(readers + writer + 1)
+    read_ops = [0] * readers
+    write_ops = [0]
+
+    def read(index):
+        rng = random.Random(index)
+        get_task = manager.get_task
+        ops = 0
+        start.wait()
+        while not stop.is_set():
+            for _ in range(256):
+                get_task(rng.randint(1, task_count))
+            # One short page per batch exercises the snapshot path
+            for _ in manager.iter_tasks(rng.randint(1, task_count), 16):
+                pass
+            ops += 257
+        read_ops[index] = ops
+
+    def write():
+        rng = random.Random(-1)
+        start.wait()
+        while not stop.is_set():
+            task_id = rng.randint(1, task_count)
+            manager.update_task(task_id, new_title=f"Updated {write_ops[0]}")
+            if write_ops[0] % 2:
+                manager.mark_complete(task_id)
+            else:
+                manager.mark_incomplete(task_id)
+            write_ops[0] += 2
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    if writer:
+        threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    return (sum(read_ops) / elapsed, write_ops[0] / elapsed)
+
+
+def check_concurrent_adds(threads: int, per_thread: int) -> float:
+    """
+    Add tasks from many threads and verify every ID was allocated once.
+
+    Returns:
+        Adds per second
+    """
+    manager = ConcurrentTodoManager()
+
+    def add(index):
+        for i in range(per_thread):
+            manager.add_task(f"Thread {index} task {i}")
+
+    workers = [threading.Thread(target=add, args=(i,)) for i in range(threads)]
+    began = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+
+    ids = [task.id for task in manager.get_all_tasks()]
+    expected = threads * per_thread
+    if ids != list(range(1, expected + 1)):
+        raise AssertionError("Concurrent adds produced missing or duplicate IDs")
+    return expected / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}")
+    print(f"CPUs: {os.cpu_count()}, tasks: {args.tasks:,}\n")
+
+    manager = ConcurrentTodoManager()
+    manager.add_many((f"Task {i}", f"Details {i}") for i in range(args.tasks))
+
+    print(f"{'Readers':>7}  {'Writer':>6}  {'Reads/s':>12}  {'Scaling':>7}  Writes/s")
+    for writer in (False, True):
+        baseline = None
+        for readers in thread_counts(args.max_threads):
+            reads, writes = run_readers(
+                manager, readers, args.seconds, args.tasks, writer
+            )
+            baseline = baseline or reads
+            print(
+                f"{readers:>7}  {'yes' if writer else 'no':>6}  {reads:>12,.0f}  "
+                f"{reads / baseline:>6.2f}x  {writes:,.0f}"
+            )
+
+    adds = check_concurrent_adds(max(args.max_threads, 4), 10_000)
+    print(f"\nConcurrent adds: {adds:,.0f}/s, IDs unique and contiguous")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Startup and import-time benchmark for the todo command.
+
+Runs typical invocations (interactive menu, one-shot add/view/search) in
+fresh interpreters and reports:
+- median wall-clock time per invocation, next to a bare 'python -c pass'
+- per-module import cost from 'python -X importtime', for modules the
+  invocation imports beyond interpreter startup
+
+The import cost of each invocation is checked against its budget, so a new
+top-level import on the startup path shows up as a failure.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--top K]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+MAIN = str(SRC / "main.py")
+
+# Run without a data directory from the environment
+ENV = {name: value for name, value in os.environ.items() if name != "TODO_DATA_DIR"}
+
+
+def scenarios(data_dir: str) -> list[tuple[str, list[str], str, float]]:
+    """
+    Return the measured invocations.
+
+    Returns:
+        (name, arguments, stdin, import budget in ms) tuples; the budget is
+        the import cost allowed beyond interpreter startup
+    """
+    return [
+        ("menu", [MAIN], "quit\n", 10.0),
+        ("add", [MAIN, "--data-dir", data_dir, "add", "Benchmark task"], "", 10.0),
+        ("view", [MAIN, "--data-dir", data_dir, "view", "--page", "1"], "", 10.0),
+        # Search needs re for tokenizing
+        ("search", [MAIN, "--data-dir", data_dir, "search", "bench*"], "", 20.0),
+    ]
+
+
+def run(arguments: list[str], stdin: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run the interpreter with the given arguments and capture its output."""
+    return subprocess.run(
+        [sys.executable, *flags, *arguments],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=True,
+        env=ENV,
+    )
+
+
+def median_ms(arguments: list[str], stdin: str, runs: int) -> float:
+    """Return the median wall-clock time of an invocation in milliseconds."""
+    times = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        run(arguments, stdin)
+        times.append(time.perf_counter() - began)
+    return statistics.median(times) * 1000
+
+
+def import_times(arguments: list[str], stdin: str) -> list[tuple[str, int, int, int]]:
+    """
+    Collect -X importtime output for an invocation.
+
+    Returns:
+        (module, self_us, cumulative_us, depth) tuples in import order
+    """
+    stderr = run(arguments, stdin, "-X", "importtime").stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    # Measure imports, not compilation: make sure bytecode is cached
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(SRC)], check=True)
+
+    startup = {name for name, *_ in import_times(["-c", "pass"], "")}
+    bare_ms = median_ms(["-c", "pass"], "", args.runs)
+    print(f"python -c pass: {bare_ms:.1f} ms\n")
+
+    over_budget = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for name, arguments, stdin, budget in scenarios(data_dir):
+            wall_ms = median_ms(arguments, stdin, args.runs)
+            entries = [
+                entry
+                for entry in import_times(arguments, stdin)
+                if entry[0] not in startup
+            ]
+            # Top-level entries include the cost of everything they import
+            total_ms = sum(e[2] for e in entries if e[3] == 0) / 1000
+
+            status = "ok" if total_ms <= budget else "OVER BUDGET"
+            print(
+                f"{name}: {wall_ms:.1f} ms wall ({wall_ms - bare_ms:+.1f} ms), "
+                f"imports {total_ms:.1f} ms of {budget:.1f} ms budget [{status}]"
+            )
+            print(f"  {'module':<28} {'self ms':>8} {'total ms':>9}")
+            slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)
+            for module, self_us, cumulative_us, _ in slowest[: args.top]:
+                print(
+                    f"  {module:<28} {self_us / 1000:>8.2f} "
+                    f"{cumulative_us / 1000:>9.2f}"
+                )
+            print(f"  modules imported: {len(entries)}\n")
+            if total_ms > budget:
+                over_budget.append(name)
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Benchmark suite for TodoManager operations and Task validation.
+
+For each task count (1k, 100k and 1M by default) a manager is filled with
+add_task and then measured on get, update, complete, list and delete. Task
+validation and creation are measured on their own. Every operation reports:
+
+- ops/sec (from the summed per-call latencies)
+- p50 and p99 latency in microseconds
+- peak traced memory in MiB, from a second pass under tracemalloc (which
+  would otherwise distort the timings)
+
+Results can be saved as JSON and compared against an earlier run; the
+comparison fails when an operation got slower or used more memory than the
+thresholds allow.
+
+Usage:
+    python benchmarks/bench_manager.py [--sizes 1000,100000,1000000]
+        [--store dict|columnar|persistent] [--ops N] [--no-memory]
+        [--output results.json] [--baseline baseline.json]
+        [--max-slowdown 0.15] [--max-memory-growth 0.10]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models import Task, text_pool
+from storage import ColumnarTaskStore, DictTaskStore, PersistentTaskStore
+from todo_manager import TodoManager
+
+STORES = {
+    "dict": DictTaskStore,
+    "columnar": ColumnarTaskStore,
+    "persistent": PersistentTaskStore,
+}
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+# Whole-list operations are repeated this many times
+LIST_REPEATS = 5
+
+
+def timed(function, calls) -> array:
+    """
+    Call function once per argument tuple, timing each call.
+
+    Returns:
+        Latencies in nanoseconds
+    """
+    clock = time.perf_counter_ns
+    latencies = array("q")
+    record = latencies.append
+    for args in calls:
+        start = clock()
+        function(*args)
+        record(clock() - start)
+    return latencies
+
+
+def untimed(function, calls) -> None:
+    """Call function once per argument tuple (for the memory pass)."""
+    for args in calls:
+        function(*args)
+
+
+def summarize(latencies: array) -> dict:
+    """Return ops/sec and p50/p99 latency for a list of latencies."""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    total_ns = sum(ordered) or 1
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(count - 1, int(fraction * count))] / 1000
+
+    return {
+        "ops": count,
+        "ops_per_sec": round(count * 1e9 / total_ns),
+        "p50_us": round(percentile(0.50), 3),
+        "p99_us": round(percentile(0.99), 3),
+    }
+
+
+def workload(size: int, ops: int, seed: int = 12345) -> dict:
+    """
+    Build the argument tuples for every operation at one task count.
+
+    The same seed gives the same workload, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    ops = min(ops, size)
+    sample = rng.sample(range(1, size + 1), ops)
+    return {
+        "add": [(f"Task {i}", f"Details for task {i}") for i in range(size)],
+        "get": [(rng.randint(1, size),) for _ in range(ops)],
+        "update": [(task_id, f"Renamed {task_id}") for task_id in sample],
+        "complete": [(task_id,) for task_id in sample],
+        "list": [()] * LIST_REPEATS,
+        # Delete in a different order than the other operations touched
+        "delete": [(task_id,) for task_id in rng.sample(sample, len(sample))],
+    }
+
+
+def run_size(store_class, calls: dict, run) -> dict:
+    """
+    Run every manager operation at one task count.
+
+    Args:
+        store_class: Storage engine class for the manager
+        calls: Argument tuples per operation, from workload()
+        run: timed or untimed
+
+    Returns:
+        Operation name mapped to run's result
+    """
+    # Start from an empty pool, so no run reuses strings shared by another
+    text_pool.clear()
+    manager = TodoManager(store_class())
+    operations = {
+        "add": manager.add_task,
+        "get": manager.get_task,
+        "update": manager.update_task,
+        "complete": manager.mark_complete,
+        "list": manager.get_all_tasks,
+        "delete": manager.delete_task,
+    }
+    return {name: run(function, calls[name]) for name, function in operations.items()}
+
+
+def task_calls(ops: int) -> dict:
+    """Return the argument tuples for the Task validation benchmarks."""
+    titles = [f"  Task title number {i}\n" for i in range(ops)]
+    return {
+        "validate_title": [(title,) for title in titles],
+        "create": [(i, title, "A description") for i, title in enumerate(titles)],
+    }
+
+
+def run_task(calls: dict, run) -> dict:
+    """Run the Task validation benchmarks on arguments from task_calls()."""
+    text_pool.clear()
+    return {
+        "validate_title": run(Task.validate_title, calls["validate_title"]),
+        "create": run(Task.create, calls["create"]),
+    }
+
+
+def peak_memory(benchmark) -> dict:
+    """
+    Run a benchmark under tracemalloc and record each operation's peak.
+
+    Args:
+        benchmark: Function taking a run callback, like run_task; build its
+            arguments beforehand, so that they are not counted
+
+    Returns:
+        Operation name mapped to peak traced memory in MiB
+    """
+
+    def traced(function, calls) -> float:
+        tracemalloc.reset_peak()
+        untimed(function, calls)
+        return round(tracemalloc.get_traced_memory()[1] / 2**20, 3)
+
+    tracemalloc.start()
+    try:
+        return benchmark(traced)
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(sizes, store: str, ops: int, memory: bool) -> dict:
+    """
+    Run the whole suite.
+
+    Returns:
+        A JSON-serializable dict with environment info and one result per
+        (operation, size) pair
+    """
+    store_class = STORES[store]
+    results = {}
+
+    def record(group: str, timings: dict, peaks: dict) -> None:
+        for name, latencies in timings.items():
+            result = summarize(latencies)
+            if name in peaks:
+                result["peak_mib"] = peaks[name]
+            results[f"{name}@{group}"] = result
+            peak = f"{peaks[name]:.2f}" if name in peaks else "-"
+            print(
+                f"{name + '@' + group:<24} {result['ops_per_sec']:>12,} "
+                f"{result['p50_us']:>9.2f} {result['p99_us']:>9.2f} {peak:>10}"
+            )
+
+    print(
+        f"{'operation@size':<24} {'ops/sec':>12} {'p50 us':>9} {'p99 us':>9} "
+        f"{'peak MiB':>10}"
+    )
+    task_args = task_calls(max(ops, 10_000))
+    record(
+        "task",
+        run_task(task_args, timed),
+        peak_memory(lambda run: run_task(task_args, run)) if memory else {},
+    )
+    for size in sizes:
+        calls = workload(size, ops)
+        timings = run_size(store_class, calls, timed)
+        peaks = {}
+        if memory:
+            peaks = peak_memory(
+                lambda run, calls=calls: run_size(store_class, calls, run)
+            )
+        record(str(size), timings, peaks)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "store": store,
+        "ops": ops,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, max_slowdown: float, max_growth: float):
+    """
+    Compare results against a baseline run.
+
+    Args:
+        current: Results of this run
+        baseline: Results of the baseline run
+        max_slowdown: Allowed drop in ops/sec (0.15 = 15%)
+        max_growth: Allowed growth in peak memory (0.10 = 10%)
+
+    Returns:
+        A list of regression descriptions (empty if none)
+    """
+    regressions = []
+    for field in ("python", "store", "ops"):
+        if current.get(field) != baseline.get(field):
+            print(
+                f"\nWarning: baseline {field} is {baseline.get(field)!r}, "
+                f"this run used {current.get(field)!r}"
+            )
+    print(f"\n{'operation@size':<24} {'ops/sec':>10} {'p99':>10} {'memory':>10}")
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            continue
+
+        speed = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        p99 = result["p99_us"] / before["p99_us"] - 1 if before["p99_us"] else 0.0
+        growth = None
+        if "peak_mib" in result and before.get("peak_mib"):
+            growth = result["peak_mib"] / before["peak_mib"] - 1
+
+        memory = f"{growth:+.1%}" if growth is not None else "-"
+        print(f"{key:<24} {speed:>+10.1%} {p99:>+10.1%} {memory:>10}")
+        if speed < -max_slowdown:
+            regressions.append(f"{key}: {-speed:.1%} fewer ops/sec")
+        if growth is not None and growth > max_growth:
+            regressions.append(f"{key}: {growth:.1%} more peak memory")
+    return regressions
+
+
+def parse_sizes(text: str) -> list[int]:
+    """Parse a comma-separated list of task counts."""
+    return [int(size) for size in text.split(",") if size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated task counts (default: 1000,100000,1000000)",
+    )
+    parser.add_argument("--store", choices=sorted(STORES), default="dict")
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=100_000,
+        help="Calls per operation, capped at the task count (default: 100000)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the tracemalloc pass",
+    )
+    parser.add_argument("--output", help="Save results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON file")
+    parser.add_argument("--max-slowdown", type=float, default=0.15)
+    parser.add_argument("--max-memory-growth", type=float, default=0.10)
+    args = parser.parse_args()
+
+    current = run_suite(args.sizes, args.store, args.ops, not args.no_memory)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(
+            current, baseline, args.max_slowdown, args.max_memory_growth
+        )
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
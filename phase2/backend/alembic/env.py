@@ -0,0 +1,76 @@
+"""
+Alembic environment for the tasks database.
+
+Migrations run against DATABASE_URL, either from the command line
+(`alembic upgrade head`, a deploy step) or through
+database.run_migrations(), which passes in its own connection.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlmodel import SQLModel
+
+from src import models  # noqa: F401  (registers the tables on SQLModel.metadata)
+from src.database import engine
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = SQLModel.metadata
+
+# Postgres advisory lock taken while migrating, so that concurrent runs
+# (e.g. several app instances with DATABASE_AUTO_MIGRATE) take turns
+MIGRATION_LOCK_KEY = 20260117
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL to stdout instead of running it (--sql)."""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run the migrations on the given connection or a new one."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_on(connection)
+        return
+    with engine.connect() as connection:
+        _run_on(connection)
+
+
+def _run_on(connection) -> None:
+    postgres = connection.dialect.name == "postgresql"
+    if postgres:
+        # Session-level: held across the migrations' own commits
+        connection.exec_driver_sql(f"SELECT pg_advisory_lock({MIGRATION_LOCK_KEY})")
+        connection.commit()
+    try:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite can only alter tables by copying them
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        if postgres:
+            connection.exec_driver_sql(
+                f"SELECT pg_advisory_unlock({MIGRATION_LOCK_KEY})"
+            )
+            connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,43 @@
+"""
+Create the tasks table.
+
+Databases set up before migrations existed already have the table (made
+by SQLModel.metadata.create_all); for them this revision only records
+that the schema is at the baseline.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("tasks"):
+        return
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("title", sqlmodel.AutoString(length=200), nullable=False),
+        sa.Column("description", sqlmodel.AutoString(), nullable=True),
+        sa.Column("status", sa.Boolean(), nullable=False),
+        sa.Column("priority", sqlmodel.AutoString(length=10), nullable=False),
+        sa.Column("category", sqlmodel.AutoString(length=50), nullable=True),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tasks")
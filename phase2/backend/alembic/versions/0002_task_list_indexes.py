@@ -0,0 +1,59 @@
+"""
+Add composite indexes for listing tasks.
+
+One index per sort field, each ending in id (the tie-breaker of every
+sort and cursor), plus indexes for the common filtered views. On
+Postgres they are built with CREATE INDEX CONCURRENTLY, outside a
+transaction, so the table stays writable while they build. A concurrent
+build that fails leaves an INVALID index behind: drop it and run the
+migration again.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:30:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_tasks_created_at_id": ["created_at", "id"],
+    "ix_tasks_due_date_id": ["due_date", "id"],
+    "ix_tasks_title_id": ["title", "id"],
+    "ix_tasks_priority_id": ["priority", "id"],
+    "ix_tasks_status_created_at_id": ["status", "created_at", "id"],
+    "ix_tasks_status_due_date_id": ["status", "due_date", "id"],
+    "ix_tasks_priority_created_at_id": ["priority", "created_at", "id"],
+    "ix_tasks_category_created_at_id": ["category", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES.items():
+                op.create_index(
+                    name, "tasks", columns,
+                    if_not_exists=True, postgresql_concurrently=True
+                )
+    else:
+        for name, columns in INDEXES.items():
+            op.create_index(name, "tasks", columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name in INDEXES:
+                op.drop_index(
+                    name, table_name="tasks",
+                    if_exists=True, postgresql_concurrently=True
+                )
+    else:
+        for name in INDEXES:
+            op.drop_index(name, table_name="tasks", if_exists=True)
@@ -0,0 +1,79 @@
+"""
+Add full-text search over task titles and descriptions.
+
+On Postgres: a GIN index on the weighted tsvector of title (weight A)
+and description (weight B), built with CREATE INDEX CONCURRENTLY. As an
+expression index it needs no new column or table rewrite, and Postgres
+keeps it up to date. crud.SEARCH_DOCUMENT must stay identical to the
+indexed expression.
+
+On SQLite: the tasks_fts FTS5 table, filled from the existing tasks and
+kept in sync by triggers. It stores its own copy of the text, keyed by
+task id, because tasks has no stable integer rowid to share (VACUUM may
+renumber it). Updates and deletes therefore find the row by scanning
+tasks_fts, which is fine at the sizes SQLite serves here (development
+and tests).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 11:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "task_id UNINDEXED, title, description, tokenize = 'unicode61')",
+    "INSERT INTO tasks_fts (task_id, title, description) "
+    "SELECT id, title, coalesce(description, '') FROM tasks",
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (task_id, title, description) "
+    "VALUES (new.id, new.title, coalesce(new.description, '')); END",
+    "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF id, title, description "
+    "ON tasks BEGIN "
+    "UPDATE tasks_fts SET task_id = new.id, title = new.title, "
+    "description = coalesce(new.description, '') WHERE task_id = old.id; END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "DELETE FROM tasks_fts WHERE task_id = old.id; END",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS tasks_fts_delete",
+    "DROP TRIGGER IF EXISTS tasks_fts_update",
+    "DROP TRIGGER IF EXISTS tasks_fts_insert",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_search "
+                f"ON tasks USING gin (({SEARCH_DOCUMENT}))"
+            )
+    elif dialect == "sqlite":
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_search")
+    elif dialect == "sqlite":
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
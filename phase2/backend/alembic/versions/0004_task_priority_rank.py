@@ -0,0 +1,56 @@
+"""
+Add tasks.priority_rank, the ordinal of priority, with its index.
+
+The column is nullable and has no default, so adding it does not rewrite
+the table; the application fills it on every write and revision 0005
+backfills the existing rows. The (priority_rank, created_at, id) index is
+built with CREATE INDEX CONCURRENTLY on Postgres.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 13:00:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_tasks_priority_rank_created_at_id"
+COLUMNS = ["priority_rank", "created_at", "id"]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = {column["name"] for column in sa.inspect(bind).get_columns("tasks")}
+    # Databases made by create_all may have the column already
+    if "priority_rank" not in existing:
+        op.add_column(
+            "tasks", sa.Column("priority_rank", sa.Integer(), nullable=True)
+        )
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX, "tasks", COLUMNS,
+                if_not_exists=True, postgresql_concurrently=True
+            )
+    else:
+        op.create_index(INDEX, "tasks", COLUMNS, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX, table_name="tasks",
+                if_exists=True, postgresql_concurrently=True
+            )
+    else:
+        op.drop_index(INDEX, table_name="tasks", if_exists=True)
+    # Plain ALTER TABLE DROP COLUMN (SQLite 3.35+): a batch copy of the
+    # table would lose the tasks_fts triggers
+    op.drop_column("tasks", "priority_rank")
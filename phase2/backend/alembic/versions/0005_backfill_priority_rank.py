@@ -0,0 +1,64 @@
+"""
+Backfill tasks.priority_rank and retire the string priority indexes.
+
+Rows are updated BATCH_SIZE at a time, each batch in its own
+transaction, so row locks are held briefly and concurrent writes go on
+while the table is backfilled. Rows to update are found through the
+priority_rank index (NULLs are indexed), so every batch costs the same.
+Priorities outside high/medium/low rank as medium.
+
+With the queries on priority_rank, the indexes on the priority string
+are no longer used and are dropped (concurrently on Postgres).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 13:10:00
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# schemas.PRIORITY_RANKS as of this revision
+BACKFILL = sa.text(
+    "UPDATE tasks SET priority_rank = CASE priority "
+    "WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 2 END "
+    "WHERE id IN ("
+    "SELECT id FROM tasks WHERE priority_rank IS NULL LIMIT :batch_size)"
+)
+
+STRING_INDEXES = {
+    "ix_tasks_priority_id": ["priority", "id"],
+    "ix_tasks_priority_created_at_id": ["priority", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            result = bind.execute(BACKFILL, {"batch_size": BATCH_SIZE})
+            if result.rowcount < BATCH_SIZE:
+                break
+        for name in STRING_INDEXES:
+            op.drop_index(
+                name, table_name="tasks",
+                if_exists=True, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    # The backfilled ranks are kept; only the string indexes come back
+    with op.get_context().autocommit_block():
+        for name, columns in STRING_INDEXES.items():
+            op.create_index(
+                name, "tasks", columns,
+                if_not_exists=True, postgresql_concurrently=True
+            )
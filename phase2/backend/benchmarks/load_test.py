@@ -0,0 +1,234 @@
+"""
+Load test comparing the sync and async (DATABASE_ASYNC) API paths.
+
+Migrates the database, starts the API with uvicorn once per path,
+against the same database, and sends requests from many concurrent
+clients: mostly list requests, plus single-task reads, creates and
+completions. Reports requests per second and latency percentiles for
+each path.
+
+Sync routes run in the threadpool (40 threads by default), so at most
+that many requests wait on the database at once; async routes wait on
+the event loop. The difference shows when each query spends its time
+waiting on the network, as with a remote Postgres server: point
+DATABASE_URL (or --database-url) at one. A local SQLite file, the
+default, has almost no wait to overlap.
+
+Each path has a connection pool of DATABASE_POOL_SIZE connections plus
+DATABASE_MAX_OVERFLOW (10 + 10 by default), so with many more concurrent
+clients than that, requests queue for a connection and some may time
+out; those are counted as errors rather than stopping the run. The
+pool statistics of each run are printed after the results.
+
+Usage:
+    python benchmarks/load_test.py [--requests N] [--concurrency C]
+        [--database-url URL] [--paths sync,async]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def migrate(database_url: str) -> None:
+    """Bring the database schema up to date, as a deploy would."""
+    result = subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=BACKEND_DIR,
+        env=dict(os.environ, DATABASE_URL=database_url),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Migrations failed:\n{result.stderr}")
+
+
+def start_server(path: str, database_url: str, port: int) -> subprocess.Popen:
+    """Start uvicorn serving the API on the sync or async path."""
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        DATABASE_ASYNC="true" if path == "async" else "false",
+    )
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.main:app",
+            "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        # Keep the server's warnings out of the results
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_until_up(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    """Wait for the health endpoint to answer."""
+    for _ in range(300):
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            if (await client.get("/api/v1/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+
+async def request(client: httpx.AsyncClient, rng: random.Random, ids: list) -> bool:
+    """Send one request of the mix; return whether it succeeded."""
+    roll = rng.random()
+    if roll < 0.7:
+        params = {"limit": 20, "status": rng.choice(["complete", "incomplete"])}
+        response = await client.get("/api/v1/tasks", params=params)
+    elif roll < 0.85:
+        response = await client.get(f"/api/v1/tasks/{rng.choice(ids)}")
+    elif roll < 0.95:
+        response = await client.post(
+            "/api/v1/tasks", json={"title": f"Load test {rng.random():.6f}"}
+        )
+    else:
+        response = await client.patch(f"/api/v1/tasks/{rng.choice(ids)}/complete")
+    return response.status_code < 400
+
+
+async def run(base_url: str, requests: int, concurrency: int, seed_tasks: int):
+    """
+    Seed tasks if needed, then send the requests from concurrent clients.
+
+    Returns:
+        Tuple of (requests per second, latencies in seconds, failed requests)
+    """
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        ids = [
+            task["id"]
+            for task in (await client.get("/api/v1/tasks?limit=100")).json()["data"]
+        ]
+        while len(ids) < min(seed_tasks, 100):
+            response = await client.post(
+                "/api/v1/tasks", json={"title": f"Seed {len(ids)}"}
+            )
+            ids.append(response.json()["data"]["id"])
+
+        latencies = []
+        errors = 0
+        remaining = iter(range(requests))
+
+        async def worker(number: int) -> None:
+            nonlocal errors
+            rng = random.Random(number)
+            for _ in remaining:
+                began = time.perf_counter()
+                try:
+                    succeeded = await request(client, rng, ids)
+                except httpx.TransportError:
+                    succeeded = False
+                latencies.append(time.perf_counter() - began)
+                errors += not succeeded
+
+        began = time.perf_counter()
+        await asyncio.gather(*(worker(number) for number in range(concurrency)))
+        elapsed = time.perf_counter() - began
+    return requests / elapsed, latencies, errors
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Return a percentile of the values, in milliseconds."""
+    return statistics.quantiles(values, n=100)[int(fraction * 100) - 1] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Database to test against (default: DATABASE_URL, else a "
+             "temporary SQLite file)",
+    )
+    parser.add_argument("--paths", default="sync,async")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    temporary = None
+    database_url = args.database_url
+    if not database_url:
+        temporary = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{temporary.name}/load_test.db"
+
+    print(
+        f"Requests: {args.requests:,}, concurrent clients: {args.concurrency}, "
+        f"database: {database_url.split('://')[0]}\n"
+    )
+    print(
+        f"{'Path':>5}  {'Req/s':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}"
+        f"  {'Errors':>6}"
+    )
+    results = {}
+    pools = {}
+    try:
+        migrate(database_url)
+        for path in args.paths.split(","):
+            server = start_server(path, database_url, args.port)
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+
+                async def measure():
+                    async with httpx.AsyncClient(base_url=base_url) as client:
+                        await wait_until_up(client, server)
+                        measured = await run(
+                            base_url, args.requests, args.concurrency,
+                            seed_tasks=100,
+                        )
+                        pool = (await client.get("/api/v1/metrics/pool")).json()
+                    return measured, pool[path]
+
+                (throughput, latencies, errors), pools[path] = asyncio.run(
+                    measure()
+                )
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+            results[path] = throughput
+            print(
+                f"{path:>5}  {throughput:>8,.0f}  {percentile(latencies, 0.5):>8.1f}"
+                f"  {percentile(latencies, 0.95):>8.1f}"
+                f"  {percentile(latencies, 0.99):>8.1f}  {errors:>6}"
+            )
+    finally:
+        if temporary is not None:
+            temporary.cleanup()
+
+    print()
+    for path, pool in pools.items():
+        if pool and "checkouts" in pool:
+            print(
+                f"{path} pool: {pool['pool_size']} + {pool['max_overflow']} "
+                f"connections, {pool['checkouts']:,} checkouts, average wait "
+                f"{pool['wait_seconds_avg'] * 1000:.1f} ms, longest "
+                f"{pool['wait_seconds_max'] * 1000:.1f} ms, "
+                f"{pool['timeouts']} timeouts"
+            )
+
+    if "sync" in results and "async" in results:
+        print(f"\nAsync/sync throughput: {results['async'] / results['sync']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
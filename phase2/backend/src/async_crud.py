@@ -0,0 +1,105 @@
+"""
+Async CRUD operations for tasks.
+
+Each function runs its crud counterpart on the AsyncSession's underlying
+Session (AsyncSession.run_sync), so both paths send the same queries.
+Every database round-trip is still awaited on the event loop, through
+SQLAlchemy's greenlet bridge to the async driver, instead of holding a
+worker thread while it waits.
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import crud
+from .models import Task
+from .schemas import TaskCreate, TaskPatch, TaskUpdate
+
+
+async def create_task(session: AsyncSession, task_data: TaskCreate) -> Task:
+    """Create a new task; see crud.create_task."""
+    return await session.run_sync(crud.create_task, task_data)
+
+
+async def get_tasks(
+    session: AsyncSession,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    page: int = 1,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count_mode: Optional[str] = "exact",
+    search_mode: str = "contains"
+) -> tuple[list[Task], Optional[int], Optional[str]]:
+    """Get tasks with filtering, sorting, and pagination; see crud.get_tasks."""
+    return await session.run_sync(
+        crud.get_tasks, status, priority, category, search, sort, order,
+        page, limit, cursor, count_mode, search_mode
+    )
+
+
+async def get_task_by_id(session: AsyncSession, task_id: UUID) -> Optional[Task]:
+    """Get a single task by ID; see crud.get_task_by_id."""
+    return await session.get(Task, task_id)
+
+
+async def update_task(
+    session: AsyncSession, task_id: UUID, task_data: TaskUpdate
+) -> Optional[Task]:
+    """Update all fields of a task; see crud.update_task."""
+    return await session.run_sync(crud.update_task, task_id, task_data)
+
+
+async def patch_task(
+    session: AsyncSession, task_id: UUID, task_data: TaskPatch
+) -> Optional[Task]:
+    """Update specific fields of a task; see crud.patch_task."""
+    return await session.run_sync(crud.patch_task, task_id, task_data)
+
+
+async def delete_task(session: AsyncSession, task_id: UUID) -> bool:
+    """Delete a task by ID; see crud.delete_task."""
+    return await session.run_sync(crud.delete_task, task_id)
+
+
+async def mark_task_complete(session: AsyncSession, task_id: UUID) -> Optional[Task]:
+    """Mark a task as complete; see crud.mark_task_complete."""
+    return await session.run_sync(crud.mark_task_complete, task_id)
+
+
+async def mark_task_incomplete(
+    session: AsyncSession, task_id: UUID
+) -> Optional[Task]:
+    """Mark a task as incomplete; see crud.mark_task_incomplete."""
+    return await session.run_sync(crud.mark_task_incomplete, task_id)
+
+
+async def create_tasks(
+    session: AsyncSession, tasks_data: list[TaskCreate]
+) -> list[Task]:
+    """Create many tasks in one statement; see crud.create_tasks."""
+    return await session.run_sync(crud.create_tasks, tasks_data)
+
+
+async def patch_tasks(
+    session: AsyncSession, task_ids: list[UUID], task_data: TaskPatch
+) -> dict[UUID, Task]:
+    """Update many tasks in one statement; see crud.patch_tasks."""
+    return await session.run_sync(crud.patch_tasks, task_ids, task_data)
+
+
+async def mark_tasks_complete(
+    session: AsyncSession, task_ids: list[UUID]
+) -> dict[UUID, Task]:
+    """Complete many tasks in one statement; see crud.mark_tasks_complete."""
+    return await session.run_sync(crud.mark_tasks_complete, task_ids)
+
+
+async def delete_tasks(session: AsyncSession, task_ids: list[UUID]) -> set[UUID]:
+    """Delete many tasks in one statement; see crud.delete_tasks."""
+    return await session.run_sync(crud.delete_tasks, task_ids)
@@ -1,13 +1,23 @@
 """
 CRUD operations for tasks.
 """
-from sqlmodel import Session, select, or_, func, col
+from sqlmodel import Session, select, or_, and_, func, col
+from sqlalchemy import (
+    Float, cast, column, delete, false, insert, literal_column, table, text,
+    tuple_, update
+)
 from uuid import UUID
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime
+import base64
+import binascii
+import json
+import re
+import threading
+import time
 
 from .models import Task
-from .schemas import TaskCreate, TaskUpdate, TaskPatch
+from .schemas import PriorityEnum, TaskCreate, TaskUpdate, TaskPatch
 
 
 def create_task(session: Session, task_data: TaskCreate) -> Task:
@@ -24,10 +34,266 @@ def create_task(session: Session, task_data: TaskCreate) -> Task:
     task = Task(**task_data.model_dump())
     session.add(task)
     session.commit()
+    task_count_cache.adjust(1)
     session.refresh(task)
     return task
 
 
+# Columns each sort field orders by, before the id tie-breaker, where they
+# differ from the field itself: priorities by urgency, then by age
+SORT_COLUMNS = {"priority": ("priority_rank", "created_at")}
+# Sort columns that may hold NULL; NULLs sort after every other value
+NULLABLE_SORTS = {"due_date"}
+DATETIME_COLUMNS = {"created_at", "due_date"}
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to another sort."""
+    pass
+
+
+def encode_cursor(sort: str, order: str, values: list, task_id: UUID) -> str:
+    """
+    Encode the position after a task as an opaque cursor token.
+
+    Args:
+        sort: Sort field the cursor was issued for
+        order: Sort order the cursor was issued for
+        values: The task's values of the sort columns (see SORT_COLUMNS)
+        task_id: The task's UUID (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    values = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    payload = json.dumps(
+        {"s": sort, "o": order, "v": values, "id": str(task_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> tuple[list, UUID]:
+    """
+    Decode a cursor token into the (sort values, task ID) it points after.
+
+    Args:
+        cursor: Token from a previous response's next_cursor
+        sort: Sort field of the current request
+        order: Sort order of the current request
+
+    Returns:
+        Tuple of (sort column values, task UUID)
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for a
+            different sort field or order
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        cursor_sort, cursor_order = payload["s"], payload["o"]
+        values, task_id = payload["v"], UUID(payload["id"])
+        names = SORT_COLUMNS.get(sort, (sort,))
+        if not isinstance(values, list) or len(values) != len(names):
+            raise ValueError(values)
+        values = [
+            datetime.fromisoformat(value)
+            if value is not None and name in DATETIME_COLUMNS else value
+            for name, value in zip(names, values)
+        ]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise InvalidCursorError("Invalid cursor")
+    if (cursor_sort, cursor_order) != (sort, order):
+        raise InvalidCursorError("Cursor was issued for a different sort or order")
+    return values, task_id
+
+
+def _after_cursor(
+    sort: str, sort_columns: list, ascending: bool, values: list, task_id: UUID
+):
+    """
+    Build the WHERE clause selecting tasks after a cursor position.
+
+    Tasks are ordered by (sort columns..., id), with NULLs after every
+    other value (see _order_by), so the clause is a row comparison that an
+    index on (sort columns..., id) can serve.
+    """
+    key = tuple_(*sort_columns, Task.id)
+    position = tuple_(*values, task_id)
+    if sort not in NULLABLE_SORTS:
+        return key > position if ascending else key < position
+
+    # Nullable sorts order by a single column
+    sort_column, value = sort_columns[0], values[0]
+    if ascending:
+        if value is None:
+            # Only NULLs follow a NULL; they are ordered by id
+            return and_(sort_column.is_(None), Task.id > task_id)
+        return or_(key > position, sort_column.is_(None))
+
+    if value is None:
+        # The remaining NULLs, then every task with a value
+        return or_(
+            and_(sort_column.is_(None), Task.id < task_id),
+            sort_column.is_not(None)
+        )
+    # NULL row comparisons are never true: NULLs came first and are excluded
+    return key < position
+
+
+def _order_by(sort: str, sort_columns: list, ascending: bool) -> list:
+    """
+    Return the ORDER BY clauses for a sort field and direction.
+
+    NULLs sort after every other value, as in a Postgres btree index: last
+    in ascending order, first in descending order. Spelled out, since
+    SQLite sorts NULLs first; on Postgres the clauses match the index
+    order either way, so one index on (sort columns..., id), scanned
+    forward or backward, serves both directions.
+    """
+    clauses = []
+    for sort_column in sort_columns:
+        if ascending:
+            clause = sort_column.asc()
+            if sort in NULLABLE_SORTS:
+                clause = clause.nulls_last()
+        else:
+            clause = sort_column.desc()
+            if sort in NULLABLE_SORTS:
+                clause = clause.nulls_first()
+        clauses.append(clause)
+    clauses.append(Task.id.asc() if ascending else Task.id.desc())
+    return clauses
+
+
+class TaskCountCache:
+    """
+    Approximate number of rows in the tasks table, for unfiltered lists.
+
+    The count is read from table statistics (pg_class.reltuples on
+    Postgres; an exact COUNT(*) elsewhere or before the table was first
+    analyzed) at most once per ttl seconds, and adjusted in between as this
+    process creates and deletes tasks. Changes made by other processes show
+    up after the next refresh.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._count: Optional[int] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, session: Session) -> int:
+        """Return the cached count, refreshing it if it has expired."""
+        with self._lock:
+            if self._count is not None and time.monotonic() < self._expires:
+                return self._count
+        count = _estimate_row_count(session)
+        with self._lock:
+            self._count = count
+            self._expires = time.monotonic() + self.ttl
+        return count
+
+    def adjust(self, delta: int) -> None:
+        """Account for tasks created (delta > 0) or deleted (delta < 0)."""
+        with self._lock:
+            if self._count is not None:
+                self._count = max(0, self._count + delta)
+
+    def invalidate(self) -> None:
+        """
+        Force a refresh on the next get().
+
+        For tasks added or removed in this process other than through these
+        functions, e.g. by SQL run directly on the table.
+        """
+        with self._lock:
+            self._count = None
+
+
+def _estimate_row_count(session: Session) -> int:
+    """Return the planner's row estimate for tasks, or an exact count."""
+    if session.get_bind().dialect.name == "postgresql":
+        estimate = session.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = 'tasks'::regclass"
+            )
+        ).scalar()
+        # -1 (or NULL) until the table is first vacuumed or analyzed
+        if estimate is not None and estimate >= 0:
+            return estimate
+    return _count_tasks(session, [])
+
+
+def _count_tasks(session: Session, conditions: list) -> int:
+    """Count the tasks matching all conditions."""
+    count_query = select(func.count()).select_from(Task).where(*conditions)
+    return session.exec(count_query).one()
+
+
+task_count_cache = TaskCountCache()
+
+
+# Full-text search (search_mode="fulltext")
+#
+# Postgres matches against an expression GIN index on this document (see
+# alembic/versions/0003); the text must stay identical to the indexed
+# expression for the index to be used. The 'simple' configuration neither
+# stems nor drops stop words, so prefixes match the words as typed.
+# SQLite matches against the tasks_fts FTS5 table, kept in sync with
+# tasks by triggers.
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+tasks_fts = table("tasks_fts", column("task_id"))
+# bm25 weights for the tasks_fts columns (task_id, title, description),
+# in the same 2.5 : 1 ratio as Postgres' default weights for A and B
+FTS_WEIGHTS = (0.0, 2.5, 1.0)
+
+
+def _search_terms(search: str) -> list[str]:
+    """Split a search string into words, dropping query syntax."""
+    return re.findall(r"\w+", search)
+
+
+def _fulltext_search(session: Session, search: str) -> tuple[Any, Any, Any]:
+    """
+    Build the clauses for a ranked full-text search.
+
+    Every word of the search must match a word of the title or description,
+    as a prefix: "gro" matches "groceries".
+
+    Returns:
+        Tuple of (WHERE clause, relevance expression with larger values
+        for better matches, subquery to join for the relevance or None)
+    """
+    terms = _search_terms(search)
+    if not terms:
+        return false(), literal_column("0.0"), None
+
+    if session.get_bind().dialect.name == "postgresql":
+        document = literal_column(f"({SEARCH_DOCUMENT})")
+        query = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms))
+        # Double precision, so the value in a cursor compares exactly
+        relevance = cast(func.ts_rank(document, query), Float)
+        return document.op("@@")(query), relevance, None
+
+    fts = literal_column("tasks_fts")
+    match = fts.op("MATCH")(" ".join(f'"{t}"*' for t in terms))
+    # bm25() is lower for better matches
+    ranked = select(
+        tasks_fts.c.task_id, (-func.bm25(fts, *FTS_WEIGHTS)).label("relevance")
+    ).select_from(tasks_fts).where(match).subquery("search")
+    condition = Task.id.in_(select(tasks_fts.c.task_id).where(match))
+    return condition, ranked.c.relevance, ranked
+
+
 def get_tasks(
     session: Session,
     status: Optional[str] = None,
@@ -37,64 +303,147 @@ def get_tasks(
     sort: str = "created_at",
     order: str = "desc",
     page: int = 1,
-    limit: int = 20
-) -> tuple[list[Task], int]:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count_mode: Optional[str] = "exact",
+    search_mode: str = "contains"
+) -> tuple[list[Task], Optional[int], Optional[str]]:
     """
     Get tasks with filtering, sorting, and pagination.
 
+    Tasks are ordered by the sort field, then by id, so the order is stable
+    even when many tasks share a sort value; priorities sort by urgency
+    (priority_rank), then by creation time. With a cursor the page starts
+    right after the cursor position (keyset pagination) and page is ignored,
+    so deep pages cost the same as the first one.
+
+    search is matched according to search_mode:
+    - "contains": case-insensitive substring of the title or description
+      (ILIKE); scans every task
+    - "fulltext": every word is a prefix of a word in the title or
+      description, looked up in a full-text index (see _fulltext_search);
+      sort="relevance" then orders the best matches first (order="desc")
+
+    The total is computed according to count_mode:
+    - "exact": COUNT(*) OVER() in the page query itself, so the filters
+      (and any search scan) run once; a separate COUNT(*) is only needed
+      with a cursor or for a page past the end
+    - "estimate": for unfiltered lists, a cached count from table
+      statistics (see TaskCountCache); filtered lists are counted exactly
+    - None: no total
+
     Args:
         session: Database session
         status: Filter by status (complete/incomplete)
         priority: Filter by priority (high/medium/low)
         category: Filter by category
         search: Search in title and description
-        sort: Sort field
+        sort: Sort field ("relevance" needs a fulltext search)
         order: Sort order (asc/desc)
-        page: Page number
+        page: Page number (used when no cursor is given)
         limit: Items per page
+        cursor: Position to continue from, from a previous next_cursor
+        count_mode: "exact", "estimate" or None (see above)
+        search_mode: "contains" or "fulltext" (see above)
 
     Returns:
-        Tuple of (tasks list, total count)
+        Tuple of (tasks list, total count or None, next cursor or None on
+        the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match
+            the sort field and order
+        ValueError: If sort is "relevance" without a fulltext search
     """
-    query = select(Task)
+    fulltext = search is not None and search_mode == "fulltext"
+    if sort == "relevance" and not fulltext:
+        raise ValueError("sort=relevance needs search with search_mode=fulltext")
+    conditions = []
+    relevance, ranked = None, None
 
     # Apply filters
     if status is not None:
         status_bool = status == "complete"
-        query = query.where(Task.status == status_bool)
+        conditions.append(Task.status == status_bool)
 
     if priority is not None:
-        query = query.where(Task.priority == priority)
+        conditions.append(Task.priority_rank == PriorityEnum(priority).rank)
 
     if category is not None:
-        query = query.where(Task.category == category)
+        conditions.append(Task.category == category)
 
-    if search is not None:
+    if fulltext:
+        match, relevance, ranked = _fulltext_search(session, search)
+        conditions.append(match)
+    elif search is not None:
         search_pattern = f"%{search}%"
-        query = query.where(
+        conditions.append(
             or_(
                 Task.title.ilike(search_pattern),
                 Task.description.ilike(search_pattern)
             )
         )
 
-    # Count total before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_query).one()
-
-    # Apply sorting
-    sort_column = getattr(Task, sort)
-    if order == "desc":
-        query = query.order_by(sort_column.desc())
+    # Count in the page query unless a cheaper or no total was asked for;
+    # with a cursor the window would only count the rows after it
+    exact = count_mode == "exact" or (count_mode == "estimate" and bool(conditions))
+    window = exact and cursor is None
+    columns = [Task]
+    if sort == "relevance":
+        sort_columns = [relevance]
+        columns.append(relevance.label("relevance"))
+    else:
+        sort_columns = [
+            getattr(Task, name) for name in SORT_COLUMNS.get(sort, (sort,))
+        ]
+    if window:
+        columns.append(func.count().over().label("total"))
+    query = select(*columns)
+    if sort == "relevance" and ranked is not None:
+        # Joining the ranked matches also restricts the tasks to them
+        query = query.join(ranked, ranked.c.task_id == Task.id)
+        query = query.where(*(c for c in conditions if c is not match))
     else:
-        query = query.order_by(sort_column.asc())
+        query = query.where(*conditions)
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
+    # Apply sorting, with id as tie-breaker
+    ascending = order == "asc"
+    query = query.order_by(*_order_by(sort, sort_columns, ascending))
 
-    tasks = session.exec(query).all()
-    return tasks, total
+    # Apply pagination, fetching one extra row to know if another page follows
+    if cursor is not None:
+        values, task_id = decode_cursor(cursor, sort, order)
+        query = query.where(
+            _after_cursor(sort, sort_columns, ascending, values, task_id)
+        )
+    else:
+        query = query.offset((page - 1) * limit)
+    rows = session.exec(query.limit(limit + 1)).all()
+    tasks = [row[0] for row in rows] if len(columns) > 1 else list(rows)
+
+    if count_mode is None:
+        total = None
+    elif not exact:
+        total = task_count_cache.get(session)
+    elif window and rows:
+        total = rows[0][-1]
+    elif window and page == 1:
+        total = 0
+    else:
+        total = _count_tasks(session, conditions)
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        if sort == "relevance":
+            values = [rows[limit - 1][1]]
+        else:
+            values = [
+                getattr(last, name) for name in SORT_COLUMNS.get(sort, (sort,))
+            ]
+        next_cursor = encode_cursor(sort, order, values, last.id)
+    return tasks, total, next_cursor
 
 
 def get_task_by_id(session: Session, task_id: UUID) -> Optional[Task]:
@@ -181,6 +530,7 @@ def delete_task(session: Session, task_id: UUID) -> bool:
 
     session.delete(task)
     session.commit()
+    task_count_cache.adjust(-1)
     return True
 
 
@@ -228,3 +578,93 @@ def mark_task_incomplete(session: Session, task_id: UUID) -> Optional[Task]:
     session.commit()
     session.refresh(task)
     return task
+
+
+# Bulk operations: one multi-row statement and one commit per batch. ORM
+# events do not fire for these statements, so they set priority_rank and
+# updated_at themselves.
+
+
+def create_tasks(session: Session, tasks_data: list[TaskCreate]) -> list[Task]:
+    """
+    Create many tasks with one multi-row INSERT, in one transaction.
+
+    Args:
+        session: Database session
+        tasks_data: Task creation data, one per task
+
+    Returns:
+        Created tasks, in the order given
+    """
+    tasks = [
+        Task(**data.model_dump(), priority_rank=data.priority.rank)
+        for data in tasks_data
+    ]
+    if tasks:
+        session.exec(insert(Task), params=[task.model_dump() for task in tasks])
+        session.commit()
+        task_count_cache.adjust(len(tasks))
+    return tasks
+
+
+def patch_tasks(
+    session: Session, task_ids: list[UUID], task_data: TaskPatch
+) -> dict[UUID, Task]:
+    """
+    Apply the same partial update to many tasks with one UPDATE statement.
+
+    Args:
+        session: Database session
+        task_ids: UUIDs of the tasks to update
+        task_data: Partial task data
+
+    Returns:
+        Updated tasks by ID; IDs that were not found are missing
+    """
+    values = task_data.model_dump(exclude_unset=True)
+    if values.get("priority") is not None:
+        priority = PriorityEnum(values["priority"])
+        values.update(priority=priority.value, priority_rank=priority.rank)
+    values["updated_at"] = datetime.utcnow()
+
+    rows = session.exec(
+        update(Task)
+        .where(col(Task.id).in_(set(task_ids)))
+        .values(**values)
+        .returning(*Task.__table__.columns)
+    ).all()
+    session.commit()
+    return {row.id: Task(**row._mapping) for row in rows}
+
+
+def mark_tasks_complete(session: Session, task_ids: list[UUID]) -> dict[UUID, Task]:
+    """
+    Mark many tasks as complete with one UPDATE statement.
+
+    Args:
+        session: Database session
+        task_ids: UUIDs of the tasks to complete
+
+    Returns:
+        Updated tasks by ID; IDs that were not found are missing
+    """
+    return patch_tasks(session, task_ids, TaskPatch(status=True))
+
+
+def delete_tasks(session: Session, task_ids: list[UUID]) -> set[UUID]:
+    """
+    Delete many tasks with one DELETE statement.
+
+    Args:
+        session: Database session
+        task_ids: UUIDs of the tasks to delete
+
+    Returns:
+        IDs of the deleted tasks; IDs that were not found are missing
+    """
+    deleted = set(session.exec(
+        delete(Task).where(col(Task.id).in_(set(task_ids))).returning(Task.id)
+    ).scalars())
+    session.commit()
+    task_count_cache.adjust(-len(deleted))
+    return deleted
@@ -2,10 +2,17 @@
 Database connection and session management.
 """
 from sqlmodel import create_engine, Session, SQLModel
-from typing import Generator
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from typing import AsyncGenerator, Generator, Optional
+from pathlib import Path
 import os
 from dotenv import load_dotenv
 
+from .pool import MeteredAsyncPool, MeteredQueuePool, pool_status
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -13,19 +20,134 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-# Create engine with connection pooling
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,  # Set to False in production
-    pool_pre_ping=True,  # Verify connections before using
-)
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    """Read a true/false setting from the environment."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _env_number(name: str, default: float, kind: type = int):
+    """Read a numeric setting from the environment."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return kind(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+# Serve the API from async routes on an async engine (asyncpg for
+# Postgres, aiosqlite for SQLite) instead of sync routes run in the
+# threadpool; see main.py
+DATABASE_ASYNC = _env_flag("DATABASE_ASYNC")
+
+# Run the Alembic migrations when the app starts. Off by default: run
+# `alembic upgrade head` as a deploy step instead, once per release rather
+# than in every worker process and cold start
+DATABASE_AUTO_MIGRATE = _env_flag("DATABASE_AUTO_MIGRATE")
+
+# Log every SQL statement; for debugging only
+DATABASE_ECHO = _env_flag("DATABASE_ECHO")
+
+# Connection pool, per engine and per process. The defaults suit one API
+# process on a hosted Postgres such as Neon: up to 20 connections, a
+# request waits at most 10 s for one rather than piling up, and
+# connections are replaced after 5 minutes, before the server drops them
+# as idle. Size the pool from GET /api/v1/metrics/pool.
+DATABASE_POOL_SIZE = _env_number("DATABASE_POOL_SIZE", 10)
+DATABASE_MAX_OVERFLOW = _env_number("DATABASE_MAX_OVERFLOW", 10)
+DATABASE_POOL_TIMEOUT = _env_number("DATABASE_POOL_TIMEOUT", 10.0, float)
+DATABASE_POOL_RECYCLE = _env_number("DATABASE_POOL_RECYCLE", 300)
+
+
+def engine_options(url: str) -> dict:
+    """
+    Return the create_engine options for a database URL.
+
+    Databases pooled with a QueuePool (Postgres, SQLite files) get a
+    metered pool configured by the DATABASE_POOL_* settings; others, such
+    as in-memory SQLite, keep the dialect's own pool.
+
+    Args:
+        url: Database URL, for the sync or the async driver
+
+    Returns:
+        Keyword arguments for create_engine or create_async_engine
+    """
+    url = make_url(url)
+    options = {"echo": DATABASE_ECHO, "pool_pre_ping": True}
+    pool_class = url.get_dialect().get_pool_class(url)
+    if issubclass(pool_class, QueuePool):
+        options.update(
+            poolclass=(
+                MeteredAsyncPool
+                if issubclass(pool_class, AsyncAdaptedQueuePool)
+                else MeteredQueuePool
+            ),
+            pool_size=DATABASE_POOL_SIZE,
+            max_overflow=DATABASE_MAX_OVERFLOW,
+            pool_timeout=DATABASE_POOL_TIMEOUT,
+            pool_recycle=DATABASE_POOL_RECYCLE,
+        )
+    return options
+
+
+def make_engine(url: str) -> Engine:
+    """
+    Create an engine configured from the environment.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Engine: SQLAlchemy engine with a pool as in engine_options()
+    """
+    return create_engine(url, **engine_options(url))
+
+
+engine = make_engine(DATABASE_URL)
+
+
+# Directory holding alembic.ini and the alembic/ migration scripts
+BACKEND_DIR = Path(__file__).resolve().parent.parent
 
 
 def create_db_and_tables():
-    """Create database tables on startup."""
+    """
+    Create missing tables straight from the models, without migrations.
+
+    Only for throwaway databases; use run_migrations() for anything that
+    is kept, or later migrations will not apply cleanly.
+    """
     SQLModel.metadata.create_all(engine)
 
 
+def run_migrations(revision: str = "head"):
+    """
+    Upgrade the database schema with the Alembic migrations.
+
+    Same as running `alembic upgrade head` in the backend directory. Each
+    migration is applied once; an up-to-date database is left unchanged.
+    On Postgres concurrent runs wait for each other (see alembic/env.py).
+
+    Args:
+        revision: Target revision (default: the latest)
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    # No ini file: keep the application's logging configuration
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    with engine.connect() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     Dependency for database sessions.
@@ -35,3 +157,83 @@ def get_session() -> Generator[Session, None, None]:
     """
     with Session(engine) as session:
         yield session
+
+
+def async_database_url(url: str) -> str:
+    """
+    Return the URL of a database for its async driver.
+
+    postgresql:// becomes postgresql+asyncpg://, with libpq's sslmode
+    passed on as asyncpg's ssl and other libpq-only options dropped;
+    sqlite:// becomes sqlite+aiosqlite://. Other URLs are returned as is.
+
+    Args:
+        url: Database URL, as in DATABASE_URL
+
+    Returns:
+        URL string including the password
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        if sslmode is not None:
+            query["ssl"] = sslmode
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+_async_engine: Optional[AsyncEngine] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the async engine, creating it on first use.
+
+    Created lazily so that the async driver is only needed with
+    DATABASE_ASYNC; it is configured like the sync engine.
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = async_database_url(DATABASE_URL)
+        _async_engine = create_async_engine(url, **engine_options(url))
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """Close the async engine's connections, if it was ever created."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+def pool_metrics() -> dict:
+    """
+    Describe the connection pools of the engines in use.
+
+    Returns:
+        Dict with pool_status() of the sync engine and, once created, of
+        the async engine (else None)
+    """
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(_async_engine.pool) if _async_engine else None,
+    }
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for async database sessions.
+
+    Objects stay loaded after commit, so that responses can be built from
+    them without another (implicit, and in async code impossible) query.
+
+    Yields:
+        AsyncSession: SQLModel async database session
+    """
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
@@ -3,21 +3,45 @@ FastAPI main application.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from datetime import datetime
 import os
 from dotenv import load_dotenv
 
-from .database import create_db_and_tables
-from .routers import tasks
+from .database import (
+    DATABASE_ASYNC,
+    DATABASE_AUTO_MIGRATE,
+    dispose_async_engine,
+    pool_metrics,
+    run_migrations,
+)
+from .routers import async_tasks, tasks
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start up and shut down the application.
+
+    The schema is migrated by `alembic upgrade head` at deploy time; only
+    with DATABASE_AUTO_MIGRATE does startup run the migrations itself.
+    """
+    if DATABASE_AUTO_MIGRATE:
+        run_migrations()
+    yield
+    # Close the async engine's connections
+    await dispose_async_engine()
+
+
 app = FastAPI(
     title="Todo API",
     description="RESTful API for Todo Web Application - Phase II",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -31,14 +55,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(tasks.router)
-
-
-@app.on_event("startup")
-def on_startup():
-    """Create database tables on startup."""
-    create_db_and_tables()
+# Include routers: the same endpoints on the async or the sync engine
+app.include_router(async_tasks.router if DATABASE_ASYNC else tasks.router)
 
 
 @app.get("/api/v1/health")
@@ -51,6 +69,20 @@ def health_check():
     }
 
 
+@app.get("/api/v1/metrics/pool")
+def pool_metrics_endpoint():
+    """
+    Connection pool statistics, for sizing the pool (DATABASE_POOL_*).
+
+    Counters accumulate from process start; each worker process has its
+    own pools.
+    """
+    return {
+        **pool_metrics(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
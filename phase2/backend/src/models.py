@@ -2,10 +2,13 @@
 SQLModel database models.
 """
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, event
 from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
+from .schemas import PRIORITY_RANKS
+
 
 class Task(SQLModel, table=True):
     """
@@ -17,18 +20,42 @@ class Task(SQLModel, table=True):
         description: Detailed description (optional)
         status: Completion status (False = incomplete, True = complete)
         priority: Priority level (high, medium, low)
+        priority_rank: Ordinal of priority for sorting and filtering (see
+            PriorityEnum.rank), set from priority whenever a task is saved
         category: Category/tag (optional, max 50 chars)
         due_date: Due date (optional)
         created_at: Creation timestamp
         updated_at: Last update timestamp
     """
     __tablename__ = "tasks"
+    # Match the filter and sort combinations of GET /api/v1/tasks (see
+    # crud.get_tasks); id is the tie-breaker of every sort and cursor.
+    # Changes here need a migration in alembic/versions.
+    __table_args__ = (
+        # One per sort field: ordered scans for any filter combination
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+        Index("ix_tasks_title_id", "title", "id"),
+        # sort=priority orders by (priority_rank, created_at); this also
+        # serves priority filters at the default sort
+        Index(
+            "ix_tasks_priority_rank_created_at_id",
+            "priority_rank", "created_at", "id"
+        ),
+        # Filtered views at their usual sort
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_status_due_date_id", "status", "due_date", "id"),
+        Index("ix_tasks_category_created_at_id", "category", "created_at", "id"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     title: str = Field(max_length=200)
     description: Optional[str] = Field(default=None)
     status: bool = Field(default=False)
     priority: str = Field(default="medium", max_length=10)
+    # NULL only for rows written before the column existed, until the
+    # backfill migration has run
+    priority_rank: Optional[int] = Field(default=None)
     category: Optional[str] = Field(default=None, max_length=50)
     due_date: Optional[datetime] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -44,3 +71,15 @@ class Task(SQLModel, table=True):
                 "due_date": "2026-01-25T10:00:00Z"
             }
         }
+
+
+@event.listens_for(Task, "before_insert")
+@event.listens_for(Task, "before_update")
+def sync_priority_rank(mapper, connection, task: Task) -> None:
+    """
+    Keep priority_rank in step with priority on every ORM write.
+
+    Priorities outside high/medium/low, from before the API validated them,
+    rank as medium, as in the backfill migration.
+    """
+    task.priority_rank = PRIORITY_RANKS.get(task.priority, PRIORITY_RANKS["medium"])
@@ -0,0 +1,118 @@
+"""
+Connection pools that keep statistics, for sizing the pool.
+"""
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Counters of connection checkouts from one pool.
+
+    Attributes:
+        checkouts: Connections handed out
+        timeouts: Checkouts that gave up after the pool timeout
+        waiting: Checkouts in progress right now
+        wait_seconds: Total time spent getting connections
+        max_wait_seconds: Longest time spent getting one connection
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def started(self):
+        """Record that a checkout started."""
+        with self._lock:
+            self.waiting += 1
+
+    def finished(self, seconds: float, timed_out: bool = False):
+        """Record a checkout that took the given time."""
+        with self._lock:
+            self.waiting -= 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+
+class _MeteredPool:
+    """Mixin timing every checkout of a QueuePool into its PoolMetrics."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        self.metrics.started()
+        began = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.finished(time.perf_counter() - began, timed_out)
+
+    def recreate(self):
+        # engine.dispose() replaces the pool; keep counting where it left off
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    """QueuePool with checkout statistics in .metrics."""
+
+
+class MeteredAsyncPool(_MeteredPool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout statistics in .metrics."""
+
+
+def pool_status(pool: Pool) -> dict:
+    """
+    Describe a pool's connections and, if metered, its checkouts.
+
+    Args:
+        pool: Pool of an engine (engine.pool)
+
+    Returns:
+        Dict with the pool class and, for a QueuePool, its size, limits and
+        open connections; for a metered pool, its checkout statistics
+    """
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            pool_size=pool.size(),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # overflow() counts down from -pool_size until the pool is full
+            overflow=max(pool.overflow(), 0),
+        )
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is not None:
+        with metrics._lock:
+            attempts = metrics.checkouts + metrics.timeouts
+            status.update(
+                checkouts=metrics.checkouts,
+                timeouts=metrics.timeouts,
+                waiting=metrics.waiting,
+                wait_seconds_total=round(metrics.wait_seconds, 6),
+                wait_seconds_avg=round(metrics.wait_seconds / attempts, 6)
+                if attempts else 0.0,
+                wait_seconds_max=round(metrics.max_wait_seconds, 6),
+            )
+    return status
@@ -0,0 +1,222 @@
+"""
+Task API endpoints on the async engine (DATABASE_ASYNC).
+
+Same paths, parameters and responses as routers/tasks.py, served by
+coroutines: a request waiting on the database holds no worker thread.
+"""
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .. import async_crud
+from ..database import get_async_session
+from ..schemas import (
+    TaskBatchCreate,
+    TaskBatchIds,
+    TaskBatchPatch,
+    TaskBatchResponse,
+    TaskCreate,
+    TaskListResponse,
+    TaskPatch,
+    TaskSingleResponse,
+    TaskUpdate,
+)
+from .tasks import (
+    batch_create_response,
+    batch_response,
+    list_query,
+    list_response,
+    validate_batch,
+)
+
+router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
+
+
+@router.post("", response_model=TaskSingleResponse, status_code=201)
+async def create_task(
+    task_data: TaskCreate,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Create a new task."""
+    task = await async_crud.create_task(session, task_data)
+    return {
+        "data": task,
+        "message": "Task created successfully"
+    }
+
+
+@router.get("", response_model=TaskListResponse)
+async def list_tasks(
+    query: dict = Depends(list_query),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """
+    List tasks with filtering, sorting, and pagination.
+
+    See routers/tasks.py for the parameters.
+    """
+    try:
+        tasks, total, next_cursor = await async_crud.get_tasks(session, **query)
+    except ValueError as e:
+        # Invalid cursor, or sort=relevance without a fulltext search
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return list_response(tasks, total, next_cursor, query)
+
+
+@router.post(":batch", response_model=TaskBatchResponse)
+async def create_tasks(
+    batch: TaskBatchCreate,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Create up to 1000 tasks in one request and one transaction."""
+    valid, errors = validate_batch(batch)
+    tasks = await async_crud.create_tasks(session, valid)
+    return batch_create_response(tasks, errors)
+
+
+@router.patch(":batch", response_model=TaskBatchResponse)
+async def patch_tasks(
+    batch: TaskBatchPatch,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Apply the same changes to up to 1000 tasks in one statement."""
+    tasks = await async_crud.patch_tasks(session, batch.ids, batch.changes)
+    return batch_response(batch.ids, tasks, "updated")
+
+
+@router.patch(":complete", response_model=TaskBatchResponse)
+async def complete_tasks(
+    batch: TaskBatchIds,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Mark up to 1000 tasks as complete in one statement."""
+    tasks = await async_crud.mark_tasks_complete(session, batch.ids)
+    return batch_response(batch.ids, tasks, "marked as complete")
+
+
+@router.delete(":batch", response_model=TaskBatchResponse)
+async def delete_tasks(
+    batch: TaskBatchIds,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Delete up to 1000 tasks in one statement."""
+    deleted = await async_crud.delete_tasks(session, batch.ids)
+    return batch_response(batch.ids, deleted, "deleted")
+
+
+@router.get("/{task_id}", response_model=TaskSingleResponse)
+async def get_task(
+    task_id: UUID,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Get a single task by ID."""
+    task = await async_crud.get_task_by_id(session, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": task,
+        "message": "Task retrieved successfully"
+    }
+
+
+@router.put("/{task_id}", response_model=TaskSingleResponse)
+async def update_task(
+    task_id: UUID,
+    task_data: TaskUpdate,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Update all fields of a task."""
+    task = await async_crud.update_task(session, task_id, task_data)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": task,
+        "message": "Task updated successfully"
+    }
+
+
+@router.patch("/{task_id}", response_model=TaskSingleResponse)
+async def patch_task(
+    task_id: UUID,
+    task_data: TaskPatch,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Update specific fields of a task."""
+    task = await async_crud.patch_task(session, task_id, task_data)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": task,
+        "message": "Task updated successfully"
+    }
+
+
+@router.delete("/{task_id}")
+async def delete_task(
+    task_id: UUID,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Delete a task."""
+    success = await async_crud.delete_task(session, task_id)
+    if not success:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": None,
+        "message": "Task deleted successfully"
+    }
+
+
+@router.patch("/{task_id}/complete", response_model=TaskSingleResponse)
+async def mark_complete(
+    task_id: UUID,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Mark a task as complete."""
+    task = await async_crud.mark_task_complete(session, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": task,
+        "message": "Task marked as complete"
+    }
+
+
+@router.patch("/{task_id}/incomplete", response_model=TaskSingleResponse)
+async def mark_incomplete(
+    task_id: UUID,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """Mark a task as incomplete."""
+    task = await async_crud.mark_task_incomplete(session, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail="Task not found"
+        )
+
+    return {
+        "data": task,
+        "message": "Task marked as incomplete"
+    }
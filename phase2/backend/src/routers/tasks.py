@@ -2,15 +2,17 @@
 Task API endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import ValidationError
 from sqlmodel import Session
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Union
 
 from .. import crud
 from ..database import get_session
 from ..schemas import (
     TaskCreate, TaskUpdate, TaskPatch,
-    TaskResponse, TaskListResponse, TaskSingleResponse
+    TaskBatchCreate, TaskBatchIds, TaskBatchPatch,
+    TaskResponse, TaskListResponse, TaskSingleResponse, TaskBatchResponse
 )
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
@@ -29,38 +31,218 @@ def create_task(
     }
 
 
-@router.get("", response_model=TaskListResponse)
-def list_tasks(
-    status: Optional[str] = Query(None, regex="^(complete|incomplete)$"),
-    priority: Optional[str] = Query(None, regex="^(high|medium|low)$"),
+async def list_query(
+    status: Optional[str] = Query(None, pattern="^(complete|incomplete)$"),
+    priority: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
     category: Optional[str] = None,
     search: Optional[str] = None,
-    sort: str = Query("created_at", regex="^(due_date|priority|created_at|title)$"),
-    order: str = Query("desc", regex="^(asc|desc)$"),
+    search_mode: str = Query("contains", pattern="^(contains|fulltext)$"),
+    sort: str = Query(
+        "created_at", pattern="^(due_date|priority|created_at|title|relevance)$"
+    ),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    session: Session = Depends(get_session)
-):
-    """List tasks with filtering, sorting, and pagination."""
-    tasks, total = crud.get_tasks(
-        session, status, priority, category, search,
-        sort, order, page, limit
-    )
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    count: str = Query("exact", pattern="^(exact|estimate)$"),
+) -> dict:
+    """
+    Query parameters of GET /api/v1/tasks, shared with the async routes.
 
-    pages = (total + limit - 1) // limit
+    A coroutine, so that the async routes resolve it without a thread.
+
+    Returns:
+        Keyword arguments for crud.get_tasks, besides the session
+    """
+    return {
+        "status": status,
+        "priority": priority,
+        "category": category,
+        "search": search,
+        "sort": sort,
+        "order": order,
+        "page": page,
+        "limit": limit,
+        "cursor": cursor,
+        "count_mode": count if include_total else None,
+        "search_mode": search_mode,
+    }
+
+
+def list_response(
+    tasks: list, total: Optional[int], next_cursor: Optional[str], query: dict
+) -> dict:
+    """Build the GET /api/v1/tasks response body from crud.get_tasks results."""
+    limit = query["limit"]
+    pages = (total + limit - 1) // limit if total is not None else None
 
     return {
         "data": tasks,
         "message": "Tasks retrieved successfully",
         "pagination": {
-            "page": page,
+            "page": query["page"],
             "limit": limit,
             "total": total,
-            "pages": pages
+            "pages": pages,
+            "next_cursor": next_cursor
         }
     }
 
 
+@router.get("", response_model=TaskListResponse)
+def list_tasks(
+    query: dict = Depends(list_query),
+    session: Session = Depends(get_session)
+):
+    """
+    List tasks with filtering, sorting, and pagination.
+
+    Pass the previous response's pagination.next_cursor as cursor to get
+    the next page at constant cost however deep it is; page is then ignored.
+    With include_total=false, pagination.total and pages are null and no
+    counting is done; count=estimate returns a cached approximate total for
+    unfiltered lists.
+
+    With search_mode=fulltext, search looks up every word as a prefix in a
+    full-text index instead of scanning for the substring, and
+    sort=relevance lists the best matches first.
+    """
+    try:
+        tasks, total, next_cursor = crud.get_tasks(session, **query)
+    except ValueError as e:
+        # Invalid cursor, or sort=relevance without a fulltext search
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return list_response(tasks, total, next_cursor, query)
+
+
+def validate_batch(batch: TaskBatchCreate) -> tuple[list[TaskCreate], list]:
+    """
+    Validate the items of a bulk create request one by one.
+
+    Returns:
+        Tuple of (valid items as TaskCreate, one entry per item: its error
+        result if invalid, else None); shared with the async routes
+    """
+    valid, errors = [], []
+    for index, item in enumerate(batch.items):
+        try:
+            valid.append(TaskCreate.model_validate(item))
+            errors.append(None)
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "status_code": 422,
+                "errors": [
+                    {
+                        "field": ".".join(str(part) for part in error["loc"]),
+                        "message": error["msg"]
+                    }
+                    for error in e.errors()
+                ]
+            })
+    return valid, errors
+
+
+def batch_create_response(tasks: list, errors: list) -> dict:
+    """Build the bulk create response body from the created tasks."""
+    created = iter(tasks)
+    results = []
+    for index, error in enumerate(errors):
+        if error:
+            results.append(error)
+        else:
+            task = next(created)
+            results.append(
+                {"index": index, "status_code": 201, "id": task.id, "data": task}
+            )
+    return {
+        "data": results,
+        "message": f"{len(tasks)} of {len(errors)} tasks created"
+    }
+
+
+def batch_response(
+    task_ids: list[UUID], found: Union[dict, set], action: str
+) -> dict:
+    """
+    Build a bulk update or delete response body.
+
+    Args:
+        task_ids: IDs in request order
+        found: Updated tasks by ID, or the set of deleted IDs
+        action: Past participle for the message, e.g. "deleted"
+    """
+    results = [
+        {
+            "index": index,
+            "status_code": 200,
+            "id": task_id,
+            "data": found[task_id] if isinstance(found, dict) else None
+        }
+        if task_id in found
+        else {
+            "index": index,
+            "status_code": 404,
+            "id": task_id,
+            "errors": [{"field": "id", "message": "Task not found"}]
+        }
+        for index, task_id in enumerate(task_ids)
+    ]
+    succeeded = sum(result["status_code"] == 200 for result in results)
+    return {
+        "data": results,
+        "message": f"{succeeded} of {len(task_ids)} tasks {action}"
+    }
+
+
+@router.post(":batch", response_model=TaskBatchResponse)
+def create_tasks(
+    batch: TaskBatchCreate,
+    session: Session = Depends(get_session)
+):
+    """
+    Create up to 1000 tasks in one request and one transaction.
+
+    Invalid items are reported with status_code 422 and their errors; the
+    valid ones are created (status_code 201).
+    """
+    valid, errors = validate_batch(batch)
+    tasks = crud.create_tasks(session, valid)
+    return batch_create_response(tasks, errors)
+
+
+@router.patch(":batch", response_model=TaskBatchResponse)
+def patch_tasks(
+    batch: TaskBatchPatch,
+    session: Session = Depends(get_session)
+):
+    """Apply the same changes to up to 1000 tasks in one statement."""
+    tasks = crud.patch_tasks(session, batch.ids, batch.changes)
+    return batch_response(batch.ids, tasks, "updated")
+
+
+@router.patch(":complete", response_model=TaskBatchResponse)
+def complete_tasks(
+    batch: TaskBatchIds,
+    session: Session = Depends(get_session)
+):
+    """Mark up to 1000 tasks as complete in one statement."""
+    tasks = crud.mark_tasks_complete(session, batch.ids)
+    return batch_response(batch.ids, tasks, "marked as complete")
+
+
+@router.delete(":batch", response_model=TaskBatchResponse)
+def delete_tasks(
+    batch: TaskBatchIds,
+    session: Session = Depends(get_session)
+):
+    """Delete up to 1000 tasks in one statement."""
+    deleted = crud.delete_tasks(session, batch.ids)
+    return batch_response(batch.ids, deleted, "deleted")
+
+
 @router.get("/{task_id}", response_model=TaskSingleResponse)
 def get_task(
     task_id: UUID,
@@ -3,7 +3,7 @@ Pydantic schemas for request/response validation.
 """
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 from enum import Enum
 
@@ -14,6 +14,16 @@ class PriorityEnum(str, Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+    @property
+    def rank(self) -> int:
+        """Ordinal of the priority, higher for more urgent (Task.priority_rank)."""
+        return PRIORITY_RANKS[self.value]
+
+
+# Stored in tasks.priority_rank; the backfill migration (alembic/versions/
+# 0005) has its own copy of these values
+PRIORITY_RANKS = {"low": 1, "medium": 2, "high": 3}
+
 
 class TaskCreate(BaseModel):
     """Schema for creating a new task."""
@@ -99,8 +109,9 @@ class PaginationInfo(BaseModel):
     """Pagination metadata."""
     page: int
     limit: int
-    total: int
-    pages: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class TaskListResponse(BaseModel):
@@ -126,3 +137,54 @@ class ErrorResponse(BaseModel):
     """Schema for error response."""
     detail: str
     errors: list[ErrorField] = []
+
+
+# Most tasks one bulk request may create, update or delete
+BATCH_LIMIT = 1000
+
+
+class TaskBatchCreate(BaseModel):
+    """
+    Schema for creating tasks in bulk (POST /api/v1/tasks:batch).
+
+    Each item is validated as a TaskCreate on its own, so that invalid
+    items are reported in the results while the others are created.
+    """
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=BATCH_LIMIT)
+
+
+class TaskBatchIds(BaseModel):
+    """Schema for completing or deleting tasks in bulk."""
+    ids: list[UUID] = Field(..., min_length=1, max_length=BATCH_LIMIT)
+
+
+class TaskBatchPatch(TaskBatchIds):
+    """Schema for applying one partial update to tasks in bulk."""
+    changes: TaskPatch
+
+    @field_validator('changes')
+    @classmethod
+    def required_fields_not_null(cls, v: TaskPatch) -> TaskPatch:
+        """Validate that title, status and priority are not set to null."""
+        nulled = [
+            field for field in ('title', 'status', 'priority')
+            if field in v.model_fields_set and getattr(v, field) is None
+        ]
+        if nulled:
+            raise ValueError(f"{', '.join(nulled)} cannot be null")
+        return v
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one item of a bulk request, with an HTTP-style status."""
+    index: int
+    status_code: int
+    id: Optional[UUID] = None
+    data: Optional[TaskResponse] = None
+    errors: list[ErrorField] = []
+
+
+class TaskBatchResponse(BaseModel):
+    """Schema for bulk response: one result per item, in request order."""
+    data: list[BatchItemResult]
+    message: str
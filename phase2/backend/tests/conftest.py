@@ -0,0 +1,63 @@
+"""
+Shared fixtures for the backend tests.
+
+Tests run against TEST_DATABASE_URL if it is set, otherwise against a
+fresh SQLite database, never against the DATABASE_URL of .env.
+"""
+import os
+import tempfile
+
+import pytest
+
+_tmpdir = tempfile.TemporaryDirectory(prefix="todo-tests-")
+os.environ["DATABASE_URL"] = (
+    os.getenv("TEST_DATABASE_URL") or f"sqlite:///{_tmpdir.name}/tasks.db"
+)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Database engine with the schema migrated to the latest revision."""
+    from src import database
+
+    database.run_migrations()
+    yield database.engine
+    database.engine.dispose()
+
+
+@pytest.fixture
+def migrate():
+    """Function upgrading or downgrading any engine's schema to a revision."""
+    from alembic import command
+    from alembic.config import Config
+
+    from src.database import BACKEND_DIR
+
+    def migrate(engine, revision="head"):
+        config = Config()
+        config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+        with engine.connect() as connection:
+            config.attributes["connection"] = connection
+            if revision == "base" or revision.startswith("-"):
+                command.downgrade(config, revision)
+            else:
+                command.upgrade(config, revision)
+
+    return migrate
+
+
+@pytest.fixture
+def session(engine):
+    """Database session; tasks added during the test are deleted after it."""
+    from sqlmodel import Session, delete
+
+    from src.crud import task_count_cache
+    from src.models import Task
+
+    with Session(engine) as session:
+        yield session
+        session.rollback()
+        session.exec(delete(Task))
+        session.commit()
+    # The tasks were deleted behind the cached estimate's back
+    task_count_cache.invalidate()
@@ -0,0 +1,146 @@
+"""
+Tests for the bulk endpoints (/api/v1/tasks:batch and :complete).
+"""
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src import crud
+from src.models import Task
+from src.routers import async_tasks, tasks
+from src.schemas import TaskCreate
+
+from .test_async import client_for
+
+
+@contextmanager
+def statements(engine):
+    """Collect the first word of every statement sent to the database."""
+    sent = []
+
+    def record(connection, cursor, statement, *args):
+        sent.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield sent
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_batch_create(engine, session):
+    """Test that valid items are inserted together and invalid ones reported."""
+    items = [
+        {"title": f"Task {number}", "priority": ["low", "high"][number % 2]}
+        for number in range(50)
+    ]
+    items[3] = {"title": "   "}
+    items[7] = {"title": "Bad priority", "priority": "urgent"}
+
+    with client_for(tasks.router) as client, statements(engine) as sent:
+        response = client.post("/api/v1/tasks:batch", json={"items": items})
+    assert response.status_code == 200
+    assert sent.count("INSERT") == 1
+    body = response.json()
+    assert body["message"] == "48 of 50 tasks created"
+
+    results = body["data"]
+    assert [result["index"] for result in results] == list(range(50))
+    assert results[3]["status_code"] == 422
+    assert results[3]["errors"][0]["field"] == "title"
+    assert results[7]["errors"][0]["field"] == "priority"
+    assert results[8]["status_code"] == 201
+    assert results[8]["data"]["title"] == "Task 8"
+
+    # Stored as the ORM would: rank set, and found by the search index
+    high, _, _ = crud.get_tasks(session, priority="high", limit=100)
+    assert len(high) == 23
+    assert all(task.priority_rank == 3 for task in high)
+    found, _, _ = crud.get_tasks(session, search="task 12", search_mode="fulltext")
+    assert [task.title for task in found] == ["Task 12"]
+
+    with client_for(tasks.router) as client:
+        assert client.post(
+            "/api/v1/tasks:batch", json={"items": [{}] * 1001}
+        ).status_code == 422
+
+
+def test_batch_update_complete_delete(engine, session):
+    """Test the bulk updates and delete, with missing and repeated IDs."""
+    with client_for(tasks.router) as client:
+        created = client.post("/api/v1/tasks:batch", json={
+            "items": [{"title": f"Task {number}"} for number in range(5)]
+        }).json()["data"]
+        ids = [result["id"] for result in created]
+        missing = str(uuid4())
+
+        with statements(engine) as sent:
+            response = client.patch("/api/v1/tasks:batch", json={
+                "ids": ids[:3] + [missing],
+                "changes": {"priority": "high", "category": "work"},
+            })
+        assert sent.count("UPDATE") == 1
+        results = response.json()["data"]
+        assert [result["status_code"] for result in results] == [200] * 3 + [404]
+        assert results[0]["data"]["category"] == "work"
+        assert response.json()["message"] == "3 of 4 tasks updated"
+
+        response = client.patch("/api/v1/tasks:complete", json={
+            "ids": [ids[0], ids[0], ids[4]]
+        })
+        assert [r["data"]["status"] for r in response.json()["data"]] == [True] * 3
+
+        with statements(engine) as sent:
+            response = client.request(
+                "DELETE", "/api/v1/tasks:batch", json={"ids": [ids[1], missing]}
+            )
+        assert sent.count("DELETE") == 1
+        results = response.json()["data"]
+        assert [result["status_code"] for result in results] == [200, 404]
+
+    remaining, total, _ = crud.get_tasks(session, sort="title", order="asc")
+    assert total == 4
+    assert [(t.title, t.status, t.priority_rank) for t in remaining] == [
+        ("Task 0", True, 3),
+        ("Task 2", False, 3),
+        ("Task 3", False, 2),
+        ("Task 4", True, 2),
+    ]
+
+
+@pytest.mark.parametrize("field", ["title", "status", "priority"])
+def test_batch_patch_rejects_null(session, field):
+    """Test that nulling a required field gives 422 and changes nothing."""
+    task = crud.create_task(session, TaskCreate(title="Task", priority="high"))
+
+    for router in (tasks.router, async_tasks.router):
+        with client_for(router) as client:
+            response = client.patch("/api/v1/tasks:batch", json={
+                "ids": [str(task.id)], "changes": {field: None},
+            })
+        assert response.status_code == 422
+
+    session.expire_all()
+    stored = session.get(Task, task.id)
+    assert (stored.title, stored.status, stored.priority) == ("Task", False, "high")
+    assert stored.priority_rank == 3
+
+
+def test_async_batch(engine, session):
+    """Test that the async routes answer bulk requests like the sync ones."""
+    with client_for(async_tasks.router) as client:
+        response = client.post("/api/v1/tasks:batch", json={
+            "items": [{"title": "First"}, {"title": ""}, {"title": "Second"}]
+        })
+        results = response.json()["data"]
+        assert [result["status_code"] for result in results] == [201, 422, 201]
+        ids = [results[0]["id"], results[2]["id"]]
+
+        response = client.patch("/api/v1/tasks:complete", json={"ids": ids})
+        assert response.json()["message"] == "2 of 2 tasks marked as complete"
+        response = client.request(
+            "DELETE", "/api/v1/tasks:batch", json={"ids": ids}
+        )
+        assert response.json()["message"] == "2 of 2 tasks deleted"
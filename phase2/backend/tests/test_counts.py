@@ -0,0 +1,99 @@
+"""
+Tests for list totals: exact, estimated, or left out (count_mode).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import crud
+from src.models import Task
+from src.routers import tasks as tasks_router
+from src.schemas import TaskCreate
+
+from .test_async import client_for
+from .test_batch import statements
+
+
+@pytest.fixture
+def tasks(session):
+    """Add 25 tasks, 10 of them complete."""
+    start = datetime(2026, 4, 1)
+    for number in range(25):
+        session.add(Task(
+            title=f"Task {number}",
+            status=number < 10,
+            created_at=start + timedelta(minutes=number),
+        ))
+    session.commit()
+
+
+def test_exact_totals(engine, tasks, session):
+    """Test exact totals in the page query, and past the last page."""
+    with statements(engine) as sent:
+        page, total, _ = crud.get_tasks(session, limit=10)
+        assert (len(page), total) == (10, 25)
+        page, total, _ = crud.get_tasks(session, status="complete", limit=4, page=3)
+        assert (len(page), total) == (2, 10)
+    # Counted by a window function in the page query: no separate COUNT(*)
+    assert sent == ["SELECT", "SELECT"]
+
+    # Past the end the window has no rows to count with
+    page, total, _ = crud.get_tasks(session, status="incomplete", page=9)
+    assert (page, total) == ([], 15)
+    page, total, _ = crud.get_tasks(session, category="none")
+    assert (page, total) == ([], 0)
+
+    # A cursor page counts every matching task, not just those after it
+    _, _, cursor = crud.get_tasks(session, limit=10)
+    page, total, _ = crud.get_tasks(session, limit=10, cursor=cursor)
+    assert (len(page), total) == (10, 25)
+
+
+def test_totals_through_the_router(tasks, session):
+    """Test include_total=false and count=estimate on GET /api/v1/tasks."""
+    with client_for(tasks_router.router) as client:
+        pagination = client.get(
+            "/api/v1/tasks", params={"limit": 10}
+        ).json()["pagination"]
+        assert (pagination["total"], pagination["pages"]) == (25, 3)
+
+        pagination = client.get(
+            "/api/v1/tasks", params={"include_total": "false"}
+        ).json()["pagination"]
+        assert (pagination["total"], pagination["pages"]) == (None, None)
+
+        pagination = client.get(
+            "/api/v1/tasks", params={"count": "estimate"}
+        ).json()["pagination"]
+        assert pagination["total"] == 25
+        # Filtered lists are counted exactly
+        pagination = client.get(
+            "/api/v1/tasks", params={"count": "estimate", "status": "complete"}
+        ).json()["pagination"]
+        assert pagination["total"] == 10
+
+
+def test_estimate_follows_bulk_changes(tasks, session):
+    """Test that the cached estimate is adjusted by creates and deletes."""
+    def estimate():
+        return crud.get_tasks(session, count_mode="estimate", limit=1)[1]
+
+    assert estimate() == 25
+    created = crud.create_tasks(
+        session, [TaskCreate(title=f"New {number}") for number in range(4)]
+    )
+    crud.create_task(session, TaskCreate(title="One more"))
+    assert estimate() == 30
+
+    deleted = crud.delete_tasks(
+        session, [task.id for task in created[:3]] + [created[0].id]
+    )
+    assert len(deleted) == 3
+    assert estimate() == 27
+
+    # Rows added behind crud's back only show up once the cache is refreshed
+    session.add(Task(title="Unseen"))
+    session.commit()
+    assert estimate() == 27
+    crud.task_count_cache.invalidate()
+    assert estimate() == 28
@@ -0,0 +1,177 @@
+"""
+Tests for the tasks table indexes and migrations.
+
+Every filter and sort combination of GET /api/v1/tasks is run through
+crud.get_tasks, and the page queries it sends are checked with EXPLAIN.
+Totals are left out (count_mode=None): an exact total counts every
+matching row whatever the plan, while the page query should only read
+one page from an index.
+"""
+import itertools
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from src import crud
+from src.models import Task
+
+FILTERS = {"status": "incomplete", "priority": "high", "category": "work"}
+SORTS = ["created_at", "due_date", "title", "priority"]
+
+# Shapes an index serves in sort order, with no sort step:
+# {filter fields: sort fields}
+ORDERED = {
+    (): set(SORTS),
+    ("status",): {"created_at", "due_date"},
+    ("priority",): {"created_at", "priority"},
+    ("category",): {"created_at"},
+}
+
+
+@pytest.fixture
+def tasks(session):
+    """Add 240 tasks spread over every filter value, a third without due date."""
+    start = datetime(2026, 1, 1)
+    priorities = ["high", "medium", "low"]
+    categories = ["work", "home", None]
+    for number in range(240):
+        session.add(Task(
+            title=f"Task {number % 17}",
+            status=number % 2 == 0,
+            priority=priorities[number % 3],
+            category=categories[number // 3 % 3],
+            due_date=None if number % 3 == 1 else start + timedelta(days=number % 29),
+            created_at=start + timedelta(minutes=number),
+        ))
+    session.commit()
+
+
+def explain(connection, statement: str, parameters) -> str:
+    """Return the query plan of a statement as text."""
+    if connection.dialect.name == "postgresql":
+        # Small test tables make sequential scans and sorts look cheapest
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        connection.exec_driver_sql("SET enable_sort = off")
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+        return "\n".join(row[0] for row in rows)
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+    return "\n".join(row[-1] for row in rows)
+
+
+def uses_index(plan: str, dialect: str) -> bool:
+    """Return True if every read of the tasks table goes through an index."""
+    if dialect == "postgresql":
+        return "Seq Scan" not in plan and "Index" in plan
+    reads = [line for line in plan.splitlines() if " tasks" in line]
+    return bool(reads) and all("USING" in line for line in reads)
+
+
+def sorts(plan: str, dialect: str) -> bool:
+    """Return True if the plan sorts rows instead of reading them in order."""
+    if dialect == "postgresql":
+        return "Sort" in plan
+    return "TEMP B-TREE FOR ORDER BY" in plan
+
+
+def shapes():
+    """Yield (filters, sort, order) for every combination list_tasks allows."""
+    for count in range(len(FILTERS) + 1):
+        for fields in itertools.combinations(FILTERS, count):
+            for sort in SORTS:
+                for order in ("asc", "desc"):
+                    yield fields, sort, order
+
+
+def test_every_list_query_uses_an_index(engine, session, tasks):
+    """Test that each filter+sort shape, with and without cursor, uses an index."""
+    captured = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "ORDER BY" in statement:
+            captured.append((statement, parameters))
+
+    dialect = engine.dialect.name
+    failures = []
+    for fields, sort, order in shapes():
+        filters = {field: FILTERS[field] for field in fields}
+        captured.clear()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            page, _, next_cursor = crud.get_tasks(
+                session, **filters, sort=sort, order=order, limit=5, count_mode=None
+            )
+            assert next_cursor is not None, f"too few tasks for {fields}"
+            crud.get_tasks(
+                session, **filters, sort=sort, order=order, limit=5,
+                cursor=next_cursor, count_mode=None
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert len(captured) == 2
+        with engine.connect() as connection:
+            for kind, (statement, parameters) in zip(("page", "cursor"), captured):
+                plan = explain(connection, statement, parameters)
+                shape = f"{kind} {fields} sort={sort} {order}:\n{plan}"
+                if not uses_index(plan, dialect):
+                    failures.append(f"no index for {shape}")
+                elif sort in ORDERED.get(fields, ()) and sorts(plan, dialect):
+                    failures.append(f"sorts instead of an ordered scan for {shape}")
+    assert not failures, "\n\n".join(failures)
+
+
+def test_search_reads_in_sort_order(engine, session, tasks):
+    """Test that a search walks a sort index instead of sorting all matches."""
+    captured = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        crud.get_tasks(session, search="task 1", limit=5, count_mode=None)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    with engine.connect() as connection:
+        plan = explain(connection, *captured[-1])
+    assert uses_index(plan, engine.dialect.name), plan
+    assert not sorts(plan, engine.dialect.name), plan
+
+
+def test_migrations_create_model_indexes(engine):
+    """Test that the migrated schema has every index declared on Task."""
+    declared = {index.name for index in Task.__table__.indexes}
+    migrated = {index["name"] for index in inspect(engine).get_indexes("tasks")}
+    assert declared <= migrated
+
+
+def test_migrations_adopt_existing_database(tmp_path, migrate):
+    """Test upgrading a database made by create_all, then upgrading again."""
+    legacy = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    Task.__table__.create(legacy)
+    # A database from before the indexes: only the table
+    for index in Task.__table__.indexes:
+        index.drop(legacy)
+
+    migrate(legacy)
+    migrate(legacy)
+
+    indexes = {index["name"] for index in inspect(legacy).get_indexes("tasks")}
+    assert indexes == {index.name for index in Task.__table__.indexes}
+    legacy.dispose()
+
+
+@pytest.mark.parametrize("auto_migrate", [False, True])
+def test_startup_migrates_only_when_asked(monkeypatch, auto_migrate):
+    """Test that the app leaves the schema alone unless DATABASE_AUTO_MIGRATE."""
+    from fastapi.testclient import TestClient
+
+    from src import main
+
+    runs = []
+    monkeypatch.setattr(main, "DATABASE_AUTO_MIGRATE", auto_migrate)
+    monkeypatch.setattr(main, "run_migrations", lambda: runs.append("head"))
+    with TestClient(main.app) as client:
+        assert client.get("/api/v1/health").status_code == 200
+    assert runs == (["head"] if auto_migrate else [])
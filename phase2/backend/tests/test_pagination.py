@@ -0,0 +1,102 @@
+"""
+Tests for keyset (cursor) pagination of GET /api/v1/tasks.
+"""
+import itertools
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import crud
+from src.models import Task
+from src.routers import tasks as tasks_router
+
+from .test_async import client_for
+
+SORTS = ["created_at", "due_date", "title", "priority"]
+ORDERS = ["asc", "desc"]
+
+
+@pytest.fixture
+def tasks(session):
+    """Add 60 tasks with repeated sort values and a third without due date."""
+    start = datetime(2026, 2, 1)
+    for number in range(60):
+        session.add(Task(
+            title=f"Task {number % 7}",
+            status=number % 4 == 0,
+            priority=["high", "medium", "low"][number % 3],
+            due_date=None if number % 3 == 1 else start + timedelta(days=number % 5),
+            # Pairs of tasks share a creation time
+            created_at=start + timedelta(minutes=number // 2),
+        ))
+    session.commit()
+
+
+def walk_cursor(session, limit: int, **params) -> list:
+    """Return the IDs of every page, following next_cursor."""
+    ids, cursor = [], None
+    while True:
+        page, _, cursor = crud.get_tasks(
+            session, limit=limit, cursor=cursor, count_mode=None, **params
+        )
+        ids += [task.id for task in page]
+        if cursor is None:
+            return ids
+
+
+def walk_offset(session, limit: int, **params) -> list:
+    """Return the IDs of every page, by page number."""
+    ids = []
+    for page_number in itertools.count(1):
+        page, _, _ = crud.get_tasks(
+            session, limit=limit, page=page_number, count_mode=None, **params
+        )
+        if not page:
+            return ids
+        ids += [task.id for task in page]
+
+
+@pytest.mark.parametrize("sort,order", list(itertools.product(SORTS, ORDERS)))
+def test_cursor_matches_offset(tasks, session, sort, order):
+    """Test that following cursors lists the same tasks as page numbers."""
+    by_cursor = walk_cursor(session, 7, sort=sort, order=order)
+    assert by_cursor == walk_offset(session, 7, sort=sort, order=order)
+    assert len(set(by_cursor)) == 60
+
+    # And with a filter, ending exactly at a page boundary
+    by_cursor = walk_cursor(session, 5, sort=sort, order=order, status="incomplete")
+    assert by_cursor == walk_offset(
+        session, 5, sort=sort, order=order, status="incomplete"
+    )
+    assert len(by_cursor) == 45
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_due_date_nulls_sort_as_latest(tasks, session, order):
+    """Test that tasks without a due date rank after every date, both ways."""
+    ids = walk_cursor(session, 4, sort="due_date", order=order)
+    due_dates = [session.get(Task, task_id).due_date for task_id in ids]
+    dated = [due for due in due_dates if due is not None]
+    nulls = [None] * (len(due_dates) - len(dated))
+    assert due_dates == (nulls + dated if order == "desc" else dated + nulls)
+    assert dated == sorted(dated, reverse=order == "desc")
+
+
+def test_invalid_cursor_is_rejected(tasks, session):
+    """Test that a malformed or mismatched cursor gives 400."""
+    _, _, cursor = crud.get_tasks(session, sort="title", order="asc", limit=5)
+
+    with client_for(tasks_router.router) as client:
+        response = client.get(
+            "/api/v1/tasks",
+            params={"sort": "title", "order": "asc", "cursor": cursor},
+        )
+        assert response.status_code == 200
+        for params in (
+            {"sort": "title", "order": "desc", "cursor": cursor},
+            {"sort": "created_at", "order": "asc", "cursor": cursor},
+            {"sort": "title", "order": "asc", "cursor": "junk"},
+            {"sort": "title", "order": "asc", "cursor": cursor[:-4]},
+        ):
+            response = client.get("/api/v1/tasks", params=params)
+            assert response.status_code == 400, params
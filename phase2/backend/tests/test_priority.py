@@ -0,0 +1,132 @@
+"""
+Tests for priority_rank: sorting, filtering and the backfill migration.
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, inspect, text
+
+from src import crud
+from src.models import Task
+from src.schemas import PriorityEnum, TaskCreate, TaskPatch
+
+
+def test_rank_follows_priority(session):
+    """Test that priority_rank is set on create and kept on updates."""
+    task = crud.create_task(session, TaskCreate(title="Ship it", priority="high"))
+    assert task.priority_rank == PriorityEnum.HIGH.rank == 3
+
+    task = crud.patch_task(session, task.id, TaskPatch(priority="low"))
+    assert task.priority_rank == PriorityEnum.LOW.rank == 1
+    # Unrelated changes keep the rank
+    task = crud.patch_task(session, task.id, TaskPatch(title="Ship it later"))
+    assert task.priority_rank == 1
+
+    session.add(Task(title="Default"))
+    session.commit()
+    default = crud.get_tasks(session, priority="medium")[0]
+    assert [t.title for t in default] == ["Default"]
+
+
+def test_unknown_priority_ranks_as_medium(session):
+    """Test that a legacy row with an unknown priority can still be updated."""
+    task_id = uuid4()
+    session.execute(
+        text(
+            "INSERT INTO tasks (id, title, status, priority, priority_rank, "
+            "created_at, updated_at) "
+            "VALUES (:id, 'Old task', 0, 'urgent', 2, :now, :now)"
+        ),
+        {"id": task_id.hex, "now": datetime(2026, 1, 1)},
+    )
+    session.commit()
+
+    task = crud.patch_task(session, task_id, TaskPatch(title="Still urgent"))
+    assert (task.title, task.priority) == ("Still urgent", "urgent")
+    assert task.priority_rank == PriorityEnum.MEDIUM.rank
+
+
+def test_sort_by_urgency(session):
+    """Test that sort=priority orders by urgency, then newest, across cursors."""
+    start = datetime(2026, 3, 1)
+    for number in range(30):
+        priority = ["low", "high", "medium"][number % 3]
+        session.add(Task(
+            title=f"{priority} {number}",
+            priority=priority,
+            created_at=start + timedelta(hours=number),
+        ))
+    session.commit()
+
+    def key(task):
+        return (PriorityEnum(task.priority).rank, task.created_at, task.id)
+
+    tasks, _, _ = crud.get_tasks(session, sort="priority", order="desc", limit=100)
+    assert [t.priority for t in tasks[:10]] == ["high"] * 10
+    assert [t.priority for t in tasks[-10:]] == ["low"] * 10
+    assert tasks == sorted(tasks, key=key, reverse=True)
+
+    for order in ("asc", "desc"):
+        seen, cursor = [], None
+        while True:
+            page, total, cursor = crud.get_tasks(
+                session, sort="priority", order=order, limit=7, cursor=cursor
+            )
+            assert total == 30
+            seen += page
+            if cursor is None:
+                break
+        assert seen == sorted(seen, key=key, reverse=order == "desc")
+        assert len({t.id for t in seen}) == 30
+
+
+def test_backfill_in_batches(tmp_path, migrate):
+    """Test that the backfill migration ranks existing rows batch by batch."""
+    legacy = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    migrate(legacy, "0004")
+
+    priorities = ["high", "medium", "low", "urgent"]
+    with legacy.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO tasks (id, title, status, priority, created_at, "
+                "updated_at) VALUES (:id, 'Old task', 0, :priority, :now, :now)"
+            ),
+            [
+                {
+                    "id": uuid4().hex,
+                    "priority": priorities[number % 4],
+                    "now": datetime(2026, 1, 1),
+                }
+                for number in range(2500)
+            ],
+        )
+
+    updates = []
+
+    def count_updates(connection, cursor, statement, *args):
+        if statement.startswith("UPDATE tasks SET priority_rank"):
+            updates.append(cursor)
+
+    event.listen(legacy, "before_cursor_execute", count_updates)
+    migrate(legacy)
+    event.remove(legacy, "before_cursor_execute", count_updates)
+
+    # 1000 rows per batch
+    assert len(updates) == 3
+    with legacy.connect() as connection:
+        ranks = dict(connection.execute(text(
+            "SELECT priority, min(priority_rank) FROM tasks "
+            "GROUP BY priority HAVING min(priority_rank) = max(priority_rank)"
+        )).all())
+    assert ranks == {"high": 3, "medium": 2, "low": 1, "urgent": 2}
+
+    indexes = {index["name"] for index in inspect(legacy).get_indexes("tasks")}
+    assert "ix_tasks_priority_rank_created_at_id" in indexes
+    assert "ix_tasks_priority_created_at_id" not in indexes
+
+    # And back down past the new column
+    migrate(legacy, "-2")
+    columns = {column["name"] for column in inspect(legacy).get_columns("tasks")}
+    assert "priority_rank" not in columns
+    legacy.dispose()
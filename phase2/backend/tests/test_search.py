@@ -0,0 +1,161 @@
+"""
+Tests for full-text search (search_mode="fulltext").
+"""
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import select
+
+from src import crud
+from src.main import app
+from src.models import Task
+from src.schemas import TaskCreate, TaskPatch
+
+
+def add(session, title, description=None):
+    """Add a task through crud and return it."""
+    return crud.create_task(
+        session, TaskCreate(title=title, description=description)
+    )
+
+
+def search(session, text, **kwargs):
+    """Return the titles of a fulltext search, best matches first."""
+    kwargs.setdefault("sort", "relevance")
+    tasks, _, _ = crud.get_tasks(
+        session, search=text, search_mode="fulltext", limit=100, **kwargs
+    )
+    return [task.title for task in tasks]
+
+
+def test_words_match_as_prefixes(session):
+    """Test that every search word must start a word of the task."""
+    add(session, "Buy groceries", "Milk, eggs, bread")
+    add(session, "Grocery list", "Plan the week")
+    add(session, "Call mom", "About the groceries")
+
+    assert sorted(search(session, "gro")) == [
+        "Buy groceries", "Call mom", "Grocery list"
+    ]
+    assert search(session, "buy GRO") == ["Buy groceries"]
+    assert search(session, "egg") == ["Buy groceries"]
+    # Substrings inside words do not match
+    assert search(session, "ocer") == []
+    # Query syntax is ignored rather than interpreted
+    assert search(session, '"mom* -(') == ["Call mom"]
+    assert search(session, "!!") == []
+
+
+def test_relevance_ranks_titles_first(session):
+    """Test that title matches outrank description matches."""
+    add(session, "Pay rent", "Transfer before the first")
+    add(session, "Monthly budget", "Rent, food, transport")
+    add(session, "Rent a car", "Rent for the rent-free weekend")
+
+    assert search(session, "rent") == ["Rent a car", "Pay rent", "Monthly budget"]
+    assert search(session, "rent", order="asc") == [
+        "Monthly budget", "Pay rent", "Rent a car"
+    ]
+    # Other sorts still apply to the matches
+    assert search(session, "rent", sort="title", order="asc") == [
+        "Monthly budget", "Pay rent", "Rent a car"
+    ]
+
+
+def test_index_follows_changes(session):
+    """Test that updates and deletes are reflected in search results."""
+    task = add(session, "Water plants", "Balcony")
+    assert search(session, "water") == ["Water plants"]
+
+    crud.patch_task(session, task.id, TaskPatch(title="Repot plants"))
+    assert search(session, "water") == []
+    assert search(session, "repot") == ["Repot plants"]
+    crud.patch_task(session, task.id, TaskPatch(description="Kitchen window"))
+    assert search(session, "kitchen") == ["Repot plants"]
+    assert search(session, "balcony") == []
+
+    crud.delete_task(session, task.id)
+    assert search(session, "plants") == []
+
+
+def test_relevance_cursor_pages(session):
+    """Test that following cursors over ranked results visits every match once."""
+    for number in range(30):
+        add(session, f"Task {number}", " ".join(["report"] * (number % 5 + 1)))
+    add(session, "Unrelated", "Nothing here")
+
+    expected, total, _ = crud.get_tasks(
+        session, search="rep", search_mode="fulltext", sort="relevance", limit=100
+    )
+    assert total == 30
+    seen, cursor = [], None
+    while True:
+        tasks, total, cursor = crud.get_tasks(
+            session, search="rep", search_mode="fulltext", sort="relevance",
+            limit=7, cursor=cursor
+        )
+        assert total == 30
+        seen += [task.id for task in tasks]
+        if cursor is None:
+            break
+    assert seen == [task.id for task in expected]
+
+
+def test_fulltext_search_uses_index(engine, session):
+    """Test that a fulltext search looks its matches up in the index."""
+    add(session, "Buy groceries")
+    statements = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        crud.get_tasks(
+            session, search="gro", search_mode="fulltext", count_mode=None
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.exec_driver_sql("SET enable_seqscan = off")
+            rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+            assert "ix_tasks_search" in "\n".join(row[0] for row in rows)
+        else:
+            rows = connection.exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + statement, parameters
+            )
+            assert "VIRTUAL TABLE INDEX" in "\n".join(row[-1] for row in rows)
+
+
+def test_list_tasks_fulltext(engine, session):
+    """Test search_mode and sort=relevance on the list endpoint."""
+    add(session, "Buy groceries")
+    add(session, "Groom the dog")
+    add(session, "Email Gro")
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/api/v1/tasks",
+            params={"search": "groc", "search_mode": "fulltext", "sort": "relevance"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [task["title"] for task in body["data"]] == ["Buy groceries"]
+        assert set(body["pagination"]) == {
+            "page", "limit", "total", "pages", "next_cursor"
+        }
+
+        # The default search mode still matches substrings
+        response = client.get("/api/v1/tasks", params={"search": "ocer"})
+        assert [task["title"] for task in response.json()["data"]] == [
+            "Buy groceries"
+        ]
+
+        response = client.get("/api/v1/tasks", params={"sort": "relevance"})
+        assert response.status_code == 400
+        response = client.get("/api/v1/tasks", params={"search_mode": "regex"})
+        assert response.status_code == 422
+
+    assert len(session.exec(select(Task)).all()) == 3
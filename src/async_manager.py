@@ -0,0 +1,200 @@
+"""
+Asyncio facade over TodoManager for services running an event loop.
+
+TodoManager's methods are synchronous, and with a journal or a search index
+to keep in sync a write can take long enough to stall the event loop.
+AsyncTodoManager keeps that work off the loop:
+
+- Mutations are queued and applied by a single writer task. It takes
+  everything queued so far (up to max_batch) and applies it in one call on
+  a dedicated worker thread, so the whole batch shares one thread hop while
+  writes still take effect one at a time, in the order they were made.
+- Reads are served on the loop from the immutable snapshot the writer
+  publishes after each batch (see TodoManager.snapshot). They never wait
+  for a batch in progress and see every write that has been awaited.
+  If taking a snapshot fails, the writes still succeed and reads keep the
+  previous snapshot until a later batch publishes a new one.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from models import Task
+from storage import PersistentTaskStore, TaskSnapshot
+from todo_manager import TodoManager
+
+# Mutations applied per call to the writer thread
+MAX_BATCH = 256
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTodoManager:
+    """
+    Awaitable TodoManager for asyncio code.
+
+    Methods return the same results as the TodoManager methods they wrap.
+    The wrapped manager belongs to the writer thread: use it only through
+    this facade until close() has returned.
+    """
+
+    def __init__(
+        self, manager: TodoManager | None = None, max_batch: int = MAX_BATCH
+    ) -> None:
+        """
+        Initialize the facade; the writer task starts with the first write.
+
+        Args:
+            manager: TodoManager to wrap (defaults to an in-memory one on a
+                PersistentTaskStore, whose snapshots take constant time;
+                other stores are copied into each snapshot)
+            max_batch: Most mutations applied per call to the writer thread
+        """
+        if manager is None:
+            manager = TodoManager(PersistentTaskStore())
+        self._manager = manager
+        self._max_batch = max_batch
+        self._snapshot = manager.snapshot()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="todo-writer")
+        self._queue: asyncio.Queue | None = None
+        self._writer: asyncio.Task | None = None
+        self._closed = False
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+
+    async def _submit(self, method, *args):
+        """Queue a manager method call for the writer and await its result."""
+        if self._closed:
+            raise RuntimeError("AsyncTodoManager is closed")
+        if self._writer is None:
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.create_task(self._write_loop())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((method, args, future))
+        return await future
+
+    async def _write_loop(self) -> None:
+        """Apply queued mutations in batches until close() queues None."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            batch = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) == self._max_batch or queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if batch:
+                try:
+                    results, snapshot = await loop.run_in_executor(
+                        self._executor, self._apply, batch
+                    )
+                except Exception as e:
+                    # The worker thread could not run the batch at all
+                    results, snapshot = [(e, None)] * len(batch), None
+                # Publish before waking writers, so they read their own writes
+                if snapshot is not None:
+                    self._snapshot = snapshot
+                for (_, _, future), (error, result) in zip(batch, results, strict=True):
+                    if future.done():
+                        # The caller stopped waiting; the write still happened
+                        continue
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+            if item is None:
+                return
+
+    def _apply(self, batch: list) -> tuple[list, TaskSnapshot | None]:
+        """
+        Run a batch of mutations on the writer thread.
+
+        Returns:
+            A tuple of ([(exception or None, result) per call], snapshot),
+            where snapshot is None if taking it failed; the calls' results
+            stand either way, since their writes have been applied
+        """
+        results = []
+        for method, args, _ in batch:
+            try:
+                results.append((None, method(*args)))
+            except Exception as e:
+                results.append((e, None))
+        try:
+            snapshot = self._manager.snapshot()
+        except Exception:
+            logger.exception("Taking a snapshot failed; serving the previous one")
+            snapshot = None
+        return (results, snapshot)
+
+    async def add_task(
+        self, title: str, description: str | None = None
+    ) -> tuple[Task | None, str | None]:
+        """Add a task; see TodoManager.add_task."""
+        return await self._submit(self._manager.add_task, title, description)
+
+    async def update_task(
+        self,
+        task_id: int,
+        new_title: str | None = None,
+        new_description: str | None = None,
+    ) -> tuple[Task | None, str | None, bool]:
+        """Update a task's text; see TodoManager.update_task."""
+        return await self._submit(
+            self._manager.update_task, task_id, new_title, new_description
+        )
+
+    async def delete_task(self, task_id: int) -> tuple[Task | None, str | None]:
+        """Delete a task; see TodoManager.delete_task."""
+        return await self._submit(self._manager.delete_task, task_id)
+
+    async def mark_complete(
+        self, task_id: int
+    ) -> tuple[Task | None, str | None, bool]:
+        """Mark a task complete; see TodoManager.mark_complete."""
+        return await self._submit(self._manager.mark_complete, task_id)
+
+    async def mark_incomplete(
+        self, task_id: int
+    ) -> tuple[Task | None, str | None, bool]:
+        """Mark a task incomplete; see TodoManager.mark_incomplete."""
+        return await self._submit(self._manager.mark_incomplete, task_id)
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+
+    async def get_task(self, task_id: int) -> Task | None:
+        """Return the task with the given ID, or None if it does not exist."""
+        return self._snapshot.get(task_id)
+
+    async def get_all_tasks(self) -> list[Task]:
+        """Return all tasks in ID order."""
+        return list(self._snapshot.values())
+
+    async def task_count(self) -> int:
+        """Return the number of tasks."""
+        return len(self._snapshot)
+
+    # ------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Apply the writes already queued, then close the wrapped manager."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put_nowait(None)
+            await self._writer
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._manager.close
+        )
+        self._executor.shutdown()
@@ -0,0 +1,248 @@
+"""
+Non-interactive script mode for the Todo application.
+
+This module runs a line-oriented command script against a TodoManager and
+writes one JSON object per command to a single buffered output stream.
+
+Script format (one command per line, fields separated by a TAB):
+
+    add <title>[TAB<description>]
+    update <id>TAB<title>[TAB<description>]   (empty field = keep current)
+    delete <id>
+    complete <id>
+    incomplete <id>
+    get <id>
+    view [<start_id> [<limit>]]
+    search <terms>
+    count
+
+Blank lines and lines starting with '#' are ignored. In titles and
+descriptions, '\\n' stands for a newline and '\\\\' for a backslash.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import TextIO
+
+from models import format_timestamp
+from todo_manager import TodoManager
+
+# Number of output lines collected before each write
+_FLUSH_LINES = 4096
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def task_to_dict(task) -> dict:
+    """
+    Convert a task to a JSON-serializable dict.
+
+    Args:
+        task: The task to convert
+
+    Returns:
+        A dict with id, title, description, status and created_at (as an
+        ISO 8601 string)
+    """
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "created_at": format_timestamp(task.created_at),
+    }
+
+
+def _unescape(text: str) -> str:
+    """Decode the \\n and \\\\ escapes allowed in script text fields."""
+    if "\\" not in text:
+        return text
+    return text.replace("\\\\", "\0").replace("\\n", "\n").replace("\0", "\\")
+
+
+class ScriptError(Exception):
+    """Raised for a malformed script line."""
+
+    pass
+
+
+class ScriptRunner:
+    """
+    Executes script commands against a TodoManager.
+
+    Each command produces one result dict:
+    - Success: {"line": n, "ok": true, ...command-specific fields}
+    - Failure: {"line": n, "ok": false, "error": message}
+    """
+
+    def __init__(self, manager: TodoManager) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            manager: The TodoManager to run commands against
+        """
+        self._manager = manager
+        self._commands = {
+            "add": self._add,
+            "update": self._update,
+            "delete": self._delete,
+            "complete": self._complete,
+            "incomplete": self._incomplete,
+            "get": self._get,
+            "view": self._view,
+            "search": self._search,
+            "count": self._count,
+        }
+        self.failures = 0
+
+    def run(self, lines: Iterable[str], output: TextIO) -> int:
+        """
+        Run every command in a script.
+
+        Args:
+            lines: Script lines (e.g. an open file or sys.stdin)
+            output: Stream that receives one JSON line per command
+
+        Returns:
+            The number of commands that failed
+        """
+        pending = []
+        for number, line in enumerate(lines, start=1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            pending.append(_encode(self.execute(line, number)))
+            if len(pending) >= _FLUSH_LINES:
+                output.write("\n".join(pending) + "\n")
+                pending.clear()
+
+        if pending:
+            output.write("\n".join(pending) + "\n")
+        output.flush()
+        return self.failures
+
+    def execute(self, line: str, number: int = 0) -> dict:
+        """
+        Execute a single script line.
+
+        Args:
+            line: The command line without its trailing newline
+            number: Line number reported in the result
+
+        Returns:
+            The result dict for the command
+        """
+        verb, _, arguments = line.partition(" ")
+        handler = self._commands.get(verb.lower())
+        try:
+            if handler is None:
+                raise ScriptError(f"Unknown command: '{verb}'")
+            result = handler(arguments)
+        except ScriptError as e:
+            result = {"ok": False, "error": str(e)}
+
+        if not result["ok"]:
+            self.failures += 1
+        result["line"] = number
+        return result
+
+    # ------------------------------------------------------------
+    # Command handlers
+    # ------------------------------------------------------------
+
+    def _add(self, arguments: str) -> dict:
+        title, _, description = arguments.partition("\t")
+        task, error = self._manager.add_task(
+            _unescape(title), _unescape(description) or None
+        )
+        if error:
+            return {"ok": False, "error": error}
+        return {"ok": True, "id": task.id}
+
+    def _update(self, arguments: str) -> dict:
+        fields = arguments.split("\t")
+        if len(fields) < 2:
+            raise ScriptError("Usage: update <id>TAB<title>[TAB<description>]")
+        task_id = _parse_id(fields[0])
+        new_title = _unescape(fields[1]) or None
+        new_description = (_unescape(fields[2]) or None) if len(fields) > 2 else None
+
+        task, error, changed = self._manager.update_task(
+            task_id, new_title, new_description
+        )
+        if error:
+            return {"ok": False, "error": error}
+        return {"ok": True, "id": task.id, "changed": changed}
+
+    def _delete(self, arguments: str) -> dict:
+        task, error = self._manager.delete_task(_parse_id(arguments))
+        if error:
+            return {"ok": False, "error": error}
+        return {"ok": True, "id": task.id}
+
+    def _complete(self, arguments: str) -> dict:
+        task, error, changed = self._manager.mark_complete(_parse_id(arguments))
+        if error:
+            return {"ok": False, "error": error}
+        return {"ok": True, "id": task.id, "changed": changed}
+
+    def _incomplete(self, arguments: str) -> dict:
+        task, error, changed = self._manager.mark_incomplete(_parse_id(arguments))
+        if error:
+            return {"ok": False, "error": error}
+        return {"ok": True, "id": task.id, "changed": changed}
+
+    def _get(self, arguments: str) -> dict:
+        task_id = _parse_id(arguments)
+        task = self._manager.get_task(task_id)
+        if not task:
+            return {"ok": False, "error": f"Task with ID {task_id} not found"}
+        return {"ok": True, "task": task_to_dict(task)}
+
+    def _view(self, arguments: str) -> dict:
+        values = arguments.split()
+        if len(values) > 2:
+            raise ScriptError("Usage: view [<start_id> [<limit>]]")
+        start_id = _parse_id(values[0]) if values else 1
+        limit = _parse_id(values[1]) if len(values) > 1 else None
+        tasks = self._manager.iter_tasks(start_id, limit)
+        return {"ok": True, "tasks": [task_to_dict(task) for task in tasks]}
+
+    def _search(self, arguments: str) -> dict:
+        tasks = self._manager.search(arguments, limit=None)
+        return {"ok": True, "tasks": [task_to_dict(task) for task in tasks]}
+
+    def _count(self, arguments: str) -> dict:
+        return {"ok": True, "count": self._manager.task_count()}
+
+
+def _parse_id(text: str) -> int:
+    """
+    Parse a task ID with the same rules as the interactive prompts.
+
+    Raises:
+        ScriptError: If the text is not a positive integer
+    """
+    try:
+        task_id = int(text)
+    except ValueError:
+        raise ScriptError("Invalid task ID. Please provide a numeric ID") from None
+    if task_id <= 0:
+        raise ScriptError("Invalid task ID. Please provide a positive number")
+    return task_id
+
+
+def run_script(manager: TodoManager, lines: Iterable[str], output: TextIO) -> int:
+    """
+    Run a command script against a manager.
+
+    Args:
+        manager: The TodoManager to run commands against
+        lines: Script lines
+        output: Stream that receives one JSON line per command
+
+    Returns:
+        The number of commands that failed
+    """
+    return ScriptRunner(manager).run(lines, output)
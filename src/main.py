@@ -2,11 +2,44 @@
 Console interface for the Todo application.
 
 This module provides the command-line user interface and handles user interaction.
+
+Startup cost matters because 'todo <command>' may run thousands of times from
+shell scripts, so modules that only some commands need (argparse, batch,
+persistence, search_index, shared_manager, transfer) are imported inside the
+functions that use them.
 """
 
-from typing import Optional
+import os
+import sys
+
+from models import Task, format_timestamp
+from render import (
+    format_status,
+    format_task,
+    render_page,
+    render_search_results,
+    render_task_list,
+    write_buffered,
+)
 from todo_manager import TodoManager
-from models import Task
+
+# Tasks per page when 'view --page' is used without '--size'
+DEFAULT_PAGE_SIZE = 20
+
+FSYNC_CHOICES = ("always", "batch", "never")
+
+# Usage of the commands that can be given on the command line
+ONE_SHOT_USAGE = {
+    "add": "add TITLE [DESCRIPTION]",
+    "view": "view [--page N] [--size M] [--compact] [--complete | --incomplete]",
+    "search": "search WORD...",
+    "update": "update ID TITLE [DESCRIPTION]  (empty text = keep current)",
+    "delete": "delete ID",
+    "complete": "complete ID",
+    "incomplete": "incomplete ID",
+    "export": "export FILE [--format jsonl|csv|binary]  (FILE '-' = stdout)",
+    "import": "import FILE [--format jsonl|csv|binary]  (FILE '-' = stdin)",
+}
 
 
 # ============================================================
@@ -14,7 +47,7 @@ from models import Task
 # ============================================================
 
 
-def parse_task_id(id_string: str) -> tuple[Optional[int], Optional[str]]:
+def parse_task_id(id_string: str) -> tuple[int | None, str | None]:
     """
     Parse and validate a task ID from user input.
 
@@ -46,19 +79,6 @@ def parse_task_id(id_string: str) -> tuple[Optional[int], Optional[str]]:
     return (task_id, None)
 
 
-def format_status(status: bool) -> str:
-    """
-    Format task status for display.
-
-    Args:
-        status: The task status (True=complete, False=incomplete)
-
-    Returns:
-        Formatted status string
-    """
-    return "Complete" if status else "Incomplete"
-
-
 # ============================================================
 # DISPLAY FUNCTIONS
 # ============================================================
@@ -72,6 +92,9 @@ def display_menu() -> None:
     print("\nAvailable Commands:")
     print("  add        - Add a new task")
     print("  view       - View all tasks")
+    print("               (options: --page N, --size M, --compact,")
+    print("                --complete, --incomplete)")
+    print("  search     - Search tasks by words (e.g. 'search groc* milk')")
     print("  update     - Update a task")
     print("  delete     - Delete a task")
     print("  complete   - Mark a task as complete")
@@ -93,7 +116,7 @@ def display_task_success(task: Task) -> None:
     if task.description:
         print(f"Description: {task.description}")
     print(f"Status: {'Complete' if task.status else 'Incomplete'}")
-    print(f"Created: {task.created_at}")
+    print(f"Created: {format_timestamp(task.created_at)}")
 
 
 def display_error(error_message: str) -> None:
@@ -113,51 +136,21 @@ def display_task(task: Task) -> None:
     Args:
         task: The task to display
     """
-    print(f"\nTask #{task.id}")
-    print(f"Title: {task.title}")
-
-    if task.description:
-        # Handle multiline descriptions
-        if "\n" in task.description:
-            print("Description:")
-            for line in task.description.split("\n"):
-                print(f"  {line}")
-        else:
-            print(f"Description: {task.description}")
-
-    print(f"Status: {format_status(task.status)}")
-    print(f"Created: {task.created_at}")
+    write_buffered([format_task(task)])
 
 
-def display_task_list(tasks: list[Task]) -> None:
+def display_task_list(tasks, compact: bool = False) -> None:
     """
     Display all tasks with summary.
 
+    Output is rendered lazily and written in large chunks, so tasks may be
+    any iterable, including a generator.
+
     Args:
-        tasks: List of tasks to display
+        tasks: Tasks to display, in display order
+        compact: If True, show one line per task
     """
-    print("\n" + "=" * 60)
-    print("YOUR TODO LIST")
-    print("=" * 60)
-
-    if not tasks:
-        print("\nYour todo list is empty. Use 'add' to create a task.")
-    else:
-        for i, task in enumerate(tasks):
-            display_task(task)
-            # Add separator between tasks (but not after last)
-            if i < len(tasks) - 1:
-                print("\n" + "-" * 60)
-
-        # Display summary
-        total = len(tasks)
-        complete = sum(1 for t in tasks if t.status)
-        incomplete = total - complete
-
-        print("\n" + "=" * 60)
-        print(f"Summary: {total} task(s) ({complete} complete, {incomplete} incomplete)")
-
-    print("=" * 60)
+    write_buffered(render_task_list(tasks, compact))
 
 
 # ============================================================
@@ -184,7 +177,23 @@ def handle_add_command(manager: TodoManager) -> None:
     if not description:
         description = None
 
-    # Add task
+    add_and_report(manager, title, description)
+
+
+def add_and_report(
+    manager: TodoManager, title: str, description: str | None = None
+) -> bool:
+    """
+    Add a task and display the result.
+
+    Args:
+        manager: The TodoManager instance
+        title: The task title
+        description: Optional task description
+
+    Returns:
+        True if the task was added
+    """
     task, error = manager.add_task(title, description)
 
     # Display result
@@ -192,17 +201,110 @@ def handle_add_command(manager: TodoManager) -> None:
         display_task_success(task)
     else:
         display_error(error)
+    return task is not None
 
 
-def handle_view_command(manager: TodoManager) -> None:
+def parse_view_options(
+    args: list[str],
+) -> tuple[dict | None, str | None]:
     """
-    Handle the 'view' command to display all tasks.
+    Parse the options of the 'view' command.
+
+    Args:
+        args: Words following 'view' (e.g. ['--page', '2', '--compact'])
+
+    Returns:
+        A tuple of (options, error_message):
+        - Success: ({"page": int or None, "size": int, "compact": bool,
+          "status": bool or None}, None)
+        - Failure: (None, error_string)
+    """
+    options = {
+        "page": None,
+        "size": DEFAULT_PAGE_SIZE,
+        "compact": False,
+        "status": None,
+    }
+    words = iter(args)
+    for word in words:
+        if word == "--compact":
+            options["compact"] = True
+        elif word in ("--complete", "--incomplete"):
+            status = word == "--complete"
+            if options["status"] is not None and options["status"] != status:
+                return (None, "Use either --complete or --incomplete, not both")
+            options["status"] = status
+        elif word in ("--page", "--size"):
+            value, error = parse_task_id(next(words, ""))
+            if error:
+                return (None, f"{word} needs a positive number")
+            options[word[2:]] = value
+        else:
+            return (None, f"Unknown view option: '{word}'")
+
+    # --size alone means the first page
+    if options["page"] is None and "--size" in args:
+        options["page"] = 1
+    return (options, None)
+
+
+def handle_view_command(manager: TodoManager, args: list[str] | None = None) -> bool:
+    """
+    Handle the 'view' command to display tasks.
+
+    Without options every task is shown. With --page/--size only that page
+    is rendered, so the first screen appears at once for any list size.
 
     Args:
         manager: The TodoManager instance
+        args: Words following 'view' on the command line
+
+    Returns:
+        False if the options were invalid
     """
-    tasks = manager.get_all_tasks()
-    display_task_list(tasks)
+    options, error = parse_view_options(args or [])
+    if error:
+        display_error(error)
+        return False
+
+    status = options["status"]
+    if options["page"] is None:
+        tasks = manager.iter_tasks(status=status)
+        write_buffered(render_task_list(tasks, options["compact"], status))
+        return True
+
+    # Page counts come from the status index, not from walking the list
+    if status is None:
+        total = manager.task_count()
+    else:
+        total = manager.count_by_status()["complete" if status else "incomplete"]
+
+    page, size = options["page"], options["size"]
+    tasks = manager.iter_page(page, size, status)
+    write_buffered(
+        render_page(tasks, page, size, total, options["compact"], status)
+    )
+    return True
+
+
+def handle_search_command(manager: TodoManager, args: list[str]) -> bool:
+    """
+    Handle the 'search' command to find tasks by words.
+
+    Args:
+        manager: The TodoManager instance
+        args: Query words following 'search' (prompted for if empty)
+
+    Returns:
+        False if no search terms were given
+    """
+    query = " ".join(args) if args else input("Enter search terms: ").strip()
+    if not query:
+        display_error("Please provide at least one search term")
+        return False
+
+    write_buffered(render_search_results(manager.search(query), query))
+    return True
 
 
 def handle_delete_command(manager: TodoManager) -> None:
@@ -217,11 +319,25 @@ def handle_delete_command(manager: TodoManager) -> None:
     # Prompt for task ID
     id_input = input("Enter task ID to delete: ")
 
+    delete_and_report(manager, id_input)
+
+
+def delete_and_report(manager: TodoManager, id_input: str) -> bool:
+    """
+    Delete a task and display the result.
+
+    Args:
+        manager: The TodoManager instance
+        id_input: The task ID as typed by the user
+
+    Returns:
+        True if the task was deleted
+    """
     # Parse and validate ID
     task_id, error = parse_task_id(id_input)
     if error:
         display_error(error)
-        return
+        return False
 
     # Delete task
     deleted_task, error = manager.delete_task(task_id)
@@ -232,6 +348,7 @@ def handle_delete_command(manager: TodoManager) -> None:
         print(f'Deleted: "{deleted_task.title}" (ID: {deleted_task.id})')
     else:
         display_error(error)
+    return deleted_task is not None
 
 
 def handle_update_command(manager: TodoManager) -> None:
@@ -271,7 +388,27 @@ def handle_update_command(manager: TodoManager) -> None:
     new_title = new_title if new_title else None
     new_description = new_description if new_description else None
 
-    # Update task
+    update_and_report(manager, task_id, new_title, new_description)
+
+
+def update_and_report(
+    manager: TodoManager,
+    task_id: int,
+    new_title: str | None,
+    new_description: str | None,
+) -> bool:
+    """
+    Update a task and display the result.
+
+    Args:
+        manager: The TodoManager instance
+        task_id: ID of the task to update
+        new_title: New title (None = keep current)
+        new_description: New description (None = keep current)
+
+    Returns:
+        True unless the update failed
+    """
     updated_task, error, changes_made = manager.update_task(
         task_id, new_title, new_description
     )
@@ -289,6 +426,7 @@ def handle_update_command(manager: TodoManager) -> None:
         if updated_task.description:
             print(f"Description: {updated_task.description}")
         print(f"Status: {format_status(updated_task.status)}")
+    return error is None
 
 
 def handle_complete_command(manager: TodoManager) -> None:
@@ -303,28 +441,7 @@ def handle_complete_command(manager: TodoManager) -> None:
     # Prompt for task ID
     id_input = input("Enter task ID to mark as complete: ")
 
-    # Parse and validate ID
-    task_id, error = parse_task_id(id_input)
-    if error:
-        display_error(error)
-        return
-
-    # Mark task as complete
-    task, error, status_changed = manager.mark_complete(task_id)
-
-    # Display result
-    if error:
-        display_error(error)
-    elif status_changed:
-        print(f"\nSuccess: Task marked as complete!")
-        print(f"ID: {task.id}")
-        print(f"Title: {task.title}")
-        print(f"Status: {format_status(task.status)}")
-    else:
-        print(f"\nSuccess: Task is already complete!")
-        print(f"ID: {task.id}")
-        print(f"Title: {task.title}")
-        print(f"Status: {format_status(task.status)}")
+    set_status_and_report(manager, id_input, True)
 
 
 def handle_incomplete_command(manager: TodoManager) -> None:
@@ -339,54 +456,458 @@ def handle_incomplete_command(manager: TodoManager) -> None:
     # Prompt for task ID
     id_input = input("Enter task ID to mark as incomplete: ")
 
+    set_status_and_report(manager, id_input, False)
+
+
+def set_status_and_report(manager: TodoManager, id_input: str, complete: bool) -> bool:
+    """
+    Mark a task as complete or incomplete and display the result.
+
+    Args:
+        manager: The TodoManager instance
+        id_input: The task ID as typed by the user
+        complete: True to mark complete, False to mark incomplete
+
+    Returns:
+        True if the task exists (whether or not its status changed)
+    """
     # Parse and validate ID
     task_id, error = parse_task_id(id_input)
     if error:
         display_error(error)
-        return
+        return False
 
-    # Mark task as incomplete
-    task, error, status_changed = manager.mark_incomplete(task_id)
+    # Mark task
+    if complete:
+        task, error, status_changed = manager.mark_complete(task_id)
+    else:
+        task, error, status_changed = manager.mark_incomplete(task_id)
 
     # Display result
     if error:
         display_error(error)
-    elif status_changed:
-        print(f"\nSuccess: Task marked as incomplete!")
-        print(f"ID: {task.id}")
-        print(f"Title: {task.title}")
-        print(f"Status: {format_status(task.status)}")
+        return False
+
+    word = "complete" if complete else "incomplete"
+    if status_changed:
+        print(f"\nSuccess: Task marked as {word}!")
+    else:
+        print(f"\nSuccess: Task is already {word}!")
+    print(f"ID: {task.id}")
+    print(f"Title: {task.title}")
+    print(f"Status: {format_status(task.status)}")
+    return True
+
+
+def run_command(manager: TodoManager, command: str, args: list[str]) -> bool:
+    """
+    Run one command given on the command line, without the menu.
+
+    Args:
+        manager: The TodoManager instance
+        command: The command name (e.g. 'add')
+        args: The words following the command
+
+    Returns:
+        True if the command succeeded
+    """
+    if command == "add" and 1 <= len(args) <= 2:
+        return add_and_report(manager, args[0], args[1] if len(args) > 1 else None)
+    if command == "view":
+        return handle_view_command(manager, args)
+    if command == "search" and args:
+        return handle_search_command(manager, args)
+    if command == "update" and 2 <= len(args) <= 3:
+        task_id, error = parse_task_id(args[0])
+        if error:
+            display_error(error)
+            return False
+        new_description = (args[2] or None) if len(args) > 2 else None
+        return update_and_report(manager, task_id, args[1] or None, new_description)
+    if command == "delete" and len(args) == 1:
+        return delete_and_report(manager, args[0])
+    if command in ("complete", "incomplete") and len(args) == 1:
+        return set_status_and_report(manager, args[0], command == "complete")
+    if command in ("export", "import") and args:
+        return transfer_and_report(manager, command, args)
+
+    usage = ONE_SHOT_USAGE.get(command)
+    if usage is None:
+        display_error(f"Unknown command: '{command}'")
     else:
-        print(f"\nSuccess: Task is already incomplete!")
-        print(f"ID: {task.id}")
-        print(f"Title: {task.title}")
-        print(f"Status: {format_status(task.status)}")
+        display_error(f"Usage: todo {usage}")
+    return False
+
+
+def parse_transfer_options(args: list[str]) -> tuple[dict | None, str | None]:
+    """
+    Parse the options of the 'export' and 'import' commands.
+
+    Args:
+        args: Words following the command (e.g. ['tasks.csv'])
+
+    Returns:
+        A tuple of (options, error_message):
+        - Success: ({"path": str, "format": str}, None)
+        - Failure: (None, error_string)
+    """
+    from transfer import FORMATS, guess_format
+
+    path = None
+    file_format = None
+    words = iter(args)
+    for word in words:
+        name, equals, value = word.partition("=")
+        if name == "--format":
+            file_format = value if equals else next(words, "")
+            if file_format not in FORMATS:
+                return (None, f"--format must be one of: {', '.join(FORMATS)}")
+        elif path is None and (word == "-" or not word.startswith("-")):
+            path = word
+        else:
+            return (None, f"Unexpected argument: '{word}'")
+
+    if path is None:
+        return (None, "Please provide a file name ('-' for standard input/output)")
+    if file_format is None:
+        file_format = "jsonl" if path == "-" else guess_format(path)
+        if file_format is None:
+            return (None, f"Cannot tell the format of '{path}'; use --format")
+    return ({"path": path, "format": file_format}, None)
 
 
-def main() -> None:
+def transfer_and_report(manager: TodoManager, command: str, args: list[str]) -> bool:
+    """
+    Export tasks to a file or import them from one, and report the result.
+
+    Both directions stream, so files of any size use little memory. Rejected
+    import rows are listed on stderr and do not stop the import.
+
+    Args:
+        manager: The TodoManager instance
+        command: 'export' or 'import'
+        args: Words following the command
+
+    Returns:
+        True if every task was transferred
+    """
+    from transfer import TransferError, export_tasks, import_tasks
+
+    options, error = parse_transfer_options(args)
+    if error:
+        display_error(error)
+        return False
+
+    path, file_format = options["path"], options["format"]
+    if command == "export":
+        if path == "-":
+            count = export_tasks(manager.iter_tasks(), sys.stdout.buffer, file_format)
+            print(f"Exported {count} task(s)", file=sys.stderr)
+            return True
+        try:
+            with open(path, "wb") as output:
+                count = export_tasks(manager.iter_tasks(), output, file_format)
+        except OSError as e:
+            display_error(str(e))
+            return False
+        print(f"\nSuccess: Exported {count} task(s) to {path}")
+        return True
+
+    def report_rejected(row: int, message: str) -> None:
+        print(f"Rejected row {row}: {message}", file=sys.stderr)
+
+    try:
+        if path == "-":
+            imported, rejected = import_tasks(
+                manager, sys.stdin.buffer, file_format, report_rejected
+            )
+        else:
+            with open(path, "rb") as source:
+                imported, rejected = import_tasks(
+                    manager, source, file_format, report_rejected
+                )
+    except (OSError, TransferError) as e:
+        display_error(str(e))
+        return False
+
+    if rejected:
+        print(f"\nImported {imported} task(s); {rejected} row(s) rejected")
+        return False
+    print(f"\nSuccess: Imported {imported} task(s)")
+    return True
+
+
+# ============================================================
+# STARTUP
+# ============================================================
+
+
+class CommandLine:
+    """
+    Parsed command-line options.
+
+    Attributes:
+        data_dir: Directory to save tasks in, or None for memory only
+        fsync: One of FSYNC_CHOICES
+        shared: Share the tasks in data_dir live with other processes
+        script: Script file to run ('-' = stdin), or None
+        command: One-shot command name, or None for the interactive menu
+        args: Words following the one-shot command
+    """
+
+    def __init__(
+        self,
+        data_dir: str | None = None,
+        fsync: str = "batch",
+        script: str | None = None,
+        command: str | None = None,
+        args: list[str] | None = None,
+        shared: bool = False,
+    ) -> None:
+        self.data_dir = data_dir
+        self.fsync = fsync
+        self.script = script
+        self.command = command
+        self.args = args if args is not None else []
+        self.shared = shared
+
+
+# Options that take a value, mapped to their CommandLine attribute
+_VALUE_OPTIONS = {"--data-dir": "data_dir", "--fsync": "fsync", "--script": "script"}
+
+# Options that take no value, mapped to their CommandLine attribute
+_FLAG_OPTIONS = {"--shared": "shared"}
+
+
+def parse_args(argv: list[str] | None = None) -> CommandLine:
+    """
+    Parse command-line options and the optional one-shot command.
+
+    The usual forms are parsed directly; argparse is only imported for
+    --help and for usage errors.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        The parsed options
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    options = _parse_simple_args(argv)
+    if options is None:
+        options = _parse_args_with_argparse(argv)
+    return options
+
+
+def _default_data_dir() -> str | None:
+    """Return the data directory from the TODO_DATA_DIR environment variable."""
+    return os.environ.get("TODO_DATA_DIR") or None
+
+
+def _parse_simple_args(argv: list[str]) -> CommandLine | None:
+    """
+    Parse '--option value' / '--option=value' pairs, flags and a command.
+
+    Returns:
+        The parsed options, or None if argv needs argparse (help, unknown
+        options, missing or invalid values)
+    """
+    values = {
+        "data_dir": _default_data_dir(),
+        "fsync": "batch",
+        "script": None,
+        "shared": False,
+    }
+    position = 0
+    while position < len(argv) and argv[position].startswith("-"):
+        if argv[position] in _FLAG_OPTIONS:
+            values[_FLAG_OPTIONS[argv[position]]] = True
+            position += 1
+            continue
+        name, equals, value = argv[position].partition("=")
+        key = _VALUE_OPTIONS.get(name)
+        if key is None:
+            return None
+        if not equals:
+            position += 1
+            if position == len(argv):
+                return None
+            value = argv[position]
+        values[key] = value
+        position += 1
+
+    if values["fsync"] not in FSYNC_CHOICES:
+        return None
+    if position < len(argv):
+        command, args = argv[position].lower(), argv[position + 1 :]
+        return CommandLine(**values, command=command, args=args)
+    return CommandLine(**values)
+
+
+def _parse_args_with_argparse(argv: list[str]) -> CommandLine:
+    """Parse options with argparse, which prints help and usage errors."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="todo",
+        description="Todo App",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands (run once, without the menu):\n"
+        + "\n".join(f"  todo {usage}" for usage in ONE_SHOT_USAGE.values()),
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=_default_data_dir(),
+        help="Directory to save tasks in (default: $TODO_DATA_DIR, or keep "
+        "tasks in memory only)",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=FSYNC_CHOICES,
+        default="batch",
+        help="When saved changes are synced to disk (default: batch)",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="Run commands from FILE ('-' for stdin) and print JSON results",
+    )
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help="Share the tasks in --data-dir live with other todo processes",
+    )
+    parser.add_argument("command", nargs="?", help="Command to run once")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    namespace = parser.parse_args(argv)
+    return CommandLine(
+        namespace.data_dir,
+        namespace.fsync,
+        namespace.script,
+        namespace.command.lower() if namespace.command else None,
+        namespace.args,
+        namespace.shared,
+    )
+
+
+def create_manager(options: CommandLine) -> TodoManager:
+    """
+    Create the TodoManager for the given options.
+
+    Args:
+        options: Parsed command-line options
+
+    Returns:
+        An in-memory manager, one backed by a journal in --data-dir, or
+        with --shared one sharing a task table in --data-dir
+    """
+    if not options.data_dir:
+        return TodoManager()
+
+    if options.shared:
+        from shared_manager import SharedTodoManager
+
+        return SharedTodoManager(options.data_dir)
+
+    from persistence import TaskJournal
+
+    return TodoManager(journal=TaskJournal(options.data_dir, fsync=options.fsync))
+
+
+def run_script_file(manager: TodoManager, path: str) -> int:
+    """
+    Run a command script without the interactive menu.
+
+    Args:
+        manager: The TodoManager instance
+        path: Script file path, or '-' to read from stdin
+
+    Returns:
+        The number of commands that failed
+    """
+    from batch import run_script
+
+    if path == "-":
+        return run_script(manager, sys.stdin, sys.stdout)
+    with open(path, encoding="utf-8") as script:
+        return run_script(manager, script, sys.stdout)
+
+
+def main(argv: list[str] | None = None) -> None:
     """
     Main application loop.
 
     Displays menu, processes commands, and manages application flow.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     """
+    options = parse_args(argv)
+    if options.script and options.command:
+        display_error("Use either --script or a command, not both")
+        sys.exit(2)
+    if options.shared and not options.data_dir:
+        display_error("--shared needs --data-dir or TODO_DATA_DIR")
+        sys.exit(2)
+
     # Initialize todo manager
-    manager = TodoManager()
+    manager = create_manager(options)
+
+    if options.command:
+        if not options.data_dir:
+            print(
+                "Note: no --data-dir or TODO_DATA_DIR given; changes are not saved.",
+                file=sys.stderr,
+            )
+        try:
+            succeeded = run_command(manager, options.command, options.args)
+        finally:
+            manager.close()
+        sys.exit(0 if succeeded else 1)
+
+    if options.script:
+        try:
+            failures = run_script_file(manager, options.script)
+        finally:
+            manager.close()
+        sys.exit(1 if failures else 0)
 
     print("\nWelcome to Todo App!")
-    print("Note: All data is stored in memory and will be lost when you exit.")
+    if options.data_dir:
+        print(f"Note: Tasks are saved in {options.data_dir}")
+    else:
+        print("Note: All data is stored in memory and will be lost when you exit.")
+
+    # Make sure journaled changes reach disk even on Ctrl+C or end of input
+    try:
+        run_menu_loop(manager, options)
+    finally:
+        manager.close()
+
 
+def run_menu_loop(manager: TodoManager, options: CommandLine) -> None:
+    """
+    Run the interactive menu until the user quits.
+
+    Args:
+        manager: The TodoManager instance
+        options: Parsed command-line options
+    """
     # Main loop
     while True:
         display_menu()
 
-        # Get user command
-        command = input("Enter command: ").strip().lower()
+        # Get user command and its options
+        words = input("Enter command: ").split()
+        command = words[0].lower() if words else ""
 
         # Route command
         if command == "add":
             handle_add_command(manager)
         elif command == "view":
-            handle_view_command(manager)
+            handle_view_command(manager, words[1:])
+        elif command == "search":
+            handle_search_command(manager, words[1:])
         elif command == "update":
             handle_update_command(manager)
         elif command == "delete":
@@ -396,7 +917,10 @@ def main() -> None:
         elif command == "incomplete":
             handle_incomplete_command(manager)
         elif command == "quit" or command == "exit":
-            print("\nGoodbye! All tasks have been cleared from memory.")
+            if options.data_dir:
+                print("\nGoodbye! Your tasks have been saved.")
+            else:
+                print("\nGoodbye! All tasks have been cleared from memory.")
             break
         elif command == "":
             # Empty input, just show menu again
@@ -405,6 +929,10 @@ def main() -> None:
             print(f"\nError: Unknown command: '{command}'")
             print("Type 'view' to see available commands.")
 
+        # The journal writes on its next change or at exit; the user may
+        # close the terminal first, so save what was just reported as done
+        manager.flush()
+
 
 if __name__ == "__main__":
     main()
@@ -4,9 +4,17 @@ Data models for the Todo application.
 This module defines the Task data structure and validation logic.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+import sys
+import time
+
+_NANOSECONDS = 1_000_000_000
+
+# Last timestamp handed out; creation times never go backwards, so tasks in
+# ID order are also in creation order
+_last_timestamp = 0
+
+# (seconds, text) of the last second format_timestamp formatted
+_last_formatted = (None, "")
 
 
 class ValidationError(Exception):
@@ -15,7 +23,92 @@ class ValidationError(Exception):
     pass
 
 
-@dataclass
+class TextPool:
+    """
+    Shares one str object per distinct task title or description.
+
+    Many tasks repeat the same text ("Daily standup", boilerplate
+    descriptions), but every validated or loaded value is a new str.
+    intern() returns the first str seen with a value instead, so duplicates
+    are freed as soon as the caller drops them.
+
+    The pool holds on to its strings, also after their tasks are deleted,
+    so it stops taking new values once it holds max_size of them; values
+    seen after that are returned unshared.
+    """
+
+    __slots__ = ("_strings", "_duplicates", "max_size", "requests")
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size: Most distinct strings kept (0 disables sharing)
+        """
+        self._strings: dict[str, str] = {}
+        # Pooled string -> number of equal copies it replaced
+        self._duplicates: dict[str, int] = {}
+        self.max_size = max_size
+        self.requests = 0
+
+    def intern(self, text: str) -> str:
+        """
+        Return the pooled str equal to text, adding text if it is new.
+
+        Args:
+            text: A title or description
+
+        Returns:
+            An equal str, shared with every other task using this value
+        """
+        if not text:
+            # Python already shares the empty string
+            return text
+        self.requests += 1
+        shared = self._strings.get(text)
+        if shared is None:
+            if len(self._strings) < self.max_size:
+                self._strings[text] = text
+            return text
+        if shared is not text:
+            duplicates = self._duplicates
+            duplicates[shared] = duplicates.get(shared, 0) + 1
+        return shared
+
+    def stats(self) -> dict[str, int]:
+        """
+        Report how much text the pool deduplicates.
+
+        Sizes are computed here rather than on every intern() call, so this
+        takes time proportional to the number of pooled strings.
+
+        Returns:
+            A dict with "total" (non-empty strings interned), "distinct"
+            (strings pooled), "pooled_bytes" (their size) and "saved_bytes"
+            (size of the duplicates replaced by pooled strings)
+        """
+        return {
+            "total": self.requests,
+            "distinct": len(self._strings),
+            "pooled_bytes": sum(map(sys.getsizeof, self._strings)),
+            "saved_bytes": sum(
+                sys.getsizeof(text) * count
+                for text, count in self._duplicates.items()
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop all pooled strings and reset the statistics."""
+        self._strings.clear()
+        self._duplicates.clear()
+        self.requests = 0
+
+
+# Pool shared by Task.create, TodoManager and the persistence loaders
+text_pool = TextPool()
+
+
 class Task:
     """
     Represents a single todo task.
@@ -25,14 +118,61 @@ class Task:
         title: Task title, required, 1-200 characters
         description: Optional details, 0-1000 characters
         status: Completion status, False=incomplete, True=complete
-        created_at: ISO 8601 timestamp, auto-generated, immutable
+        created_at: Creation time in nanoseconds since the epoch,
+            auto-generated, immutable (see format_timestamp)
+
+    A plain slotted class rather than a dataclass, so that importing this
+    module (which every command does) does not load the dataclasses module.
     """
 
-    id: int
-    title: str
-    description: str
-    status: bool
-    created_at: str
+    __slots__ = ("id", "title", "description", "status", "created_at")
+
+    def __init__(
+        self, id: int, title: str, description: str, status: bool, created_at: int
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.created_at = created_at
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return (
+                self.id == other.id
+                and self.title == other.title
+                and self.description == other.description
+                and self.status == other.status
+                and self.created_at == other.created_at
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, "
+            f"description={self.description!r}, status={self.status!r}, "
+            f"created_at={self.created_at!r})"
+        )
+
+    def copy_with(self, **changes) -> "Task":
+        """
+        Return a copy of this task with some fields changed.
+
+        Args:
+            **changes: Field names mapped to their new values
+
+        Returns:
+            A new Task instance
+        """
+        return Task(
+            changes.get("id", self.id),
+            changes.get("title", self.title),
+            changes.get("description", self.description),
+            changes.get("status", self.status),
+            changes.get("created_at", self.created_at),
+        )
 
     @staticmethod
     def validate_title(title: str) -> str:
@@ -91,21 +231,28 @@ class Task:
         return description
 
     @staticmethod
-    def generate_timestamp() -> str:
+    def generate_timestamp() -> int:
         """
-        Generate an ISO 8601 timestamp for the current time.
+        Generate a creation timestamp for the current time.
+
+        Timestamps never decrease, even if the system clock is set back.
 
         Returns:
-            ISO 8601 formatted timestamp string
+            Nanoseconds since the epoch
         """
-        return datetime.now().isoformat()
+        global _last_timestamp
+        timestamp = time.time_ns()
+        if timestamp < _last_timestamp:
+            timestamp = _last_timestamp
+        _last_timestamp = timestamp
+        return timestamp
 
     @classmethod
     def create(
         cls,
         task_id: int,
         title: str,
-        description: Optional[str] = None,
+        description: str | None = None,
     ) -> "Task":
         """
         Create a new Task instance with validation.
@@ -131,11 +278,66 @@ class Task:
         # Generate timestamp
         timestamp = cls.generate_timestamp()
 
-        # Create task with default status (incomplete)
+        # Create task with default status (incomplete), sharing repeated text
         return cls(
             id=task_id,
-            title=validated_title,
-            description=validated_description,
+            title=text_pool.intern(validated_title),
+            description=text_pool.intern(validated_description),
             status=False,
             created_at=timestamp,
         )
+
+
+def observe_timestamp(timestamp: int) -> None:
+    """
+    Keep future timestamps at or after an existing one.
+
+    Called for tasks loaded from disk, whose creation times may be later
+    than the current clock.
+
+    Args:
+        timestamp: A creation time in nanoseconds since the epoch
+    """
+    global _last_timestamp
+    if timestamp > _last_timestamp:
+        _last_timestamp = timestamp
+
+
+def datetime_to_timestamp(moment) -> int:
+    """
+    Convert a datetime to a creation timestamp.
+
+    Args:
+        moment: A datetime.datetime (naive = local time)
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    seconds = int(moment.replace(microsecond=0).timestamp())
+    return seconds * _NANOSECONDS + moment.microsecond * 1000
+
+
+def format_timestamp(timestamp: int) -> str:
+    """
+    Format a creation timestamp for display or serialization.
+
+    Produces the same text as datetime.isoformat() for the local time,
+    without importing the datetime module.
+
+    Args:
+        timestamp: Nanoseconds since the epoch
+
+    Returns:
+        ISO 8601 formatted local time (microseconds shown only if nonzero)
+    """
+    global _last_formatted
+    seconds, nanoseconds = divmod(timestamp, _NANOSECONDS)
+    # Neighbouring tasks are usually created in the same second
+    formatted_seconds, text = _last_formatted
+    if seconds != formatted_seconds:
+        text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        _last_formatted = (seconds, text)
+    microseconds = nanoseconds // 1000
+    if microseconds:
+        return f"{text}.{microseconds:06d}"
+    return text
@@ -0,0 +1,402 @@
+"""
+Optional on-disk persistence for the Todo application.
+
+This module keeps TodoManager state across restarts using two files in a
+data directory:
+
+- journal.bin: an append-only binary log of add/update/delete/status
+  operations, written with group commit
+- snapshot.bin: a compacted image of all tasks, rewritten periodically so
+  the journal stays short
+
+Recovery loads the snapshot through mmap and replays the journal on top.
+"""
+
+import mmap
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import ExitStack
+
+from models import Task, observe_timestamp, text_pool
+
+# fsync policies
+FSYNC_ALWAYS = "always"  # write and fsync every operation before returning
+FSYNC_BATCH = "batch"  # write and fsync once per commit group
+FSYNC_NEVER = "never"  # write once per commit group, let the OS flush
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_BATCH, FSYNC_NEVER)
+
+# Journal operation codes
+OP_ADD = 1
+OP_UPDATE = 2
+OP_DELETE = 3
+OP_COMPLETE = 4
+OP_INCOMPLETE = 5
+
+JOURNAL_NAME = "journal.bin"
+SNAPSHOT_NAME = "snapshot.bin"
+
+# File headers: magic + generation. A journal is only replayed on top of the
+# snapshot with the same generation, so a crash between writing a snapshot
+# and resetting the journal never applies operations twice.
+_JOURNAL_MAGIC = b"TODOJNL2"
+_SNAPSHOT_MAGIC = b"TODOSNP2"
+_JOURNAL_HEADER = struct.Struct("<8sQ")
+_SNAPSHOT_HEADER = struct.Struct("<8sQqQ")  # magic, generation, next_id, count
+
+# Journal record: crc32, then op, task_id, title/description lengths and
+# created_at (nanoseconds), then the text. The CRC covers everything after
+# itself, so a torn tail is detected.
+_CRC = struct.Struct("<I")
+_RECORD_BODY = struct.Struct("<BqHHq")
+_RECORD_SIZE = _CRC.size + _RECORD_BODY.size
+# Snapshot row: task_id, status, title/description lengths, created_at
+_ROW = struct.Struct("<qBHHq")
+
+
+class PersistenceError(Exception):
+    """Raised when persisted data cannot be read."""
+
+    pass
+
+
+class TaskJournal:
+    """
+    Append-only journal with periodic snapshots for one data directory.
+
+    Operations are encoded into an in-memory buffer and written to disk as a
+    group once group_size operations are pending, or by the first operation
+    appended group_interval seconds or more after the last write. Nothing is
+    written on a timer: an operation followed by idle time stays buffered
+    until flush() or close(), so callers that wait for input (such as the
+    interactive menu) must flush after each command.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        fsync: str = FSYNC_BATCH,
+        group_size: int = 64,
+        group_interval: float = 0.05,
+        snapshot_every: int = 100_000,
+    ) -> None:
+        """
+        Initialize a journal for the given data directory.
+
+        Args:
+            directory: Directory holding journal.bin and snapshot.bin
+            fsync: One of FSYNC_ALWAYS, FSYNC_BATCH, FSYNC_NEVER
+            group_size: Operations per commit group
+            group_interval: Seconds after the last write from which the next
+                appended operation writes the group out, even if not full
+            snapshot_every: Journal length (in operations) that triggers a
+                new snapshot
+
+        Raises:
+            ValueError: If fsync is not a known policy
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+
+        self._directory = directory
+        self._fsync = fsync
+        self._group_size = 1 if fsync == FSYNC_ALWAYS else group_size
+        self._group_interval = group_interval
+        self._snapshot_every = snapshot_every
+
+        self._store = None
+        self._next_id = 1
+        self._generation = 0
+        self._file = None
+        self._buffer = bytearray()
+        self._pending = 0
+        self._journal_length = 0
+        self._last_write = time.monotonic()
+
+    # ------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------
+
+    def open(self, store) -> int:
+        """
+        Load persisted tasks into an empty store and start journaling.
+
+        Args:
+            store: The (empty) storage engine to recover into
+
+        Returns:
+            The next task ID to allocate
+
+        Raises:
+            PersistenceError: If the snapshot or journal is unreadable
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        self._store = store
+
+        self._generation, self._next_id = self._load_snapshot(store)
+        journal_path = os.path.join(self._directory, JOURNAL_NAME)
+        valid_length = self._replay_journal(journal_path, store)
+
+        if valid_length is None:
+            # Missing or stale journal: start a fresh one for this generation
+            self._file = self._create_journal(journal_path)
+        else:
+            # Drop any torn record at the tail, then append after it
+            with ExitStack() as on_error:
+                journal = on_error.enter_context(open(journal_path, "r+b"))
+                journal.truncate(valid_length)
+                journal.seek(valid_length)
+                # Keep the journal open once it is ready
+                on_error.pop_all()
+            self._file = journal
+
+        return self._next_id
+
+    def _load_snapshot(self, store) -> tuple[int, int]:
+        """Load snapshot.bin into the store; return (generation, next_id)."""
+        path = os.path.join(self._directory, SNAPSHOT_NAME)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return (0, 1)
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            magic, generation, next_id, count = _SNAPSHOT_HEADER.unpack_from(data)
+            if magic != _SNAPSHOT_MAGIC:
+                raise PersistenceError(
+                    f"Not a snapshot file, or written in an older format: {path}"
+                )
+
+            offset = _SNAPSHOT_HEADER.size
+            created_at = 0
+            for _ in range(count):
+                task_id, status, title_len, desc_len, created_at = _ROW.unpack_from(
+                    data, offset
+                )
+                offset += _ROW.size
+                title, description, offset = _read_text(
+                    data, offset, title_len, desc_len
+                )
+                store.add(Task(task_id, title, description, bool(status), created_at))
+            observe_timestamp(created_at)
+
+        return (generation, next_id)
+
+    def _replay_journal(self, path: str, store) -> int | None:
+        """
+        Apply journal.bin to the store.
+
+        Returns:
+            The length of the valid journal prefix, or None if the journal is
+            missing or belongs to an older snapshot
+
+        Raises:
+            PersistenceError: If the file is not a journal in this format
+        """
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _JOURNAL_HEADER.size:
+            return None
+        magic, generation = _JOURNAL_HEADER.unpack_from(data)
+        if magic != _JOURNAL_MAGIC:
+            raise PersistenceError(
+                f"Not a journal file, or written in an older format: {path}"
+            )
+        if generation != self._generation:
+            return None
+
+        offset = _JOURNAL_HEADER.size
+        for op, task_id, title, description, created_at, end in _iter_records(
+            data, offset
+        ):
+            self._apply(store, op, task_id, title, description, created_at)
+            self._journal_length += 1
+            offset = end
+        return offset
+
+    def _apply(self, store, op, task_id, title, description, created_at) -> None:
+        """Apply one journal operation to the store."""
+        if op == OP_ADD:
+            store.add(Task(task_id, title, description, False, created_at))
+            observe_timestamp(created_at)
+            self._next_id = max(self._next_id, task_id + 1)
+        elif op == OP_UPDATE:
+            store.replace(task_id, title=title, description=description)
+        elif op == OP_DELETE:
+            store.remove(task_id)
+        elif op == OP_COMPLETE:
+            store.replace(task_id, status=True)
+        elif op == OP_INCOMPLETE:
+            store.replace(task_id, status=False)
+
+    def _create_journal(self, path: str):
+        """Create an empty journal for the current generation."""
+        with ExitStack() as on_error:
+            journal = on_error.enter_context(open(path, "wb"))
+            journal.write(_JOURNAL_HEADER.pack(_JOURNAL_MAGIC, self._generation))
+            journal.flush()
+            if self._fsync != FSYNC_NEVER:
+                os.fsync(journal.fileno())
+            # Keep the journal open once it is written
+            on_error.pop_all()
+        self._journal_length = 0
+        return journal
+
+    # ------------------------------------------------------------
+    # Recording operations
+    # ------------------------------------------------------------
+
+    def record_add(self, task: Task) -> None:
+        """Record a newly added task."""
+        self._next_id = max(self._next_id, task.id + 1)
+        self._append(OP_ADD, task.id, task.title, task.description, task.created_at)
+
+    def record_update(self, task: Task) -> None:
+        """Record a task's title and description after an update."""
+        self._append(OP_UPDATE, task.id, task.title, task.description, 0)
+
+    def record_delete(self, task_id: int) -> None:
+        """Record a deleted task."""
+        self._append(OP_DELETE, task_id, "", "", 0)
+
+    def record_status(self, task_id: int, status: bool) -> None:
+        """Record a task's new completion status."""
+        self._append(OP_COMPLETE if status else OP_INCOMPLETE, task_id, "", "", 0)
+
+    def _append(
+        self, op: int, task_id: int, title: str, description: str, created_at: int
+    ) -> None:
+        """Encode one operation into the buffer and commit the group if due."""
+        title_bytes = title.encode("utf-8")
+        desc_bytes = description.encode("utf-8")
+        body = _RECORD_BODY.pack(
+            op, task_id, len(title_bytes), len(desc_bytes), created_at
+        )
+        payload = title_bytes + desc_bytes
+        self._buffer += _CRC.pack(zlib.crc32(payload, zlib.crc32(body)))
+        self._buffer += body
+        self._buffer += payload
+        self._pending += 1
+        self._journal_length += 1
+
+        if (
+            self._pending >= self._group_size
+            or time.monotonic() - self._last_write >= self._group_interval
+        ):
+            self.flush()
+        if self._journal_length >= self._snapshot_every:
+            self.checkpoint()
+
+    def flush(self) -> None:
+        """Write all buffered operations, syncing them per the fsync policy."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            if self._fsync != FSYNC_NEVER:
+                os.fsync(self._file.fileno())
+            self._buffer.clear()
+            self._pending = 0
+        self._last_write = time.monotonic()
+
+    # ------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------
+
+    def checkpoint(self) -> None:
+        """
+        Write a compacted snapshot of the store and start a new journal.
+
+        The snapshot is written to a temporary file and atomically renamed,
+        so a crash at any point leaves a consistent snapshot/journal pair.
+        """
+        self.flush()
+        generation = self._generation + 1
+        path = os.path.join(self._directory, SNAPSHOT_NAME)
+        temp_path = os.path.splitext(path)[0] + ".tmp"
+
+        with open(temp_path, "wb") as f:
+            f.write(
+                _SNAPSHOT_HEADER.pack(
+                    _SNAPSHOT_MAGIC, generation, self._next_id, len(self._store)
+                )
+            )
+            for chunk in _encode_rows(self._store.values()):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+        self._generation = generation
+        self._file.close()
+        self._file = self._create_journal(
+            os.path.join(self._directory, JOURNAL_NAME)
+        )
+
+    def close(self) -> None:
+        """Flush pending operations and close the journal."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+
+def _read_text(data, offset, title_len, desc_len):
+    """Decode the title and description that follow a header."""
+    title = text_pool.intern(data[offset : offset + title_len].decode("utf-8"))
+    offset += title_len
+    description = text_pool.intern(
+        data[offset : offset + desc_len].decode("utf-8")
+    )
+    offset += desc_len
+    return title, description, offset
+
+
+def _iter_records(data: bytes, offset: int) -> Iterator[tuple]:
+    """
+    Decode journal records starting at offset.
+
+    Stops at the first truncated or corrupt record, which can only be a
+    partially written tail left by a crash.
+
+    Yields:
+        (op, task_id, title, description, created_at, end_offset) tuples
+    """
+    size = len(data)
+    while offset + _RECORD_SIZE <= size:
+        (crc,) = _CRC.unpack_from(data, offset)
+        op, task_id, title_len, desc_len, created_at = _RECORD_BODY.unpack_from(
+            data, offset + _CRC.size
+        )
+        end = offset + _RECORD_SIZE + title_len + desc_len
+        if end > size or zlib.crc32(data[offset + _CRC.size : end]) != crc:
+            return
+        title, description, _ = _read_text(
+            data, offset + _RECORD_SIZE, title_len, desc_len
+        )
+        yield (op, task_id, title, description, created_at, end)
+        offset = end
+
+
+def _encode_rows(tasks, chunk_rows: int = 4096) -> Iterator[bytes]:
+    """Encode tasks as snapshot rows, yielding them in chunks."""
+    chunk = bytearray()
+    rows = 0
+    for task in tasks:
+        title = task.title.encode("utf-8")
+        description = task.description.encode("utf-8")
+        chunk += _ROW.pack(
+            task.id, task.status, len(title), len(description), task.created_at
+        )
+        chunk += title + description
+        rows += 1
+        if rows == chunk_rows:
+            yield bytes(chunk)
+            chunk.clear()
+            rows = 0
+    if chunk:
+        yield bytes(chunk)
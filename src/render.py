@@ -0,0 +1,242 @@
+"""
+Text rendering for task lists in the Todo application.
+
+Task lists are formatted lazily: renderers are generators of text chunks,
+and write_buffered() joins those chunks into large writes. Nothing here
+needs the whole list in memory, so a page of output costs the same no
+matter how many tasks exist.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from io import TextIOBase
+
+from models import format_timestamp
+
+HEAVY_RULE = "=" * 60
+LIGHT_RULE = "-" * 60
+
+# Flush rendered text once this many characters are pending
+_BUFFER_SIZE = 64 * 1024
+
+_TABLE_HEADER = (
+    f"{'ID':>6}  Done  {'Created':<16}  Title\n"
+    f"{'-' * 6}  ----  {'-' * 16}  {'-' * 30}\n"
+)
+
+
+def format_status(status: bool) -> str:
+    """
+    Format task status for display.
+
+    Args:
+        status: The task status (True=complete, False=incomplete)
+
+    Returns:
+        Formatted status string
+    """
+    return "Complete" if status else "Incomplete"
+
+
+def format_task(task) -> str:
+    """
+    Format a single task with all details.
+
+    Args:
+        task: The task to format
+
+    Returns:
+        The task block, starting with a blank line
+    """
+    lines = [f"\nTask #{task.id}", f"Title: {task.title}"]
+
+    if task.description:
+        # Handle multiline descriptions
+        if "\n" in task.description:
+            lines.append("Description:")
+            lines.extend(f"  {line}" for line in task.description.split("\n"))
+        else:
+            lines.append(f"Description: {task.description}")
+
+    lines.append(f"Status: {format_status(task.status)}")
+    lines.append(f"Created: {format_timestamp(task.created_at)}")
+    return "\n".join(lines) + "\n"
+
+
+def format_task_row(task) -> str:
+    """
+    Format a task as one compact table row.
+
+    Args:
+        task: The task to format
+
+    Returns:
+        The row, ending with a newline
+    """
+    done = "[x]" if task.status else "[ ]"
+    created = format_timestamp(task.created_at)[:16].replace("T", " ")
+    return f"{task.id:>6}  {done}   {created:<16}  {task.title}\n"
+
+
+def render_tasks(tasks: Iterable, compact: bool = False) -> Iterator[str]:
+    """
+    Render tasks one chunk at a time.
+
+    Args:
+        tasks: Tasks to render, in display order
+        compact: If True, render one table row per task
+
+    Yields:
+        Text chunks
+    """
+    first = True
+    for task in tasks:
+        if compact:
+            # Table header goes above the first row only
+            if first:
+                yield "\n" + _TABLE_HEADER
+            yield format_task_row(task)
+        else:
+            # Add separator between tasks (but not before the first)
+            if not first:
+                yield "\n" + LIGHT_RULE + "\n"
+            yield format_task(task)
+        first = False
+
+
+def _status_label(status: bool | None) -> str:
+    """Return the word used for a status filter ('' when unfiltered)."""
+    if status is None:
+        return ""
+    return "complete " if status else "incomplete "
+
+
+def _empty_message(status: bool | None) -> str:
+    """Return the message shown when a (filtered) list has no tasks."""
+    if status is None:
+        return "\nYour todo list is empty. Use 'add' to create a task.\n"
+    return f"\nNo {_status_label(status)}tasks.\n"
+
+
+def render_task_list(
+    tasks: Iterable, compact: bool = False, status: bool | None = None
+) -> Iterator[str]:
+    """
+    Render a full task list with its summary.
+
+    Counts are gathered while rendering, so tasks may be a one-shot iterator.
+
+    Args:
+        tasks: All tasks, in display order
+        compact: If True, render one table row per task
+        status: The status filter the tasks were selected with, if any
+
+    Yields:
+        Text chunks
+    """
+    yield f"\n{HEAVY_RULE}\nYOUR TODO LIST\n{HEAVY_RULE}\n"
+
+    counts = [0, 0]  # [total, complete]
+
+    def counted(source: Iterable) -> Iterator:
+        for task in source:
+            counts[0] += 1
+            counts[1] += task.status
+            yield task
+
+    yield from render_tasks(counted(tasks), compact)
+
+    total, complete = counts
+    if not total:
+        yield _empty_message(status)
+    elif status is not None:
+        yield f"\n{HEAVY_RULE}\nSummary: {total} {_status_label(status)}task(s)\n"
+    else:
+        incomplete = total - complete
+        yield (
+            f"\n{HEAVY_RULE}\nSummary: {total} task(s) "
+            f"({complete} complete, {incomplete} incomplete)\n"
+        )
+    yield HEAVY_RULE + "\n"
+
+
+def render_page(
+    tasks: Iterable,
+    page: int,
+    size: int,
+    total: int,
+    compact: bool = False,
+    status: bool | None = None,
+) -> Iterator[str]:
+    """
+    Render one page of a task list.
+
+    Args:
+        tasks: The tasks on this page, in display order
+        page: 1-based page number
+        size: Tasks per page
+        total: Total number of tasks in the (filtered) list
+        compact: If True, render one table row per task
+        status: The status filter the tasks were selected with, if any
+
+    Yields:
+        Text chunks
+    """
+    pages = max(1, (total + size - 1) // size)
+    label = _status_label(status)
+    yield f"\n{HEAVY_RULE}\nYOUR TODO LIST\n{HEAVY_RULE}\n"
+
+    if not total:
+        yield _empty_message(status)
+    elif page > pages:
+        yield f"\nPage {page} is empty. The list has {pages} page(s).\n"
+    else:
+        yield from render_tasks(tasks, compact)
+        yield f"\n{HEAVY_RULE}\nPage {page} of {pages} ({total} {label}task(s))\n"
+    yield HEAVY_RULE + "\n"
+
+
+def render_search_results(tasks: list, query: str) -> Iterator[str]:
+    """
+    Render ranked search results.
+
+    Args:
+        tasks: Matching tasks, best match first
+        query: The query that was searched for
+
+    Yields:
+        Text chunks
+    """
+    yield f"\n{HEAVY_RULE}\nSEARCH RESULTS: {query}\n{HEAVY_RULE}\n"
+    if not tasks:
+        yield f"\nNo tasks match '{query}'.\n"
+    else:
+        yield from render_tasks(tasks)
+        yield f"\n{HEAVY_RULE}\nFound {len(tasks)} matching task(s)\n"
+    yield HEAVY_RULE + "\n"
+
+
+def write_buffered(chunks: Iterable[str], out: TextIOBase | None = None) -> None:
+    """
+    Write text chunks using a few large writes instead of many small ones.
+
+    Args:
+        chunks: Text chunks to write
+        out: Output stream (defaults to sys.stdout)
+    """
+    if out is None:
+        out = sys.stdout
+
+    pending = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= _BUFFER_SIZE:
+            out.write("".join(pending))
+            pending.clear()
+            pending_size = 0
+
+    if pending:
+        out.write("".join(pending))
+    out.flush()
@@ -0,0 +1,212 @@
+"""
+Full-text search index for the Todo application.
+
+This module keeps an inverted index from word tokens to the tasks that
+contain them. TodoManager updates it on every add, update and delete, so a
+query only touches the posting lists of its own terms.
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Title words count more than description words when ranking
+TITLE_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into case-insensitive word tokens.
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        The tokens, in order of appearance (duplicates kept)
+    """
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def _term_weights(title: str, description: str) -> dict[str, int]:
+    """Return each token of a task mapped to its weighted frequency."""
+    weights: dict[str, int] = {}
+    for token in tokenize(title):
+        weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+    for token in tokenize(description):
+        weights[token] = weights.get(token, 0) + DESCRIPTION_WEIGHT
+    return weights
+
+
+class SearchIndex:
+    """
+    Inverted index over task titles and descriptions.
+
+    Each token maps to a posting dict of {task_id: weight}, where weight is
+    the token's weighted frequency in that task. Queries are ANDs of terms;
+    a term ending in '*' matches every token with that prefix. Results are
+    ranked by the sum of weight x inverse document frequency over terms.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, dict[int, int]] = {}
+        self._documents = 0
+        # Sorted token list for prefix lookups; tokens added since the last
+        # prefix query wait in _new_tokens
+        self._vocabulary: list[str] = []
+        self._new_tokens: list[str] = []
+
+    def __len__(self) -> int:
+        return self._documents
+
+    def add(self, task_id: int, title: str, description: str) -> None:
+        """
+        Index a task's text.
+
+        Args:
+            task_id: ID of the task
+            title: The task title
+            description: The task description
+        """
+        postings = self._postings
+        for token, weight in _term_weights(title, description).items():
+            posting = postings.get(token)
+            if posting is None:
+                posting = postings[token] = {}
+                self._new_tokens.append(token)
+            posting[task_id] = weight
+        self._documents += 1
+
+    def remove(self, task_id: int, title: str, description: str) -> None:
+        """
+        Remove a task's text from the index.
+
+        Args:
+            task_id: ID of the task
+            title: The title the task was indexed with
+            description: The description the task was indexed with
+        """
+        postings = self._postings
+        for token in _term_weights(title, description):
+            posting = postings.get(token)
+            if posting is not None:
+                posting.pop(task_id, None)
+                if not posting:
+                    # Stale entries in the sorted vocabulary are skipped
+                    del postings[token]
+        self._documents -= 1
+
+    def _expand_prefix(self, prefix: str) -> list[dict[int, int]]:
+        """Return the posting dicts of every token starting with prefix."""
+        if self._new_tokens:
+            self._merge_new_tokens()
+
+        vocabulary = self._vocabulary
+        matches = []
+        for position in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            posting = self._postings.get(token)
+            if posting:
+                matches.append(posting)
+        return matches
+
+    def _merge_new_tokens(self) -> None:
+        """Bring the sorted vocabulary up to date with newly seen tokens."""
+        if len(self._new_tokens) * 64 < len(self._vocabulary):
+            # A few new tokens: insert them in place
+            vocabulary = self._vocabulary
+            for token in self._new_tokens:
+                position = bisect_left(vocabulary, token)
+                # A removed token may still be listed; don't list it twice
+                if position == len(vocabulary) or vocabulary[position] != token:
+                    vocabulary.insert(position, token)
+        else:
+            self._vocabulary = sorted(self._postings)
+        self._new_tokens.clear()
+
+    def _term_postings(self, term: str) -> dict[int, int] | None:
+        """Return {task_id: weight} for one query term, or None if no match."""
+        if not term.endswith("*"):
+            return self._postings.get(term)
+
+        matches = self._expand_prefix(term[:-1])
+        if len(matches) <= 1:
+            return matches[0] if matches else None
+        # A task matching several expansions is weighted by one of them
+        merged: dict[int, int] = {}
+        for posting in matches:
+            merged.update(posting)
+        return merged
+
+    def search(self, query: str, limit: int | None = 20) -> list[tuple[int, float]]:
+        """
+        Find tasks containing every term of a query.
+
+        Args:
+            query: Space-separated terms; a trailing '*' makes a prefix term
+            limit: Maximum number of results (None = all)
+
+        Returns:
+            (task_id, score) pairs, best match first
+        """
+        terms = []
+        for word in query.split():
+            tokens = tokenize(word)
+            if tokens and word.endswith("*"):
+                tokens[-1] += "*"
+            terms.extend(tokens)
+        if not terms:
+            return []
+
+        term_postings = []
+        for term in dict.fromkeys(terms):
+            posting = self._term_postings(term)
+            if not posting:
+                return []
+            term_postings.append(posting)
+
+        # Intersect starting from the rarest term
+        term_postings.sort(key=len)
+        candidates = term_postings[0].keys()
+        for posting in term_postings[1:]:
+            candidates = candidates & posting.keys()
+            if not candidates:
+                return []
+
+        documents = max(self._documents, 1)
+        idfs = [math.log(1 + documents / len(posting)) for posting in term_postings]
+
+        if len(term_postings) == 1:
+            # One term: rank by weight directly, without building score tuples
+            posting, idf = term_postings[0], idfs[0]
+            if limit is None:
+                ranked_ids = sorted(posting, key=posting.get, reverse=True)
+            else:
+                ranked_ids = heapq.nlargest(limit, posting, key=posting.get)
+            return [(task_id, posting[task_id] * idf) for task_id in ranked_ids]
+
+        scored = [
+            (
+                sum(
+                    posting[task_id] * idf
+                    for posting, idf in zip(term_postings, idfs, strict=True)
+                ),
+                task_id,
+            )
+            for task_id in candidates
+        ]
+
+        def rank(item: tuple[float, int]) -> tuple[float, int]:
+            return (-item[0], item[1])
+
+        if limit is None:
+            ranked = sorted(scored, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, scored, key=rank)
+        return [(task_id, score) for score, task_id in ranked]
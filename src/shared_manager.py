@@ -0,0 +1,756 @@
+"""
+Shared-memory TodoManager for several processes working on one task list.
+
+The task table lives in a memory-mapped file (tasks.shared in the data
+directory) that every process maps, so reads and writes go straight to
+shared memory, with no server process. A lock on a separate file
+(tasks.lock) serializes access between processes: reads take it shared,
+writes exclusive. The next task ID is kept in the table's header and only
+allocated under the exclusive lock, so IDs stay unique across processes.
+
+The table uses the layout of ColumnarTaskStore: fixed-width columns for ID,
+creation time, text offset, text lengths and status, followed by a heap of
+UTF-8 titles and descriptions. When a column or the heap is full, the table
+is rebuilt into a larger file without deleted rows and stale text; other
+processes see the bumped generation number and remap the new file the next
+time they take the lock.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import wraps
+from itertools import compress, takewhile
+
+from models import Task, observe_timestamp
+from persistence import PersistenceError
+from todo_manager import TodoManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DATA_NAME = "tasks.shared"
+LOCK_NAME = "tasks.lock"
+
+_MAGIC = b"TODOSHM1"
+_HEADER_SIZE = 128
+
+# Header counters: unsigned 64-bit integers following the magic
+(
+    _GENERATION,
+    _CAPACITY,
+    _TEXT_CAPACITY,
+    _NEXT_ID,
+    _ROWS,
+    _LIVE,
+    _COMPLETE_COUNT,
+    _TEXT_USED,
+    _GARBAGE,
+    _VERSION,
+) = range(10)
+_COUNTERS = 10
+
+_INITIAL_CAPACITY = 1024
+_INITIAL_TEXT_CAPACITY = 64 * 1024
+
+# Tasks copied out per hold of the lock when iterating over the table
+READ_CHUNK = 1024
+
+# Status byte values
+_INCOMPLETE = 0
+_COMPLETE = 1
+_DELETED = 2
+
+# Maps status bytes to 1 for live rows and 0 for tombstones
+_LIVE_TABLE = bytes(0 if value == _DELETED else 1 for value in range(256))
+
+
+def _layout(capacity: int) -> tuple[int, ...]:
+    """
+    Return the file offsets of the columns and the text heap.
+
+    Returns:
+        (ids, created, text_offset, title_length, desc_length, status, text)
+    """
+    ids = _HEADER_SIZE
+    created = ids + 8 * capacity
+    text_offset = created + 8 * capacity
+    title_length = text_offset + 8 * capacity
+    desc_length = title_length + 2 * capacity
+    status = desc_length + 2 * capacity
+    text = status + capacity
+    return (ids, created, text_offset, title_length, desc_length, status, text)
+
+
+class _FileLock:
+    """
+    Cross-process reader/writer lock on a lock file.
+
+    The lock is reentrant within a process, and threads of one process take
+    turns holding it. flock() is used where available; Windows has no
+    shared mode, so there readers lock exclusively too.
+    """
+
+    def __init__(self, path: str) -> None:
+        # A bare descriptor: it only carries the lock, never data
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._exclusive = False
+
+    @contextmanager
+    def hold(self, exclusive: bool):
+        """Hold the lock for the duration of a with block."""
+        with self._thread_lock:
+            if not self._depth:
+                self._acquire(exclusive)
+                self._exclusive = exclusive
+            elif exclusive and not self._exclusive:
+                raise RuntimeError("Cannot upgrade a shared lock to exclusive")
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if not self._depth:
+                    self._release()
+
+    def _acquire(self, exclusive: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            return
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after about ten seconds; keep waiting
+                continue
+
+    def _release(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class SharedTaskStore:
+    """
+    Columnar task table in a memory-mapped file shared between processes.
+
+    Implements the storage interface of storage.py. Tasks are handed out as
+    standalone Task copies, since another process may change a task at any
+    time. Every method must be called while holding lock();
+    SharedTodoManager takes care of that.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Open (or create) the shared table in a directory.
+
+        Args:
+            directory: Data directory holding tasks.shared and tasks.lock
+
+        Raises:
+            PersistenceError: If tasks.shared is not a shared task table
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._path = os.path.join(directory, DATA_NAME)
+        self._lock = _FileLock(os.path.join(directory, LOCK_NAME))
+        self._map = None
+        self._views = []
+        self._generation = None
+        # (version, IDs of live rows), built on demand for positional lookups
+        self._live_ids = (None, None)
+
+        try:
+            with self._lock.hold(exclusive=True):
+                if not os.path.exists(self._path) or not os.path.getsize(self._path):
+                    self._create()
+                self._remap()
+        except BaseException:
+            self._lock.close()
+            raise
+
+    @contextmanager
+    def lock(self, exclusive: bool = False):
+        """
+        Hold the cross-process lock for the duration of a with block.
+
+        Remaps the table first if another process has rebuilt it.
+
+        Args:
+            exclusive: True for writes, False for reads
+        """
+        with self._lock.hold(exclusive):
+            if self._header[_GENERATION] != self._generation:
+                self._remap()
+            yield
+
+    def close(self) -> None:
+        """Write changes back to the file and unmap it."""
+        if self._map is not None:
+            self._map.flush()
+            self._unmap()
+            self._lock.close()
+
+    # ------------------------------------------------------------
+    # Mapping
+    # ------------------------------------------------------------
+
+    def _create(self) -> None:
+        """Write an empty table."""
+        counters = [0] * _COUNTERS
+        counters[_GENERATION] = 1
+        counters[_CAPACITY] = _INITIAL_CAPACITY
+        counters[_TEXT_CAPACITY] = _INITIAL_TEXT_CAPACITY
+        counters[_NEXT_ID] = 1
+        size = _layout(_INITIAL_CAPACITY)[-1] + _INITIAL_TEXT_CAPACITY
+        with open(self._path, "wb") as f:
+            f.write(_MAGIC + struct.pack(f"<{_COUNTERS}Q", *counters))
+            f.truncate(size)
+
+    def _remap(self) -> None:
+        """Map the table file and set up views of its header and columns."""
+        self._unmap()
+        with open(self._path, "r+b") as f:
+            self._map = mmap.mmap(f.fileno(), 0)
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            self._unmap()
+            raise PersistenceError(f"Not a shared task table: {self._path}")
+
+        view = memoryview(self._map)
+        self._header = view[len(_MAGIC) : len(_MAGIC) + 8 * _COUNTERS].cast("Q")
+        capacity = self._header[_CAPACITY]
+        ids, created, offset, title_len, desc_len, status, text = _layout(capacity)
+        if len(self._map) < text + self._header[_TEXT_CAPACITY]:
+            self._unmap()
+            raise PersistenceError(f"Shared task table is truncated: {self._path}")
+
+        self._ids = view[ids:created].cast("q")
+        self._created = view[created:offset].cast("q")
+        self._text_offset = view[offset:title_len].cast("Q")
+        self._title_length = view[title_len:desc_len].cast("H")
+        self._desc_length = view[desc_len:status].cast("H")
+        self._status = view[status:text]
+        self._status_start = status
+        self._text_start = text
+        self._views = [
+            self._header,
+            self._ids,
+            self._created,
+            self._text_offset,
+            self._title_length,
+            self._desc_length,
+            self._status,
+            view,
+        ]
+        self._generation = self._header[_GENERATION]
+        self._live_ids = (None, None)
+
+    def _unmap(self) -> None:
+        """Release all views and the mapping."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _reserve(self, rows: int, text_bytes: int) -> None:
+        """Make room for more rows and text, rebuilding the table if needed."""
+        header = self._header
+        if (
+            header[_ROWS] + rows <= header[_CAPACITY]
+            and header[_TEXT_USED] + text_bytes <= header[_TEXT_CAPACITY]
+        ):
+            return
+
+        # The rebuild drops tombstones and stale text; keep a quarter free
+        capacity = header[_CAPACITY]
+        while (header[_LIVE] + rows) * 4 > capacity * 3:
+            capacity *= 2
+        text_capacity = header[_TEXT_CAPACITY]
+        live_text = header[_TEXT_USED] - header[_GARBAGE]
+        while (live_text + text_bytes) * 4 > text_capacity * 3:
+            text_capacity *= 2
+        self._rebuild(capacity, text_capacity)
+
+    def _rebuild(self, capacity: int, text_capacity: int) -> None:
+        """
+        Write the live rows into a new table file and switch to it.
+
+        The old file is marked stale before the new one replaces it, so
+        other processes remap on their next lock, and a crash in between
+        leaves the old (still complete) table in place.
+        """
+        header = self._header
+        rows = header[_ROWS]
+        keep = list(
+            compress(range(rows), bytes(self._status[:rows]).translate(_LIVE_TABLE))
+        )
+        free = capacity - len(keep)
+
+        lengths = [self._title_length[row] + self._desc_length[row] for row in keep]
+        offsets = array("Q", [0] * len(keep))
+        text_used = 0
+        for position, length in enumerate(lengths):
+            offsets[position] = text_used
+            text_used += length
+
+        counters = list(header)
+        counters[_GENERATION] += 1
+        counters[_CAPACITY] = capacity
+        counters[_TEXT_CAPACITY] = text_capacity
+        counters[_ROWS] = len(keep)
+        counters[_TEXT_USED] = text_used
+        counters[_GARBAGE] = 0
+        counters[_VERSION] += 1
+
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_MAGIC + struct.pack(f"<{_COUNTERS}Q", *counters))
+            f.seek(_HEADER_SIZE)
+            for column, typecode in (
+                (self._ids, "q"),
+                (self._created, "q"),
+                (None, "Q"),
+                (self._title_length, "H"),
+                (self._desc_length, "H"),
+            ):
+                values = offsets if column is None else array(
+                    typecode, [column[row] for row in keep]
+                )
+                f.write(values.tobytes())
+                f.write(bytes(values.itemsize * free))
+            f.write(bytes(self._status[row] for row in keep))
+            f.write(bytes(free))
+
+            text_start = self._text_start
+            chunk = bytearray()
+            for row, length in zip(keep, lengths, strict=True):
+                start = text_start + self._text_offset[row]
+                chunk += self._map[start : start + length]
+                if len(chunk) >= 1 << 20:
+                    f.write(chunk)
+                    chunk.clear()
+            f.write(chunk)
+            f.truncate(_layout(capacity)[-1] + text_capacity)
+
+        header[_GENERATION] = counters[_GENERATION]
+        os.replace(temp_path, self._path)
+        self._remap()
+
+    # ------------------------------------------------------------
+    # Header values
+    # ------------------------------------------------------------
+
+    @property
+    def next_id(self) -> int:
+        """The next task ID to allocate."""
+        return self._header[_NEXT_ID]
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every change, from any process."""
+        return self._header[_VERSION]
+
+    def last_created(self) -> int:
+        """Return the creation time of the newest row (0 if empty)."""
+        rows = self._header[_ROWS]
+        return self._created[rows - 1] if rows else 0
+
+    # ------------------------------------------------------------
+    # Storage interface
+    # ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._header[_LIVE]
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._find_row(task_id) >= 0
+
+    def _find_row(self, task_id: int) -> int:
+        """Return the row holding a live task, or -1 if there is none."""
+        rows = self._header[_ROWS]
+        row = bisect_left(self._ids, task_id, 0, rows)
+        if row < rows and self._ids[row] == task_id and self._status[row] != _DELETED:
+            return row
+        return -1
+
+    def _task_at(self, row: int) -> Task:
+        """Read the task in a row."""
+        title_length = self._title_length[row]
+        start = self._text_start + self._text_offset[row]
+        text = self._map[start : start + title_length + self._desc_length[row]]
+        return Task(
+            self._ids[row],
+            text[:title_length].decode("utf-8"),
+            text[title_length:].decode("utf-8"),
+            self._status[row] == _COMPLETE,
+            self._created[row],
+        )
+
+    def _append_text(self, title: bytes, description: bytes) -> int:
+        """Append a title/description run to the heap; return its offset."""
+        offset = self._header[_TEXT_USED]
+        start = self._text_start + offset
+        end = start + len(title) + len(description)
+        self._map[start:end] = title + description
+        self._header[_TEXT_USED] = offset + end - start
+        return offset
+
+    def add(self, task: Task) -> Task:
+        """
+        Store a new task.
+
+        Args:
+            task: The task to store; its ID must exceed every stored ID
+
+        Returns:
+            The stored task
+
+        Raises:
+            ValueError: If the task ID is not greater than the last stored ID
+        """
+        rows = self._header[_ROWS]
+        if rows and task.id <= self._ids[rows - 1]:
+            raise ValueError(f"Task IDs must be added in increasing order: {task.id}")
+
+        title = task.title.encode("utf-8")
+        description = task.description.encode("utf-8")
+        self._reserve(1, len(title) + len(description))
+
+        header = self._header
+        row = header[_ROWS]
+        self._text_offset[row] = self._append_text(title, description)
+        self._title_length[row] = len(title)
+        self._desc_length[row] = len(description)
+        self._created[row] = task.created_at
+        self._status[row] = _COMPLETE if task.status else _INCOMPLETE
+        self._ids[row] = task.id
+        # Publish the row last
+        header[_ROWS] = row + 1
+        header[_LIVE] += 1
+        header[_COMPLETE_COUNT] += task.status
+        header[_NEXT_ID] = max(header[_NEXT_ID], task.id + 1)
+        header[_VERSION] += 1
+        return task
+
+    def get(self, task_id: int) -> Task | None:
+        """Return a copy of the task with the given ID, or None if absent."""
+        row = self._find_row(task_id)
+        return self._task_at(row) if row >= 0 else None
+
+    def remove(self, task_id: int) -> Task | None:
+        """Remove and return the task with the given ID, or None if absent."""
+        row = self._find_row(task_id)
+        if row < 0:
+            return None
+
+        task = self._task_at(row)
+        header = self._header
+        self._status[row] = _DELETED
+        header[_LIVE] -= 1
+        header[_COMPLETE_COUNT] -= task.status
+        header[_GARBAGE] += self._title_length[row] + self._desc_length[row]
+        header[_VERSION] += 1
+        return task
+
+    def replace(self, task_id: int, **changes) -> Task:
+        """
+        Change fields of a stored task.
+
+        Args:
+            task_id: ID of an existing task
+            **changes: Any of title, description and status
+
+        Returns:
+            A copy of the task after the change
+        """
+        status = changes.pop("status", None)
+        title = changes.pop("title", None)
+        description = changes.pop("description", None)
+        if changes:
+            raise AttributeError(f"Cannot change task fields: {', '.join(changes)}")
+        row = self._find_row(task_id)
+        if row < 0:
+            raise KeyError(task_id)
+
+        header = self._header
+        if title is not None or description is not None:
+            # Text is stored as one title+description run, so rewrite both
+            current = self._task_at(row)
+            title_bytes = (current.title if title is None else title).encode("utf-8")
+            desc_bytes = (
+                current.description if description is None else description
+            ).encode("utf-8")
+            self._reserve(0, len(title_bytes) + len(desc_bytes))
+            row = self._find_row(task_id)
+            header = self._header
+            header[_GARBAGE] += self._title_length[row] + self._desc_length[row]
+            self._text_offset[row] = self._append_text(title_bytes, desc_bytes)
+            self._title_length[row] = len(title_bytes)
+            self._desc_length[row] = len(desc_bytes)
+
+        if status is not None:
+            header[_COMPLETE_COUNT] += bool(status) - (self._status[row] == _COMPLETE)
+            self._status[row] = _COMPLETE if status else _INCOMPLETE
+
+        header[_VERSION] += 1
+        return self._task_at(row)
+
+    def count_complete(self) -> int:
+        """Return the number of complete tasks."""
+        return self._header[_COMPLETE_COUNT]
+
+    def values(self) -> Iterator[Task]:
+        """Iterate over copies of all tasks in ascending ID order."""
+        return self.iter_from(0)
+
+    def iter_from(self, start_id: int, status: bool | None = None) -> Iterator[Task]:
+        """
+        Iterate over copies of tasks with ID >= start_id in ascending ID order.
+
+        Args:
+            start_id: Smallest task ID to include
+            status: If given, only include tasks with this status
+        """
+        rows = self._header[_ROWS]
+        row = bisect_left(self._ids, start_id, 0, rows)
+
+        if status is None:
+            for index in range(row, rows):
+                if self._status[index] != _DELETED:
+                    yield self._task_at(index)
+            return
+
+        # Search the mapped status column for the next matching byte
+        marker = bytes([_COMPLETE if status else _INCOMPLETE])
+        first, end = self._status_start, self._status_start + rows
+        while True:
+            found = self._map.find(marker, first + row, end)
+            if found < 0:
+                return
+            row = found - first
+            yield self._task_at(row)
+            row += 1
+
+    def id_at(self, position: int) -> int | None:
+        """
+        Return the ID of the task at a 0-based position in ID order.
+
+        Args:
+            position: Number of tasks that precede the wanted one
+
+        Returns:
+            The task ID, or None if position is past the end
+        """
+        header = self._header
+        rows = header[_ROWS]
+        ids = self._ids
+        if header[_LIVE] != rows:
+            version, live_ids = self._live_ids
+            if version != header[_VERSION]:
+                live_rows = bytes(self._status[:rows]).translate(_LIVE_TABLE)
+                live_ids = array("q", compress(ids[:rows], live_rows))
+                self._live_ids = (header[_VERSION], live_ids)
+            ids, rows = live_ids, len(live_ids)
+        if 0 <= position < rows:
+            return ids[position]
+        return None
+
+    def id_created_from(self, timestamp: int) -> int | None:
+        """
+        Return the ID of the first task created at or after a timestamp.
+
+        The returned ID may belong to a deleted task; iter_from skips it.
+
+        Args:
+            timestamp: Creation time in nanoseconds since the epoch
+
+        Returns:
+            The task ID, or None if every task was created earlier
+        """
+        rows = self._header[_ROWS]
+        row = bisect_left(self._created, timestamp, 0, rows)
+        if row < rows:
+            return self._ids[row]
+        return None
+
+
+def _write(method):
+    """Run a TodoManager method under the exclusive cross-process lock."""
+
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._store.lock(exclusive=True):
+            self._catch_up()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                # The search index (if any) already includes this change
+                self._seen_version = self._store.version
+
+    return locked
+
+
+def _read(method):
+    """Run a TodoManager read under the shared cross-process lock."""
+
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._store.lock():
+            self._catch_up()
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+def _read_all(method):
+    """Run a TodoManager iteration under the shared lock, collecting it."""
+
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._store.lock():
+            self._catch_up()
+            return iter(list(method(self, *args, **kwargs)))
+
+    return locked
+
+
+class SharedTodoManager(TodoManager):
+    """
+    TodoManager whose tasks are shared by all processes using a directory.
+
+    Each operation runs under a cross-process lock and sees every change
+    made before it by any process:
+    - add/update/delete/complete/incomplete and the bulk operations take
+      the lock exclusively; new IDs come from the shared table
+    - reads take it shared, so processes can read at the same time;
+      iter_page collects its page while holding it
+    - iter_tasks and iter_created_between take it once per READ_CHUNK
+      tasks and release it while those are consumed, so memory stays
+      bounded and a slow consumer does not block writers; each chunk is
+      consistent, and changes made between chunks show up in later ones
+
+    Tasks returned by this manager are copies, unaffected by later changes.
+    The table is the saved state, so no journal is used. A process killed
+    in the middle of a change can leave that one task half-updated.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Open the shared task list in a directory, creating it if needed.
+
+        Args:
+            directory: Data directory shared by the cooperating processes
+        """
+        # Table version the search index reflects
+        self._seen_version = None
+        super().__init__(SharedTaskStore(directory))
+
+    def _catch_up(self) -> None:
+        """Pick up changes other processes made since this one last looked."""
+        store = self._store
+        self._next_id = store.next_id
+        if store.version != self._seen_version:
+            # Rebuilt from the shared table on the next search
+            self._search_index = None
+            self._seen_version = store.version
+        # Keep creation times increasing across processes
+        observe_timestamp(store.last_created())
+
+    # Mutations: one process at a time
+    add_task = _write(TodoManager.add_task)
+    update_task = _write(TodoManager.update_task)
+    delete_task = _write(TodoManager.delete_task)
+    mark_complete = _write(TodoManager.mark_complete)
+    mark_incomplete = _write(TodoManager.mark_incomplete)
+    add_many = _write(TodoManager.add_many)
+    complete_many = _write(TodoManager.complete_many)
+    delete_many = _write(TodoManager.delete_many)
+
+    # Reads: any number of processes at once
+    get_task = _read(TodoManager.get_task)
+    get_all_tasks = _read(TodoManager.get_all_tasks)
+    snapshot = _read(TodoManager.snapshot)
+    count_by_status = _read(TodoManager.count_by_status)
+    task_count = _read(TodoManager.task_count)
+    search = _read(TodoManager.search)
+    iter_page = _read_all(TodoManager.iter_page)
+
+    def iter_tasks(
+        self,
+        start_id: int = 1,
+        limit: int | None = None,
+        status: bool | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over tasks in ID order; see TodoManager.iter_tasks."""
+        return self._iter_chunks(start_id, limit, status)
+
+    def iter_created_between(
+        self,
+        after: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over tasks created in a time range; see TodoManager."""
+        start_id = 1
+        if after is not None:
+            with self._store.lock():
+                self._catch_up()
+                start_id = self._store.id_created_from(after)
+            if start_id is None:
+                return iter(())
+        return self._iter_chunks(start_id, limit, before=before)
+
+    def _iter_chunks(
+        self,
+        start_id: int,
+        limit: int | None,
+        status: bool | None = None,
+        before: int | None = None,
+    ) -> Iterator[Task]:
+        """
+        Copy tasks out READ_CHUNK at a time, each chunk under the lock.
+
+        Args:
+            start_id: Smallest task ID to include
+            limit: Maximum number of tasks to yield (None = no limit)
+            status: Only include tasks with this status (None = all)
+            before: Stop at the first task created at or after this time
+        """
+        while limit is None or limit > 0:
+            size = READ_CHUNK if limit is None else min(limit, READ_CHUNK)
+            with self._store.lock():
+                self._catch_up()
+                chunk = list(TodoManager.iter_tasks(self, start_id, size, status))
+            full = len(chunk) == size
+            if before is not None:
+                in_range = list(takewhile(lambda t: t.created_at < before, chunk))
+                full = full and len(in_range) == size
+                chunk = in_range
+            yield from chunk
+            if not full:
+                return
+            start_id = chunk[-1].id + 1
+            if limit is not None:
+                limit -= size
+
+    def close(self) -> None:
+        """Write changes back to the table file and unmap it."""
+        self._store.close()
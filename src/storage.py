@@ -0,0 +1,846 @@
+"""
+Task storage engines for the Todo application.
+
+This module provides the containers TodoManager keeps its tasks in. All
+engines expose the same small interface (add, get, remove, replace, values,
+iter_from, id_at, id_created_from, count_complete) so the manager can swap
+them without changing its public API. PersistentTaskStore additionally
+hands out immutable TaskSnapshots in constant time.
+
+IDs are allocated monotonically, so every engine requires tasks to be added
+in increasing ID order and can keep them ordered without ever sorting.
+Creation timestamps never decrease either, so ID order is also creation
+order and time ranges can be found by binary search.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
+from itertools import compress, islice
+
+from models import Task
+
+# Status byte values used by the columnar engine
+_INCOMPLETE = 0
+_COMPLETE = 1
+_DELETED = 2
+
+# Compaction is skipped for tiny stores where it cannot pay off
+_MIN_COMPACT_ROWS = 1024
+
+# A status filter sorts the matching IDs instead of walking every task when
+# fewer than 1 in _SPARSE_RATIO tasks match
+_SPARSE_RATIO = 8
+
+# Maps status bytes to 1 for live rows and 0 for tombstones
+_LIVE_TABLE = bytes(0 if value == _DELETED else 1 for value in range(256))
+
+# Fan-out of the persistent trie: each node covers 32 slots, 5 bits of the ID
+_TRIE_BITS = 5
+_TRIE_WIDTH = 1 << _TRIE_BITS
+_TRIE_MASK = _TRIE_WIDTH - 1
+
+
+class DictTaskStore:
+    """
+    Default storage engine: one Task object per task, keyed by ID.
+
+    Tasks handed out by this store are the stored objects themselves. The
+    dict preserves insertion (and therefore ID) order; a separate ascending
+    ID array lets iteration start at any ID. Removed IDs stay in that array
+    until they outnumber live ones, and are skipped during iteration; their
+    positions are kept sorted so that positional lookups can step over them
+    without rebuilding the array.
+
+    Two ID sets index tasks by status, giving constant-time counts and
+    letting a filter for a rare status skip the tasks that don't match.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._tasks: dict[int, Task] = {}
+        self._order = array("q")
+        # Positions in _order of removed IDs, ascending
+        self._removed = array("q")
+        self._complete_ids: set[int] = set()
+        self._incomplete_ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def add(self, task: Task) -> Task:
+        """
+        Store a new task.
+
+        Args:
+            task: The task to store
+
+        Returns:
+            The stored task
+
+        Raises:
+            ValueError: If the task ID is not greater than the last stored ID
+        """
+        if self._order and task.id <= self._order[-1]:
+            raise ValueError(f"Task IDs must be added in increasing order: {task.id}")
+
+        self._tasks[task.id] = task
+        self._order.append(task.id)
+        self._status_ids(task.status).add(task.id)
+        return task
+
+    def _status_ids(self, status: bool) -> set[int]:
+        """Return the ID set for a status."""
+        return self._complete_ids if status else self._incomplete_ids
+
+    def get(self, task_id: int) -> Task | None:
+        """Return the task with the given ID, or None if absent."""
+        return self._tasks.get(task_id)
+
+    def remove(self, task_id: int) -> Task | None:
+        """Remove and return the task with the given ID, or None if absent."""
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        self._status_ids(task.status).discard(task_id)
+        insort(self._removed, bisect_left(self._order, task_id))
+        stale = len(self._removed)
+        if stale >= _MIN_COMPACT_ROWS and stale > len(self._tasks):
+            # Build a new array so iterators over the old one stay valid
+            self._order = array("q", self._tasks)
+            self._removed = array("q")
+        return task
+
+    def replace(self, task_id: int, **changes) -> Task:
+        """
+        Change fields of a stored task.
+
+        Args:
+            task_id: ID of an existing task
+            **changes: Field names mapped to their new values
+
+        Returns:
+            The task after the change
+        """
+        task = self._tasks[task_id]
+        if "status" in changes and changes["status"] != task.status:
+            self._status_ids(task.status).discard(task_id)
+            self._status_ids(changes["status"]).add(task_id)
+        for field, value in changes.items():
+            setattr(task, field, value)
+        return task
+
+    def count_complete(self) -> int:
+        """Return the number of complete tasks."""
+        return len(self._complete_ids)
+
+    def values(self) -> Iterator[Task]:
+        """Iterate over all tasks in ascending ID order."""
+        return iter(self._tasks.values())
+
+    def iter_from(self, start_id: int, status: bool | None = None) -> Iterator[Task]:
+        """
+        Iterate over tasks with ID >= start_id in ascending ID order.
+
+        Args:
+            start_id: Smallest task ID to include
+            status: If given, only include tasks with this status
+        """
+        tasks = self._tasks
+        if status is not None:
+            matching = self._status_ids(status)
+            if len(matching) * _SPARSE_RATIO < len(tasks):
+                # Few matches: visit only their IDs, in order
+                for task_id in sorted(i for i in matching if i >= start_id):
+                    task = tasks.get(task_id)
+                    if task is not None and task.status == status:
+                        yield task
+                return
+
+        order = self._order
+        for position in range(bisect_left(order, start_id), len(order)):
+            task = tasks.get(order[position])
+            if task is not None and (status is None or task.status == status):
+                yield task
+
+    def id_at(self, position: int) -> int | None:
+        """
+        Return the ID of the task at a 0-based position in ID order.
+
+        Args:
+            position: Number of tasks that precede the wanted one
+
+        Returns:
+            The task ID, or None if position is past the end
+        """
+        if not 0 <= position < len(self._tasks):
+            return None
+        # Removed IDs before the wanted one: those at the k-th removed
+        # position p with p - k <= position, i.e. with at most position live
+        # IDs before them
+        removed = self._removed
+        skipped = bisect_right(
+            range(len(removed)), position, key=lambda k: removed[k] - k
+        )
+        return self._order[position + skipped]
+
+    def id_created_from(self, timestamp: int) -> int | None:
+        """
+        Return the ID of the first task created at or after a timestamp.
+
+        Args:
+            timestamp: Creation time in nanoseconds since the epoch
+
+        Returns:
+            The task ID, or None if every task was created earlier
+        """
+        tasks = self._tasks
+        position = bisect_left(
+            range(len(tasks)),
+            timestamp,
+            key=lambda position: tasks[self.id_at(position)].created_at,
+        )
+        return self.id_at(position)
+
+
+class _TrieNode:
+    """
+    Node of the trie behind PersistentTaskStore and TaskSnapshot.
+
+    Leaves (shift 0) hold the tasks of 32 consecutive IDs; inner nodes hold
+    32 children, each covering 32 times fewer IDs. Missing tasks and empty
+    subtrees are None. A node may only be changed in place by the store
+    whose current owner token it carries; anyone else copies it first.
+    """
+
+    __slots__ = ("owner", "shift", "count", "slots")
+
+    def __init__(
+        self, owner: object, shift: int, slots: list | None = None, count: int = 0
+    ) -> None:
+        self.owner = owner
+        # Bits of the task ID below this node's level
+        self.shift = shift
+        # Number of tasks in this subtree
+        self.count = count
+        self.slots = slots if slots is not None else [None] * _TRIE_WIDTH
+
+    def copy(self, owner: object) -> "_TrieNode":
+        """Return a shallow copy that the given owner may change."""
+        return _TrieNode(owner, self.shift, self.slots.copy(), self.count)
+
+
+def _leaves_from(node: _TrieNode, start_id: int) -> Iterator[tuple[_TrieNode, int]]:
+    """Yield (leaf, first slot) pairs covering IDs >= start_id, in ID order."""
+    if not node.shift:
+        yield (node, start_id & _TRIE_MASK)
+        return
+    first = (start_id >> node.shift) & _TRIE_MASK
+    for index in range(first, _TRIE_WIDTH):
+        child = node.slots[index]
+        if child is not None:
+            yield from _leaves_from(child, start_id if index == first else 0)
+
+
+class _TaskTrie:
+    """Read operations shared by PersistentTaskStore and TaskSnapshot."""
+
+    _root: _TrieNode
+    _complete: int
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, task_id: int) -> bool:
+        return self.get(task_id) is not None
+
+    def get(self, task_id: int) -> Task | None:
+        """Return the task with the given ID, or None if absent."""
+        # Read the root once; a concurrent add may replace it with a taller one
+        node = self._root
+        shift = node.shift
+        if task_id < 0 or task_id >> shift >= _TRIE_WIDTH:
+            return None
+        while shift:
+            node = node.slots[(task_id >> shift) & _TRIE_MASK]
+            if node is None:
+                return None
+            shift -= _TRIE_BITS
+        return node.slots[task_id & _TRIE_MASK]
+
+    def count_complete(self) -> int:
+        """Return the number of complete tasks."""
+        return self._complete
+
+    def values(self) -> Iterator[Task]:
+        """Iterate over all tasks in ascending ID order."""
+        return self.iter_from(0)
+
+    def iter_from(self, start_id: int, status: bool | None = None) -> Iterator[Task]:
+        """
+        Iterate over tasks with ID >= start_id in ascending ID order.
+
+        Args:
+            start_id: Smallest task ID to include
+            status: If given, only include tasks with this status
+        """
+        root = self._root
+        start_id = max(start_id, 0)
+        if start_id >> root.shift >= _TRIE_WIDTH:
+            return
+        for leaf, first in _leaves_from(root, start_id):
+            for task in islice(leaf.slots, first, None):
+                if task is not None and (status is None or task.status == status):
+                    yield task
+
+    def id_at(self, position: int) -> int | None:
+        """
+        Return the ID of the task at a 0-based position in ID order.
+
+        Subtree sizes are kept in the trie, so this skips whole subtrees.
+
+        Args:
+            position: Number of tasks that precede the wanted one
+
+        Returns:
+            The task ID, or None if position is past the end
+        """
+        node = self._root
+        if not 0 <= position < node.count:
+            return None
+        while node.shift:
+            for child in node.slots:
+                if child is None:
+                    continue
+                if position < child.count:
+                    node = child
+                    break
+                position -= child.count
+        for task in node.slots:
+            if task is not None:
+                if not position:
+                    return task.id
+                position -= 1
+        return None
+
+    def id_created_from(self, timestamp: int) -> int | None:
+        """
+        Return the ID of the first task created at or after a timestamp.
+
+        Args:
+            timestamp: Creation time in nanoseconds since the epoch
+
+        Returns:
+            The task ID, or None if every task was created earlier
+        """
+
+        def first_created(task_id: int) -> float:
+            # Creation time of the first task at or after task_id
+            for task in self.iter_from(task_id):
+                return task.created_at
+            return float("inf")
+
+        capacity = 1 << (self._root.shift + _TRIE_BITS)
+        start_id = bisect_left(range(capacity), timestamp, key=first_created)
+        for task in self.iter_from(start_id):
+            return task.id
+        return None
+
+
+class TaskSnapshot(_TaskTrie):
+    """
+    Immutable view of the tasks in a PersistentTaskStore at one moment.
+
+    A snapshot shares the store's trie instead of copying it, so taking one
+    costs the same for ten tasks as for a million. It can be read at leisure,
+    also from other threads, while the store keeps changing, and always
+    shows the tasks exactly as they were when it was taken.
+
+    Snapshots support the read half of the storage interface (get, values,
+    iter_from, id_at, id_created_from, count_complete), len(), `in` and
+    iteration in ID order.
+    """
+
+    __slots__ = ("_root", "_complete")
+
+    def __init__(self, root: _TrieNode, complete: int) -> None:
+        self._root = root
+        self._complete = complete
+
+    def __iter__(self) -> Iterator[Task]:
+        return self.values()
+
+    def __repr__(self) -> str:
+        return f"<TaskSnapshot of {len(self)} tasks>"
+
+
+class PersistentTaskStore(_TaskTrie):
+    """
+    Storage engine with constant-time snapshots.
+
+    Tasks are kept in a 32-way trie indexed by ID (a persistent vector).
+    snapshot() hands out the current trie as an immutable TaskSnapshot and
+    switches the store to a new owner token; from then on the store copies
+    a node before changing it, so each write after a snapshot copies only
+    the few nodes on the path to its task. Nodes the store created since the
+    last snapshot are changed in place, so without snapshots writes copy
+    nothing.
+
+    Tasks are never mutated: replace() stores a changed copy, so tasks held
+    by readers and snapshots stay as they were.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._owner = object()
+        self._root = _TrieNode(self._owner, 0)
+        self._complete = 0
+        self._last_id: int | None = None
+
+    def add(self, task: Task) -> Task:
+        """
+        Store a new task.
+
+        Args:
+            task: The task to store
+
+        Returns:
+            The stored task
+
+        Raises:
+            ValueError: If the task ID is not greater than the last stored ID
+        """
+        if self._last_id is not None and task.id <= self._last_id:
+            raise ValueError(f"Task IDs must be added in increasing order: {task.id}")
+
+        root = self._root
+        while task.id >> root.shift >= _TRIE_WIDTH:
+            # Grow upwards; the old root (shared or not) becomes the first child
+            slots = [None] * _TRIE_WIDTH
+            slots[0] = root
+            root = _TrieNode(self._owner, root.shift + _TRIE_BITS, slots, root.count)
+        self._root = root
+
+        self._set(task.id, task, 1)
+        self._complete += task.status
+        self._last_id = task.id
+        return task
+
+    def remove(self, task_id: int) -> Task | None:
+        """Remove and return the task with the given ID, or None if absent."""
+        task = self.get(task_id)
+        if task is not None:
+            self._set(task_id, None, -1)
+            self._complete -= task.status
+        return task
+
+    def replace(self, task_id: int, **changes) -> Task:
+        """
+        Store a changed copy of a task.
+
+        Args:
+            task_id: ID of an existing task
+            **changes: Field names mapped to their new values
+
+        Returns:
+            The new version of the task
+        """
+        task = self.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        updated = task.copy_with(**changes)
+        self._complete += updated.status - task.status
+        self._set(task_id, updated, 0)
+        return updated
+
+    def snapshot(self) -> TaskSnapshot:
+        """Return an immutable snapshot of the current tasks in constant time."""
+        snapshot = TaskSnapshot(self._root, self._complete)
+        # Every existing node now belongs to the snapshot
+        self._owner = object()
+        return snapshot
+
+    def _set(self, task_id: int, task: Task | None, delta: int) -> None:
+        """
+        Put a task (or None) in an ID's slot, copying shared nodes on the way.
+
+        Args:
+            task_id: ID whose slot to set; must be below the root's capacity
+            task: New slot content
+            delta: Change in the number of tasks (1 add, -1 remove, 0 replace)
+        """
+        owner = self._owner
+        node = self._root
+        if node.owner is not owner:
+            node = self._root = node.copy(owner)
+        node.count += delta
+
+        while node.shift:
+            index = (task_id >> node.shift) & _TRIE_MASK
+            child = node.slots[index]
+            if child is None:
+                child = _TrieNode(owner, node.shift - _TRIE_BITS)
+            elif child.owner is not owner:
+                child = child.copy(owner)
+            child.count += delta
+            if not child.count:
+                # Drop emptied subtrees so iteration and lookups skip them
+                node.slots[index] = None
+                return
+            node.slots[index] = child
+            node = child
+
+        node.slots[task_id & _TRIE_MASK] = task
+
+
+class TaskView:
+    """
+    Lightweight read-only Task handed out by ColumnarTaskStore.
+
+    A view holds only the task ID and a cached row position; every attribute
+    is read from the store's columns on access, so views always reflect the
+    current state of the task.
+    """
+
+    __slots__ = ("_store", "_id", "_row", "_generation")
+
+    def __init__(self, store: "ColumnarTaskStore", task_id: int, row: int) -> None:
+        self._store = store
+        self._id = task_id
+        self._row = row
+        self._generation = store._generation
+
+    def _current_row(self) -> int:
+        """Return the row of this task, re-resolving it after a compaction."""
+        if self._generation != self._store._generation:
+            self._row = self._store._find_row(self._id)
+            self._generation = self._store._generation
+        if self._row < 0:
+            raise LookupError(f"Task with ID {self._id} no longer exists")
+        return self._row
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def title(self) -> str:
+        return self._store._title_at(self._current_row())
+
+    @property
+    def description(self) -> str:
+        return self._store._description_at(self._current_row())
+
+    @property
+    def status(self) -> bool:
+        return self._store._status[self._current_row()] == _COMPLETE
+
+    @property
+    def created_at(self) -> int:
+        return self._store._created[self._current_row()]
+
+    def to_task(self) -> Task:
+        """Materialize this view as a standalone Task."""
+        return Task(
+            id=self._id,
+            title=self.title,
+            description=self.description,
+            status=self.status,
+            created_at=self.created_at,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Task, TaskView)):
+            return (
+                self.id == other.id
+                and self.title == other.title
+                and self.description == other.description
+                and self.status == other.status
+                and self.created_at == other.created_at
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.to_task())
+
+
+class ColumnarTaskStore:
+    """
+    Memory-compact storage engine for large task sets.
+
+    Tasks are kept in parallel arrays (ID, status, creation time) instead of
+    individual objects. Each task's title and description are stored back to
+    back as UTF-8 in one shared bytearray, addressed by a single offset plus
+    two length columns. Rows are appended in ID order, so lookups are a
+    binary search over the ID column.
+
+    Deletes leave a tombstone and updates append new text; both are
+    reclaimed by a compaction once they make up half of the store.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._ids = array("q")
+        self._status = bytearray()
+        self._created = array("q")
+        self._text_offset = array("Q")
+        # Titles and descriptions are capped at 200/1000 characters, so their
+        # UTF-8 lengths always fit in two bytes
+        self._title_length = array("H")
+        self._desc_length = array("H")
+        self._text = bytearray()
+        self._live = 0
+        self._complete = 0
+        self._garbage_bytes = 0
+        # IDs of live rows, built on demand for positional lookups
+        self._live_ids: array | None = None
+        # Bumped on every compaction so outstanding views re-resolve rows
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._find_row(task_id) >= 0
+
+    def _find_row(self, task_id: int) -> int:
+        """Return the row holding a live task, or -1 if there is none."""
+        ids = self._ids
+        row = bisect_left(ids, task_id)
+        if row < len(ids) and ids[row] == task_id and self._status[row] != _DELETED:
+            return row
+        return -1
+
+    def _append_text(self, title: str, description: str) -> tuple[int, int, int]:
+        """Append a title/description run; return (offset, title_len, desc_len)."""
+        title_bytes = title.encode("utf-8")
+        desc_bytes = description.encode("utf-8")
+        offset = len(self._text)
+        self._text += title_bytes
+        self._text += desc_bytes
+        return (offset, len(title_bytes), len(desc_bytes))
+
+    def _title_at(self, row: int) -> str:
+        start = self._text_offset[row]
+        end = start + self._title_length[row]
+        return self._text[start:end].decode("utf-8")
+
+    def _description_at(self, row: int) -> str:
+        length = self._desc_length[row]
+        if not length:
+            return ""
+        start = self._text_offset[row] + self._title_length[row]
+        return self._text[start : start + length].decode("utf-8")
+
+    def add(self, task: Task) -> TaskView:
+        """
+        Store a new task.
+
+        Args:
+            task: The task to store; its ID must exceed every stored ID
+
+        Returns:
+            A view of the stored task
+
+        Raises:
+            ValueError: If the task ID is not greater than the last stored ID
+        """
+        if self._ids and task.id <= self._ids[-1]:
+            raise ValueError(f"Task IDs must be added in increasing order: {task.id}")
+
+        offset, title_length, desc_length = self._append_text(
+            task.title, task.description
+        )
+        self._ids.append(task.id)
+        self._status.append(_COMPLETE if task.status else _INCOMPLETE)
+        self._created.append(task.created_at)
+        self._text_offset.append(offset)
+        self._title_length.append(title_length)
+        self._desc_length.append(desc_length)
+        self._live += 1
+        self._complete += task.status
+        if self._live_ids is not None:
+            self._live_ids.append(task.id)
+
+        return TaskView(self, task.id, len(self._ids) - 1)
+
+    def get(self, task_id: int) -> TaskView | None:
+        """Return a view of the task with the given ID, or None if absent."""
+        row = self._find_row(task_id)
+        if row < 0:
+            return None
+        return TaskView(self, task_id, row)
+
+    def remove(self, task_id: int) -> Task | None:
+        """Remove the task with the given ID and return it as a standalone Task."""
+        row = self._find_row(task_id)
+        if row < 0:
+            return None
+
+        task = TaskView(self, task_id, row).to_task()
+        self._complete -= task.status
+        self._status[row] = _DELETED
+        self._garbage_bytes += self._title_length[row] + self._desc_length[row]
+        self._live -= 1
+        self._live_ids = None
+        self._maybe_compact()
+        return task
+
+    def replace(self, task_id: int, **changes) -> TaskView:
+        """
+        Change fields of a stored task.
+
+        Args:
+            task_id: ID of an existing task
+            **changes: Any of title, description and status
+
+        Returns:
+            A view of the task after the change
+        """
+        row = self._find_row(task_id)
+        if row < 0:
+            raise KeyError(task_id)
+
+        status = changes.pop("status", None)
+        if status is not None:
+            self._complete += bool(status) - (self._status[row] == _COMPLETE)
+            self._status[row] = _COMPLETE if status else _INCOMPLETE
+
+        if "title" in changes or "description" in changes:
+            # Text is stored as one title+description run, so rewrite both
+            title = changes.pop("title", None)
+            description = changes.pop("description", None)
+            if title is None:
+                title = self._title_at(row)
+            if description is None:
+                description = self._description_at(row)
+            self._garbage_bytes += self._title_length[row] + self._desc_length[row]
+            offset, title_length, desc_length = self._append_text(title, description)
+            self._text_offset[row] = offset
+            self._title_length[row] = title_length
+            self._desc_length[row] = desc_length
+
+        if changes:
+            raise AttributeError(f"Cannot change task fields: {', '.join(changes)}")
+
+        view = TaskView(self, task_id, row)
+        self._maybe_compact()
+        return view
+
+    def count_complete(self) -> int:
+        """Return the number of complete tasks."""
+        return self._complete
+
+    def values(self) -> Iterator[TaskView]:
+        """Iterate over views of all tasks in ascending ID order."""
+        return self.iter_from(0)
+
+    def iter_from(
+        self, start_id: int, status: bool | None = None
+    ) -> Iterator[TaskView]:
+        """
+        Iterate over views of tasks with ID >= start_id in ascending ID order.
+
+        Args:
+            start_id: Smallest task ID to include
+            status: If given, only include tasks with this status
+        """
+        generation = self._generation
+        ids = self._ids
+        row = bisect_left(ids, start_id)
+
+        if status is None:
+            for index in range(row, len(ids)):
+                if generation != self._generation:
+                    raise RuntimeError("Store was compacted during iteration")
+                if self._status[index] != _DELETED:
+                    yield TaskView(self, ids[index], index)
+            return
+
+        # The status column doubles as a bitmap index: find() jumps straight
+        # to the next row with the wanted status byte
+        marker = bytes([_COMPLETE if status else _INCOMPLETE])
+        while True:
+            if generation != self._generation:
+                raise RuntimeError("Store was compacted during iteration")
+            row = self._status.find(marker, row)
+            if row < 0:
+                return
+            yield TaskView(self, ids[row], row)
+            row += 1
+
+    def id_at(self, position: int) -> int | None:
+        """
+        Return the ID of the task at a 0-based position in ID order.
+
+        Args:
+            position: Number of tasks that precede the wanted one
+
+        Returns:
+            The task ID, or None if position is past the end
+        """
+        ids = self._ids
+        if self._live != len(ids):
+            if self._live_ids is None:
+                live_rows = self._status.translate(_LIVE_TABLE)
+                self._live_ids = array("q", compress(ids, live_rows))
+            ids = self._live_ids
+        if 0 <= position < len(ids):
+            return ids[position]
+        return None
+
+    def id_created_from(self, timestamp: int) -> int | None:
+        """
+        Return the ID of the first task created at or after a timestamp.
+
+        The returned ID may belong to a deleted task; iter_from skips it.
+
+        Args:
+            timestamp: Creation time in nanoseconds since the epoch
+
+        Returns:
+            The task ID, or None if every task was created earlier
+        """
+        row = bisect_left(self._created, timestamp)
+        if row < len(self._ids):
+            return self._ids[row]
+        return None
+
+    def _maybe_compact(self) -> None:
+        """Compact the store once tombstones or stale text dominate it."""
+        rows = len(self._ids)
+        text = len(self._text)
+        if (rows >= _MIN_COMPACT_ROWS and (rows - self._live) * 2 > rows) or (
+            text >= _MIN_COMPACT_ROWS and self._garbage_bytes * 2 > text
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop tombstoned rows and unreferenced text, rewriting all columns."""
+        keep = [row for row in range(len(self._ids)) if self._status[row] != _DELETED]
+        old_text = self._text
+        text = bytearray()
+        text_offset = array("Q")
+
+        for row in keep:
+            start = self._text_offset[row]
+            text_offset.append(len(text))
+            text += old_text[
+                start : start + self._title_length[row] + self._desc_length[row]
+            ]
+
+        self._ids = array("q", (self._ids[row] for row in keep))
+        self._status = bytearray(self._status[row] for row in keep)
+        self._created = array("q", (self._created[row] for row in keep))
+        self._title_length = array("H", (self._title_length[row] for row in keep))
+        self._desc_length = array("H", (self._desc_length[row] for row in keep))
+        self._text_offset = text_offset
+        self._text = text
+        self._garbage_bytes = 0
+        self._live_ids = None
+        self._generation += 1
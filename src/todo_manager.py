@@ -4,8 +4,50 @@ Business logic and state management for the Todo application.
 This module manages task storage, ID generation, and task operations.
 """
 
-from typing import Dict, Optional, Tuple
-from models import Task, ValidationError
+from collections.abc import Iterable, Iterator
+from itertools import islice, takewhile
+from models import Task, ValidationError, text_pool
+from storage import DictTaskStore, PersistentTaskStore, TaskSnapshot
+
+# Modules used by only some commands (search_index) are imported where they
+# are needed, keeping startup fast for one-shot commands.
+
+
+class BatchResult:
+    """
+    Outcome of a bulk operation.
+
+    Attributes:
+        ids: For each input item, the affected task ID, or None if it failed
+        errors: Input position mapped to error message, for failed items only
+        changed: Number of tasks that were added, completed or deleted
+        applied: False if an atomic batch was rejected as a whole
+    """
+
+    __slots__ = ("ids", "errors", "changed", "applied")
+
+    def __init__(
+        self,
+        ids: list[int | None],
+        errors: dict[int, str] | None = None,
+        changed: int = 0,
+        applied: bool = True,
+    ) -> None:
+        self.ids = ids
+        self.errors = errors if errors is not None else {}
+        self.changed = changed
+        self.applied = applied
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult(ids={self.ids!r}, errors={self.errors!r}, "
+            f"changed={self.changed!r}, applied={self.applied!r})"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """True if every item succeeded."""
+        return not self.errors
 
 
 class TodoManager:
@@ -16,16 +58,43 @@ class TodoManager:
     - Generate unique task IDs
     - Store and retrieve tasks
     - Coordinate task operations (add, delete, update, etc.)
+
+    Tasks live in a storage engine (see storage.py). The default engine keeps
+    one Task object per task; pass a ColumnarTaskStore for large task sets,
+    or a PersistentTaskStore for constant-time snapshots.
+    Pass a TaskJournal (see persistence.py) to keep tasks across restarts.
     """
 
-    def __init__(self) -> None:
-        """Initialize the TodoManager with empty task storage."""
-        self._tasks: Dict[int, Task] = {}
+    def __init__(self, store=None, journal=None) -> None:
+        """
+        Initialize the TodoManager with empty task storage.
+
+        Args:
+            store: Optional storage engine (defaults to DictTaskStore)
+            journal: Optional TaskJournal; persisted tasks are loaded into
+                the store and every change is journaled from then on
+        """
+        self._store = store if store is not None else DictTaskStore()
         self._next_id: int = 1
+        self._journal = journal
+        if journal is not None:
+            self._next_id = journal.open(self._store)
+        # Full-text SearchIndex, built on the first search and then kept in sync
+        self._search_index = None
+
+    def flush(self) -> None:
+        """Write journaled changes that are still buffered, if any."""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal, if any."""
+        if self._journal is not None:
+            self._journal.close()
 
     def add_task(
-        self, title: str, description: Optional[str] = None
-    ) -> Tuple[Optional[Task], Optional[str]]:
+        self, title: str, description: str | None = None
+    ) -> tuple[Task | None, str | None]:
         """
         Add a new task to the todo list.
 
@@ -47,7 +116,11 @@ class TodoManager:
             )
 
             # Store task
-            self._tasks[task.id] = task
+            task = self._store.add(task)
+            if self._journal is not None:
+                self._journal.record_add(task)
+            if self._search_index is not None:
+                self._search_index.add(task.id, task.title, task.description)
 
             # Increment ID counter
             self._next_id += 1
@@ -58,7 +131,7 @@ class TodoManager:
             # Return validation error message
             return (None, str(e))
 
-    def get_task(self, task_id: int) -> Optional[Task]:
+    def get_task(self, task_id: int) -> Task | None:
         """
         Retrieve a task by ID.
 
@@ -68,7 +141,7 @@ class TodoManager:
         Returns:
             The Task instance if found, None otherwise
         """
-        return self._tasks.get(task_id)
+        return self._store.get(task_id)
 
     def get_all_tasks(self) -> list[Task]:
         """
@@ -77,7 +150,164 @@ class TodoManager:
         Returns:
             A list of all Task instances, sorted by ID
         """
-        return sorted(self._tasks.values(), key=lambda t: t.id)
+        # The store keeps tasks in ID order, so no sort is needed
+        return list(self._reader().values())
+
+    def snapshot(self) -> TaskSnapshot:
+        """
+        Take an immutable snapshot of all tasks.
+
+        The snapshot can be read at any later time and shows the tasks as
+        they were when it was taken, however the manager changes meanwhile.
+        With a PersistentTaskStore this takes constant time; the other stores
+        hand out live tasks, so their tasks are copied, which takes time
+        proportional to the number of tasks.
+
+        Returns:
+            A TaskSnapshot; iterate it for the tasks in ID order
+        """
+        take_snapshot = getattr(self._store, "snapshot", None)
+        if take_snapshot is not None:
+            return take_snapshot()
+
+        copy = PersistentTaskStore()
+        for task in self._store.values():
+            # Columnar views are materialized too, so copies never change
+            copy.add(
+                Task(
+                    task.id, task.title, task.description, task.status, task.created_at
+                )
+            )
+        return copy.snapshot()
+
+    def _reader(self):
+        """Return the store (or snapshot) that list reads are served from."""
+        return self._store
+
+    def iter_tasks(
+        self,
+        start_id: int = 1,
+        limit: int | None = None,
+        status: bool | None = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ID order without building a list.
+
+        Args:
+            start_id: Smallest task ID to include (need not exist)
+            limit: Maximum number of tasks to yield (None = no limit)
+            status: Only include complete (True) or incomplete (False)
+                tasks (None = all tasks)
+
+        Returns:
+            An iterator of Task instances, sorted by ID. To fetch the next
+            page, pass the last ID seen plus one as start_id.
+        """
+        tasks = self._reader().iter_from(start_id, status)
+        if limit is not None:
+            tasks = islice(tasks, limit)
+        return tasks
+
+    def iter_page(
+        self, page: int, size: int, status: bool | None = None
+    ) -> Iterator[Task]:
+        """
+        Iterate over one page of tasks in ID order.
+
+        Args:
+            page: 1-based page number
+            size: Number of tasks per page
+            status: Only page through tasks with this status (None = all)
+
+        Returns:
+            An iterator of at most size Task instances; empty past the end
+        """
+        reader = self._reader()
+        skip = (page - 1) * size
+        if status is not None:
+            # Filtered positions are not indexed, so skip earlier matches
+            return islice(reader.iter_from(1, status), skip, skip + size)
+
+        start_id = reader.id_at(skip)
+        if start_id is None:
+            return iter(())
+        return islice(reader.iter_from(start_id), size)
+
+    def iter_created_between(
+        self,
+        after: int | None = None,
+        before: int | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks created in a time range, oldest first.
+
+        Creation times never decrease with ID, so the start of the range is
+        found by binary search and iteration stops at its end.
+
+        Args:
+            after: Include tasks created at or after this time, in
+                nanoseconds since the epoch (None = from the first task);
+                see models.datetime_to_timestamp for datetimes
+            before: Include tasks created strictly before this time
+                (None = up to the last task)
+            limit: Maximum number of tasks to yield (None = no limit)
+
+        Returns:
+            An iterator of Task instances, sorted by ID
+        """
+        reader = self._reader()
+        start_id = 1
+        if after is not None:
+            start_id = reader.id_created_from(after)
+            if start_id is None:
+                return iter(())
+
+        tasks = reader.iter_from(start_id)
+        if before is not None:
+            tasks = takewhile(lambda task: task.created_at < before, tasks)
+        if limit is not None:
+            tasks = islice(tasks, limit)
+        return tasks
+
+    def count_by_status(self) -> dict[str, int]:
+        """
+        Count tasks by status in constant time.
+
+        Returns:
+            A dict with "complete" and "incomplete" task counts
+        """
+        reader = self._reader()
+        complete = reader.count_complete()
+        return {"complete": complete, "incomplete": len(reader) - complete}
+
+    def search(self, query: str, limit: int | None = 20) -> list[Task]:
+        """
+        Find tasks whose title or description contains every query term.
+
+        The first search builds the index from all tasks; afterwards it is
+        updated incrementally by add, update and delete.
+
+        Args:
+            query: Space-separated terms, case-insensitive; end a term with
+                '*' to match words starting with it (e.g. "groc*")
+            limit: Maximum number of results (None = all)
+
+        Returns:
+            Matching tasks, best match first
+        """
+        if self._search_index is None:
+            from search_index import SearchIndex
+
+            index = SearchIndex()
+            for task in self._store.values():
+                index.add(task.id, task.title, task.description)
+            self._search_index = index
+
+        return [
+            self._store.get(task_id)
+            for task_id, _ in self._search_index.search(query, limit)
+        ]
 
     def task_count(self) -> int:
         """
@@ -86,9 +316,9 @@ class TodoManager:
         Returns:
             The number of tasks currently stored
         """
-        return len(self._tasks)
+        return len(self._store)
 
-    def delete_task(self, task_id: int) -> Tuple[Optional[Task], Optional[str]]:
+    def delete_task(self, task_id: int) -> tuple[Task | None, str | None]:
         """
         Delete a task by ID.
 
@@ -100,22 +330,23 @@ class TodoManager:
             - If successful: (deleted Task instance, None)
             - If failed: (None, error message string)
         """
-        # Look up task
-        task = self.get_task(task_id)
+        # Remove task from storage
+        task = self._store.remove(task_id)
         if not task:
             return (None, f"Task with ID {task_id} not found")
-
-        # Remove task from storage
-        del self._tasks[task_id]
+        if self._journal is not None:
+            self._journal.record_delete(task_id)
+        if self._search_index is not None:
+            self._search_index.remove(task_id, task.title, task.description)
 
         return (task, None)
 
     def update_task(
         self,
         task_id: int,
-        new_title: Optional[str] = None,
-        new_description: Optional[str] = None,
-    ) -> Tuple[Optional[Task], Optional[str], bool]:
+        new_title: str | None = None,
+        new_description: str | None = None,
+    ) -> tuple[Task | None, str | None, bool]:
         """
         Update a task's title and/or description.
 
@@ -135,31 +366,42 @@ class TodoManager:
         if not task:
             return (None, f"Task with ID {task_id} not found", False)
 
-        # Track if any changes made
-        changes_made = False
+        # Collect changed fields
+        changes = {}
 
         try:
-            # Validate and update title if provided
+            # Validate title if provided
             if new_title is not None:
-                validated_title = Task.validate_title(new_title)
+                validated_title = text_pool.intern(Task.validate_title(new_title))
                 if validated_title != task.title:
-                    task.title = validated_title
-                    changes_made = True
+                    changes["title"] = validated_title
 
-            # Validate and update description if provided
+            # Validate description if provided
             if new_description is not None:
-                validated_desc = Task.validate_description(new_description)
+                validated_desc = text_pool.intern(
+                    Task.validate_description(new_description)
+                )
                 if validated_desc != task.description:
-                    task.description = validated_desc
-                    changes_made = True
+                    changes["description"] = validated_desc
 
-            return (task, None, changes_made)
+            # Apply both changes together so a failed validation changes nothing
+            if changes:
+                # Capture the indexed text before the store changes it
+                old_text = (task.title, task.description)
+                task = self._store.replace(task_id, **changes)
+                if self._journal is not None:
+                    self._journal.record_update(task)
+                if self._search_index is not None:
+                    self._search_index.remove(task_id, *old_text)
+                    self._search_index.add(task_id, task.title, task.description)
+
+            return (task, None, bool(changes))
 
         except ValidationError as e:
             # Return validation error message
             return (None, str(e), False)
 
-    def mark_complete(self, task_id: int) -> Tuple[Optional[Task], Optional[str], bool]:
+    def mark_complete(self, task_id: int) -> tuple[Task | None, str | None, bool]:
         """
         Mark a task as complete.
 
@@ -182,12 +424,14 @@ class TodoManager:
             return (task, None, False)  # Already complete
 
         # Mark as complete
-        task.status = True
+        task = self._store.replace(task_id, status=True)
+        if self._journal is not None:
+            self._journal.record_status(task_id, True)
         return (task, None, True)  # Status changed
 
     def mark_incomplete(
         self, task_id: int
-    ) -> Tuple[Optional[Task], Optional[str], bool]:
+    ) -> tuple[Task | None, str | None, bool]:
         """
         Mark a task as incomplete.
 
@@ -210,5 +454,159 @@ class TodoManager:
             return (task, None, False)  # Already incomplete
 
         # Mark as incomplete
-        task.status = False
+        task = self._store.replace(task_id, status=False)
+        if self._journal is not None:
+            self._journal.record_status(task_id, False)
         return (task, None, True)  # Status changed
+
+    # ============================================================
+    # BULK OPERATIONS
+    # ============================================================
+
+    def add_many(
+        self,
+        items: Iterable[tuple[str, str | None]],
+        atomic: bool = False,
+    ) -> BatchResult:
+        """
+        Add many tasks in one call.
+
+        All items are validated in a single pass, then the valid ones get one
+        contiguous range of IDs and a shared creation timestamp.
+
+        Args:
+            items: (title, description) pairs; description may be None
+            atomic: If True, add nothing unless every item is valid;
+                if False, add the valid items and report the rest
+
+        Returns:
+            A BatchResult whose ids hold the new task IDs in input order
+        """
+        validate_title = Task.validate_title
+        validate_description = Task.validate_description
+        intern = text_pool.intern
+        validated = []
+        errors = {}
+
+        for position, (title, description) in enumerate(items):
+            try:
+                validated.append(
+                    (
+                        intern(validate_title(title)),
+                        intern(validate_description(description or "")),
+                    )
+                )
+            except ValidationError as e:
+                validated.append(None)
+                errors[position] = str(e)
+
+        if atomic and errors:
+            return BatchResult([None] * len(validated), errors, 0, False)
+
+        # Allocate IDs for the valid items as one range
+        next_id = self._next_id
+        timestamp = Task.generate_timestamp()
+        ids = []
+        for fields in validated:
+            if fields is None:
+                ids.append(None)
+                continue
+            title, description = fields
+            task = self._store.add(Task(next_id, title, description, False, timestamp))
+            if self._journal is not None:
+                self._journal.record_add(task)
+            if self._search_index is not None:
+                self._search_index.add(next_id, title, description)
+            ids.append(next_id)
+            next_id += 1
+
+        added = next_id - self._next_id
+        self._next_id = next_id
+        return BatchResult(ids, errors, added)
+
+    def complete_many(
+        self, task_ids: Iterable[int], atomic: bool = False
+    ) -> BatchResult:
+        """
+        Mark many tasks as complete in one call.
+
+        Args:
+            task_ids: IDs of the tasks to mark complete
+            atomic: If True, change nothing unless every ID exists
+
+        Returns:
+            A BatchResult; changed counts tasks that were not already complete
+        """
+        task_ids, errors = self._find_existing(task_ids)
+        if atomic and errors:
+            return BatchResult([None] * len(task_ids), errors, 0, False)
+
+        ids = []
+        changed = 0
+        for position, task_id in enumerate(task_ids):
+            if position in errors:
+                ids.append(None)
+                continue
+            ids.append(task_id)
+            if not self._store.get(task_id).status:
+                self._store.replace(task_id, status=True)
+                if self._journal is not None:
+                    self._journal.record_status(task_id, True)
+                changed += 1
+
+        return BatchResult(ids, errors, changed)
+
+    def delete_many(self, task_ids: Iterable[int], atomic: bool = False) -> BatchResult:
+        """
+        Delete many tasks in one call.
+
+        Args:
+            task_ids: IDs of the tasks to delete
+            atomic: If True, delete nothing unless every ID exists
+
+        Returns:
+            A BatchResult; changed counts deleted tasks
+        """
+        task_ids, errors = self._find_existing(task_ids)
+
+        # A task can only be deleted once per batch
+        seen = set()
+        for position, task_id in enumerate(task_ids):
+            if task_id in seen:
+                errors.setdefault(position, f"Task with ID {task_id} is listed twice")
+            seen.add(task_id)
+
+        if atomic and errors:
+            return BatchResult([None] * len(task_ids), errors, 0, False)
+
+        ids = []
+        for position, task_id in enumerate(task_ids):
+            if position in errors:
+                ids.append(None)
+                continue
+            task = self._store.remove(task_id)
+            if self._journal is not None:
+                self._journal.record_delete(task_id)
+            if self._search_index is not None:
+                self._search_index.remove(task_id, task.title, task.description)
+            ids.append(task_id)
+
+        return BatchResult(ids, errors, len(task_ids) - len(errors))
+
+    def _find_existing(
+        self, task_ids: Iterable[int]
+    ) -> tuple[list[int], dict[int, str]]:
+        """
+        Check which of the given IDs exist.
+
+        Returns:
+            A tuple of (task_ids as a list, position -> error for missing IDs)
+        """
+        task_ids = list(task_ids)
+        store = self._store
+        errors = {
+            position: f"Task with ID {task_id} not found"
+            for position, task_id in enumerate(task_ids)
+            if task_id not in store
+        }
+        return (task_ids, errors)
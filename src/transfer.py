@@ -0,0 +1,368 @@
+"""
+Streaming import and export of tasks.
+
+Three file formats are supported:
+
+- jsonl: one JSON object per line with id, title, description, status and
+  created_at (ISO 8601), as in script mode output
+- csv: a header row naming the same columns, then one row per task
+- binary: an 8-byte magic, then one struct-packed row per task (ID,
+  status, text lengths, created_at in nanoseconds) followed by its UTF-8
+  title and description; the fastest format to write and read back
+
+Both directions work on generators, one chunk or batch at a time, so memory
+stays flat however large the file. On import only title is required;
+description and status are optional and other columns are ignored. Imported
+tasks get new IDs and creation times, since both must keep increasing in
+the manager. Rows are validated in batches by TodoManager.add_many; rows
+that fail are reported and skipped, and the rest of the stream is imported.
+"""
+
+import csv
+import io
+import json
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from json.encoder import encode_basestring
+
+from models import format_timestamp
+from todo_manager import TodoManager
+
+FORMATS = ("jsonl", "csv", "binary")
+
+# File extensions the format is guessed from
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".bin": "binary"}
+
+COLUMNS = ("id", "title", "description", "status", "created_at")
+
+_BINARY_MAGIC = b"TODOEXP1"
+# Export row: task_id, status, title/description byte lengths, created_at.
+# Same layout as snapshot rows, but versioned separately by the magic.
+_ROW = struct.Struct("<qBHHq")
+
+# Tasks encoded per output chunk, and rows validated per add_many call
+_CHUNK_ROWS = 4096
+IMPORT_BATCH = 10_000
+
+# Status words accepted in CSV files (compared lowercased)
+_STATUS_WORDS = {
+    "": False,
+    "false": False,
+    "0": False,
+    "no": False,
+    "incomplete": False,
+    "true": True,
+    "1": True,
+    "yes": True,
+    "complete": True,
+}
+
+
+class TransferError(Exception):
+    """Raised when a whole file cannot be read (as opposed to a bad row)."""
+
+    pass
+
+
+def guess_format(path: str) -> str | None:
+    """
+    Return the format implied by a file name's extension.
+
+    Args:
+        path: File path
+
+    Returns:
+        One of FORMATS, or None if the extension is not recognized
+    """
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+# ============================================================
+# EXPORT
+# ============================================================
+
+
+def encode_jsonl(tasks: Iterable) -> Iterator[bytes]:
+    """Encode tasks as JSON lines, yielding UTF-8 chunks."""
+    lines = []
+    for task in tasks:
+        # Only the two text fields need JSON escaping
+        lines.append(
+            f'{{"id":{task.id},"title":{encode_basestring(task.title)},'
+            f'"description":{encode_basestring(task.description)},'
+            f'"status":{"true" if task.status else "false"},'
+            f'"created_at":"{format_timestamp(task.created_at)}"}}'
+        )
+        if len(lines) == _CHUNK_ROWS:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def encode_csv(tasks: Iterable) -> Iterator[bytes]:
+    """Encode tasks as CSV with a header row, yielding UTF-8 chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    rows = 0
+    for task in tasks:
+        writer.writerow(
+            (
+                task.id,
+                task.title,
+                task.description,
+                "true" if task.status else "false",
+                format_timestamp(task.created_at),
+            )
+        )
+        rows += 1
+        if rows == _CHUNK_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def encode_binary(tasks: Iterable) -> Iterator[bytes]:
+    """Encode tasks in the binary export format, yielding chunks."""
+    chunk = bytearray(_BINARY_MAGIC)
+    rows = 0
+    for task in tasks:
+        title = task.title.encode("utf-8")
+        description = task.description.encode("utf-8")
+        chunk += _ROW.pack(
+            task.id, task.status, len(title), len(description), task.created_at
+        )
+        chunk += title
+        chunk += description
+        rows += 1
+        if rows == _CHUNK_ROWS:
+            yield bytes(chunk)
+            chunk.clear()
+            rows = 0
+    if chunk:
+        yield bytes(chunk)
+
+
+_ENCODERS = {"jsonl": encode_jsonl, "csv": encode_csv, "binary": encode_binary}
+
+
+def export_tasks(tasks: Iterable, output, file_format: str) -> int:
+    """
+    Write tasks to a binary stream in one of FORMATS.
+
+    Args:
+        tasks: Tasks to export, e.g. manager.iter_tasks()
+        output: Stream opened for binary writing
+        file_format: One of FORMATS
+
+    Returns:
+        The number of tasks written
+    """
+    count = 0
+
+    def counted(tasks):
+        nonlocal count
+        for task in tasks:
+            count += 1
+            yield task
+
+    for chunk in _ENCODERS[file_format](counted(tasks)):
+        output.write(chunk)
+    output.flush()
+    return count
+
+
+# ============================================================
+# IMPORT
+# ============================================================
+
+# Readers yield (row number, (title, description, status), None) for usable
+# rows and (row number, None, error message) for rejected ones.
+
+
+def read_jsonl(stream) -> Iterator[tuple]:
+    """
+    Read task rows from a binary stream of JSON lines.
+
+    Row numbers are line numbers; blank lines are skipped.
+    """
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield (number, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield (number, None, "Expected a JSON object")
+            continue
+        status = record.get("status", False)
+        if not isinstance(status, bool):
+            yield (number, None, f"Invalid status: {status!r}")
+            continue
+        yield _checked(number, record.get("title"), record.get("description"), status)
+
+
+def read_csv(stream) -> Iterator[tuple]:
+    """
+    Read task rows from a binary stream of CSV with a header row.
+
+    Column names are case-insensitive. Row numbers are the line numbers
+    where each row ends.
+
+    Raises:
+        TransferError: If the header has no title column
+    """
+    lines = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(lines)
+        if reader.fieldnames is None:
+            return
+        # Column names are matched case-insensitively
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        if "title" not in reader.fieldnames:
+            raise TransferError("CSV header has no 'title' column")
+
+        for record in reader:
+            word = (record.get("status") or "").strip().lower()
+            status = _STATUS_WORDS.get(word)
+            if status is None:
+                yield (reader.line_num, None, f"Invalid status: {record['status']!r}")
+                continue
+            yield _checked(
+                reader.line_num, record["title"], record.get("description"), status
+            )
+    except UnicodeDecodeError:
+        raise TransferError("CSV file is not valid UTF-8") from None
+    finally:
+        # Leave the caller's stream open
+        lines.detach()
+
+
+def read_binary(stream) -> Iterator[tuple]:
+    """
+    Read task rows from a binary export stream.
+
+    Row numbers count records from 1.
+
+    Raises:
+        TransferError: If the magic is wrong or the stream ends mid-record
+    """
+    if stream.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+        raise TransferError("Not a binary task export")
+
+    number = 0
+    while True:
+        header = stream.read(_ROW.size)
+        if not header:
+            return
+        number += 1
+        if len(header) < _ROW.size:
+            raise TransferError(f"Export ends in the middle of record {number}")
+        _, status, title_len, desc_len, _ = _ROW.unpack(header)
+        text = stream.read(title_len + desc_len)
+        if len(text) < title_len + desc_len:
+            raise TransferError(f"Export ends in the middle of record {number}")
+        try:
+            title = text[:title_len].decode("utf-8")
+            description = text[title_len:].decode("utf-8")
+        except UnicodeDecodeError:
+            yield (number, None, "Text is not valid UTF-8")
+            continue
+        yield (number, (title, description, bool(status)), None)
+
+
+_READERS = {"jsonl": read_jsonl, "csv": read_csv, "binary": read_binary}
+
+
+def _checked(number: int, title, description, status: bool) -> tuple:
+    """Check the field types of one row (values are validated on import)."""
+    if title is None:
+        return (number, None, "Missing title")
+    if not isinstance(title, str):
+        return (number, None, "Title must be text")
+    if description is not None and not isinstance(description, str):
+        return (number, None, "Description must be text")
+    return (number, (title, description, status), None)
+
+
+def import_tasks(
+    manager: TodoManager,
+    stream,
+    file_format: str,
+    on_reject: Callable[[int, str], None] | None = None,
+    batch_size: int = IMPORT_BATCH,
+) -> tuple[int, int]:
+    """
+    Add the tasks read from a binary stream to a manager.
+
+    Rows are validated batch by batch with add_many; a rejected row is
+    reported through on_reject and does not stop the import.
+
+    Args:
+        manager: The TodoManager to add tasks to
+        stream: Stream opened for binary reading
+        file_format: One of FORMATS
+        on_reject: Called with (row number, error message) per rejected row
+        batch_size: Rows validated and added per add_many call
+
+    Returns:
+        A tuple of (tasks imported, rows rejected)
+
+    Raises:
+        TransferError: If the file as a whole cannot be read; rows before
+            the problem have been imported
+    """
+    imported = 0
+    rejected = 0
+    rows = []
+    items = []
+    statuses = []
+    # Rejections of the current batch, reported in row order when it is added
+    rejections = []
+
+    def flush() -> None:
+        nonlocal imported, rejected
+        result = manager.add_many(items)
+        complete = [
+            task_id
+            for task_id, status in zip(result.ids, statuses, strict=True)
+            if status and task_id is not None
+        ]
+        if complete:
+            manager.complete_many(complete)
+        imported += result.changed
+
+        rejections.extend(
+            (rows[position], message) for position, message in result.errors.items()
+        )
+        rejected += len(rejections)
+        if on_reject is not None:
+            for number, message in sorted(rejections):
+                on_reject(number, message)
+        rows.clear()
+        items.clear()
+        statuses.clear()
+        rejections.clear()
+
+    try:
+        for number, fields, error in _READERS[file_format](stream):
+            if error is not None:
+                rejections.append((number, error))
+            else:
+                title, description, status = fields
+                rows.append(number)
+                items.append((title, description))
+                statuses.append(status)
+            if len(items) + len(rejections) >= batch_size:
+                flush()
+    finally:
+        if items or rejections:
+            flush()
+
+    return (imported, rejected)
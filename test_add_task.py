@@ -10,7 +10,7 @@ from pathlib import Path
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from models import Task, ValidationError
+from models import Task, TextPool, ValidationError, text_pool
 from todo_manager import TodoManager
 
 
@@ -170,6 +170,32 @@ def test_special_characters():
     print("[PASS]\n")
 
 
+def test_repeated_text_is_shared():
+    """Test that tasks with the same text share one string."""
+    print("Test 14: Repeated titles and descriptions share one string")
+    manager = TodoManager()
+    # Build equal strings at run time, as parsed input would be
+    words = ["Daily", "standup"]
+    first, _ = manager.add_task(" ".join(words), "-".join(["Team", "sync"]))
+    second, _ = manager.add_task(" ".join(words) + "  ", "-".join(["Team", "sync"]))
+    assert first.title is second.title and first.description is second.description
+    updated, _, _ = manager.update_task(1, new_title=" ".join(["Review", "PR"]))
+    third, _ = manager.add_task(" ".join(["Review", "PR"]))
+    assert updated.title is third.title
+    added = manager.add_many([(" ".join(words), None)])
+    assert manager.get_task(added.ids[0]).title is second.title
+
+    pool = TextPool(max_size=2)
+    for text in ("a" * 20, "a" * 20, "b" * 20, "c" * 20, "c" * 20, ""):
+        pool.intern("".join(text))
+    stats = pool.stats()
+    assert (stats["total"], stats["distinct"]) == (5, 2)
+    # One duplicate shared; the "c" strings did not fit in the pool
+    assert stats["saved_bytes"] == stats["pooled_bytes"] // 2 > 0
+    assert text_pool.stats()["distinct"] >= 3
+    print("[PASS]\n")
+
+
 def run_all_tests():
     """Run all tests."""
     print("=" * 60)
@@ -191,6 +217,7 @@ def run_all_tests():
         test_todo_manager_validation,
         test_unique_id_generation,
         test_special_characters,
+        test_repeated_text_is_shared,
     ]
 
     passed = 0
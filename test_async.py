@@ -0,0 +1,190 @@
+"""
+Test script for the asyncio TodoManager facade.
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from async_manager import AsyncTodoManager
+from persistence import TaskJournal
+from todo_manager import TodoManager
+
+
+def test_async_operations():
+    """Test the awaitable operations and read-your-writes ordering."""
+    print("=" * 60)
+    print("TEST: Async Operations")
+    print("=" * 60)
+
+    async def scenario():
+        manager = AsyncTodoManager()
+        task, error = await manager.add_task("Buy milk", "2 liters")
+        assert error is None and task.id == 1
+        # Reads see every write that has been awaited
+        assert (await manager.get_task(1)).title == "Buy milk"
+
+        task, error, changed = await manager.update_task(1, "Buy oat milk")
+        assert changed and task.title == "Buy oat milk"
+        task, _, changed = await manager.mark_complete(1)
+        assert changed and task.status is True
+        task, _, changed = await manager.mark_incomplete(1)
+        assert changed and task.status is False
+
+        # Errors come back as from TodoManager
+        assert await manager.add_task("") == (None, "Title cannot be empty")
+        assert (await manager.delete_task(99))[0] is None
+
+        await manager.add_task("Call mom")
+        assert await manager.delete_task(1) == (task, None)
+        assert [t.title for t in await manager.get_all_tasks()] == ["Call mom"]
+        assert await manager.task_count() == 1
+        await manager.close()
+
+    asyncio.run(scenario())
+    print("[PASS] Async operations passed\n")
+
+
+def test_concurrent_coroutines():
+    """Test that many coroutines' writes are batched without losing any."""
+    print("=" * 60)
+    print("TEST: Concurrent Coroutines")
+    print("=" * 60)
+
+    async def scenario():
+        inner = TodoManager()
+        manager = AsyncTodoManager(inner, max_batch=16)
+        batches = []
+        apply = manager._apply
+
+        def counting_apply(batch):
+            batches.append(len(batch))
+            return apply(batch)
+
+        manager._apply = counting_apply
+
+        async def client(index):
+            task, _ = await manager.add_task(f"Task {index}")
+            await manager.update_task(task.id, new_description=f"By {index}")
+            if index % 2:
+                await manager.mark_complete(task.id)
+            return task.id
+
+        ids = await asyncio.gather(*(client(index) for index in range(200)))
+        assert sorted(ids) == list(range(1, 201))
+        tasks = await manager.get_all_tasks()
+        assert [t.description for t in tasks] == [f"By {i - 1}" for i in sorted(ids)]
+        assert sum(t.status for t in tasks) == 100
+        # Writes queued together were applied together, within max_batch
+        assert max(batches) == 16 and len(batches) < sum(batches)
+
+        # Writes queued before close() are still applied
+        pending = asyncio.ensure_future(manager.add_task("Last one"))
+        await asyncio.sleep(0)
+        await manager.close()
+        assert (await pending)[0].id == 201
+        assert inner.task_count() == 201
+        try:
+            await manager.add_task("Too late")
+            raise AssertionError("wrote after close()")
+        except RuntimeError:
+            pass
+
+    asyncio.run(scenario())
+    print("[PASS] Concurrent coroutines passed\n")
+
+
+def test_journaled_manager():
+    """Test that close() flushes the journal of the wrapped manager."""
+    print("=" * 60)
+    print("TEST: Journaled Manager")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        async def scenario():
+            manager = AsyncTodoManager(TodoManager(journal=TaskJournal(directory)))
+            await asyncio.gather(*(manager.add_task(f"Task {i}") for i in range(50)))
+            await manager.close()
+
+        asyncio.run(scenario())
+        reopened = TodoManager(journal=TaskJournal(directory))
+        assert reopened.task_count() == 50
+        reopened.close()
+
+    print("[PASS] Journaled manager passed\n")
+
+
+def test_snapshot_failure_keeps_writes():
+    """Test that a failed snapshot neither fails the writes nor loses reads."""
+    print("=" * 60)
+    print("TEST: Snapshot Failure")
+    print("=" * 60)
+
+    class FlakyManager(TodoManager):
+        fail = False
+
+        def snapshot(self):
+            if self.fail:
+                raise MemoryError("no room for a snapshot")
+            return super().snapshot()
+
+    async def scenario():
+        wrapped = FlakyManager()
+        manager = AsyncTodoManager(wrapped)
+        await manager.add_task("First")
+
+        wrapped.fail = True
+        task, error = await manager.add_task("Second")
+        assert error is None and task.id == 2
+        # Reads keep the last good snapshot
+        assert [t.title for t in await manager.get_all_tasks()] == ["First"]
+
+        wrapped.fail = False
+        await manager.add_task("Third")
+        assert await manager.task_count() == 3
+        await manager.close()
+
+    asyncio.run(scenario())
+    print("[PASS] Snapshot failure passed\n")
+
+
+def run_all_tests():
+    """Run all async manager tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING ASYNC MANAGER TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_async_operations,
+        test_concurrent_coroutines,
+        test_journaled_manager,
+        test_snapshot_failure_keeps_writes,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,115 @@
+"""
+Test script for the non-interactive script mode.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from batch import run_script
+from todo_manager import TodoManager
+
+
+def run(lines):
+    """Run script lines on a fresh manager; return (manager, results, failures)."""
+    manager = TodoManager()
+    output = io.StringIO()
+    failures = run_script(manager, lines, output)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    return manager, results, failures
+
+
+def test_script_commands():
+    """Test each script command and its JSON result."""
+    print("=" * 60)
+    print("TEST: Script Commands")
+    print("=" * 60)
+
+    manager, results, failures = run(
+        [
+            "# seed data\n",
+            "add Buy groceries\tMilk\\nEggs\n",
+            "add Call mom\n",
+            "\n",
+            "update 2\t\tSunday\n",
+            "complete 1\n",
+            "complete 1\n",
+            "get 1\n",
+            "delete 2\n",
+            "view\n",
+            "count\n",
+        ]
+    )
+
+    assert failures == 0
+    assert [r["line"] for r in results] == [2, 3, 5, 6, 7, 8, 9, 10, 11]
+    assert results[0] == {"ok": True, "id": 1, "line": 2}
+    assert results[2]["changed"] is True
+    assert manager.get_task(1).description == "Milk\nEggs"
+    assert results[3]["changed"] is True
+    assert results[4]["changed"] is False
+    assert results[5]["task"]["status"] is True
+    assert [t["id"] for t in results[7]["tasks"]] == [1]
+    assert results[8]["count"] == 1
+
+    print("[PASS] Script commands passed\n")
+
+
+def test_script_errors():
+    """Test that bad lines are reported and do not stop the script."""
+    print("=" * 60)
+    print("TEST: Script Errors")
+    print("=" * 60)
+
+    manager, results, failures = run(
+        ["add \n", "frobnicate 1\n", "delete abc\n", "complete 7\n", "add Still runs\n"]
+    )
+
+    assert failures == 4
+    assert results[0]["error"] == "Title cannot be empty"
+    assert results[1]["error"] == "Unknown command: 'frobnicate'"
+    assert results[2]["error"] == "Invalid task ID. Please provide a numeric ID"
+    assert results[3]["error"] == "Task with ID 7 not found"
+    assert results[4] == {"ok": True, "id": 1, "line": 5}
+    assert manager.task_count() == 1
+
+    print("[PASS] Script errors passed\n")
+
+
+def run_all_tests():
+    """Run all script mode tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING SCRIPT MODE TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_script_commands,
+        test_script_errors,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
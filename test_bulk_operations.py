@@ -0,0 +1,152 @@
+"""
+Test script for the bulk TodoManager operations.
+
+Covers add_many, complete_many and delete_many in both atomic and
+best-effort modes.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from todo_manager import TodoManager
+
+
+def test_add_many_best_effort():
+    """Test that valid items are added and invalid ones reported."""
+    print("=" * 60)
+    print("TEST: add_many Best Effort")
+    print("=" * 60)
+
+    manager = TodoManager()
+    manager.add_task("Existing")
+
+    result = manager.add_many(
+        [("Buy milk", None), ("   ", None), ("  Call mom  ", "Sunday"), ("x" * 201, "")]
+    )
+    assert result.applied is True
+    assert result.ok is False
+    assert result.ids == [2, None, 3, None]
+    assert result.changed == 2
+    assert result.errors[1] == "Title cannot be empty"
+    assert "200 characters" in result.errors[3]
+
+    assert manager.get_task(3).title == "Call mom"
+    assert manager.get_task(3).description == "Sunday"
+    assert manager.get_task(2).created_at == manager.get_task(3).created_at
+
+    # IDs continue after the allocated range
+    task, _ = manager.add_task("Next")
+    assert task.id == 4
+
+    print("[PASS] add_many best effort passed\n")
+
+
+def test_add_many_atomic():
+    """Test that an atomic batch with one bad item adds nothing."""
+    print("=" * 60)
+    print("TEST: add_many Atomic")
+    print("=" * 60)
+
+    manager = TodoManager()
+    result = manager.add_many([("Good", None), ("", None)], atomic=True)
+    assert result.applied is False
+    assert result.ids == [None, None]
+    assert list(result.errors) == [1]
+    assert manager.task_count() == 0
+
+    result = manager.add_many([("One", None), ("Two", "2")], atomic=True)
+    assert result.ok
+    assert result.ids == [1, 2]
+
+    print("[PASS] add_many atomic passed\n")
+
+
+def test_complete_many():
+    """Test completing many tasks, including missing and complete ones."""
+    print("=" * 60)
+    print("TEST: complete_many")
+    print("=" * 60)
+
+    manager = TodoManager()
+    manager.add_many([(f"Task {i}", None) for i in range(5)])
+    manager.mark_complete(2)
+
+    result = manager.complete_many([1, 2, 99], atomic=True)
+    assert result.applied is False
+    assert result.errors == {2: "Task with ID 99 not found"}
+    assert manager.get_task(1).status is False
+
+    result = manager.complete_many([1, 2, 99, 3])
+    assert result.ids == [1, 2, None, 3]
+    assert result.changed == 2
+    assert [t.status for t in manager.get_all_tasks()] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+    print("[PASS] complete_many passed\n")
+
+
+def test_delete_many():
+    """Test deleting many tasks, including missing and repeated IDs."""
+    print("=" * 60)
+    print("TEST: delete_many")
+    print("=" * 60)
+
+    manager = TodoManager()
+    manager.add_many([(f"Task {i}", None) for i in range(5)])
+
+    result = manager.delete_many([1, 1], atomic=True)
+    assert result.applied is False
+    assert manager.task_count() == 5
+
+    result = manager.delete_many([1, 3, 3, 42])
+    assert result.ids == [1, 3, None, None]
+    assert result.changed == 2
+    assert set(result.errors) == {2, 3}
+    assert [t.id for t in manager.get_all_tasks()] == [2, 4, 5]
+
+    print("[PASS] delete_many passed\n")
+
+
+def run_all_tests():
+    """Run all bulk operation tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING BULK OPERATION TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_add_many_best_effort,
+        test_add_many_atomic,
+        test_complete_many,
+        test_delete_many,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,252 @@
+"""
+Test script for command-line parsing, one-shot commands and lazy imports.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout, suppress
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from main import _parse_args_with_argparse, main, parse_args, run_command
+from persistence import JOURNAL_NAME, TaskJournal
+from todo_manager import TodoManager
+
+MAIN = str(Path(__file__).parent / "src" / "main.py")
+
+# Modules a one-shot add must not import
+HEAVY_MODULES = {
+    "argparse",
+    "batch",
+    "dataclasses",
+    "datetime",
+    "pathlib",
+    "search_index",
+    "shared_manager",
+    "transfer",
+    "typing",
+}
+
+
+def fields(options):
+    """Return parsed options as a comparable tuple."""
+    return (
+        options.data_dir,
+        options.fsync,
+        options.script,
+        options.command,
+        options.args,
+        options.shared,
+    )
+
+
+def test_parse_args():
+    """Test that the fast parser agrees with argparse."""
+    print("=" * 60)
+    print("TEST: parse_args()")
+    print("=" * 60)
+
+    saved = os.environ.pop("TODO_DATA_DIR", None)
+    try:
+        for argv in (
+            [],
+            ["--data-dir", "tasks", "add", "Buy milk", "2 liters"],
+            ["--data-dir=tasks", "--fsync", "never", "view", "--compact"],
+            ["--script", "-"],
+            ["--shared", "--data-dir", "tasks", "view"],
+            ["Complete", "3"],
+        ):
+            assert fields(parse_args(argv)) == fields(_parse_args_with_argparse(argv))
+
+        options = parse_args(["--fsync=always", "delete", "4"])
+        assert (options.fsync, options.command, options.args) == (
+            "always",
+            "delete",
+            ["4"],
+        )
+
+        os.environ["TODO_DATA_DIR"] = "from-env"
+        assert parse_args(["view"]).data_dir == "from-env"
+        assert parse_args(["--data-dir", "flag", "view"]).data_dir == "flag"
+    finally:
+        os.environ.pop("TODO_DATA_DIR", None)
+        if saved is not None:
+            os.environ["TODO_DATA_DIR"] = saved
+
+    print("[PASS] parse_args passed\n")
+
+
+def test_run_command():
+    """Test one-shot commands and their success results."""
+    print("=" * 60)
+    print("TEST: run_command()")
+    print("=" * 60)
+
+    manager = TodoManager()
+    out = io.StringIO()
+    with redirect_stdout(out):
+        assert run_command(manager, "add", ["Buy milk", "2 liters"])
+        assert run_command(manager, "add", ["Call mom"])
+        assert run_command(manager, "complete", ["2"])
+        assert run_command(manager, "update", ["1", "", "3 liters"])
+        assert run_command(manager, "view", ["--compact"])
+        assert run_command(manager, "search", ["milk"])
+
+        assert not run_command(manager, "add", [""])
+        assert not run_command(manager, "delete", ["9"])
+        assert not run_command(manager, "complete", ["abc"])
+        assert not run_command(manager, "view", ["--bogus"])
+        assert not run_command(manager, "add", [])
+        assert not run_command(manager, "frobnicate", [])
+        assert run_command(manager, "delete", ["2"])
+
+    text = out.getvalue()
+    assert "Task marked as complete!" in text
+    assert "Usage: todo add TITLE [DESCRIPTION]" in text
+    assert "Unknown command: 'frobnicate'" in text
+    assert [(t.title, t.description) for t in manager.get_all_tasks()] == [
+        ("Buy milk", "3 liters")
+    ]
+
+    print("[PASS] run_command passed\n")
+
+
+def test_one_shot_commands_persist():
+    """Test that one-shot commands share state through the data directory."""
+    print("=" * 60)
+    print("TEST: One-Shot Commands Persist")
+    print("=" * 60)
+
+    def exit_code(argv):
+        try:
+            with redirect_stdout(io.StringIO()):
+                main(argv)
+        except SystemExit as e:
+            return e.code
+        raise AssertionError("main() did not exit")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        assert exit_code(["--data-dir", data_dir, "add", "First"]) == 0
+        assert exit_code(["--data-dir", data_dir, "add", "Second"]) == 0
+        assert exit_code(["--data-dir", data_dir, "complete", "1"]) == 0
+        assert exit_code(["--data-dir", data_dir, "delete", "7"]) == 1
+
+        out = io.StringIO()
+        with redirect_stdout(out), suppress(SystemExit):
+            main(["--data-dir", data_dir, "view", "--complete"])
+        assert "First" in out.getvalue() and "Second" not in out.getvalue()
+
+    print("[PASS] One-shot commands persist\n")
+
+
+def test_menu_saves_each_command():
+    """Test that a menu command is on disk before the next one is typed."""
+    print("=" * 60)
+    print("TEST: Menu Saves Each Command")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        TodoManager(journal=TaskJournal(data_dir)).close()
+        journal_path = Path(data_dir) / JOURNAL_NAME
+        empty_size = journal_path.stat().st_size
+
+        menu = subprocess.Popen(
+            [sys.executable, MAIN, "--data-dir", data_dir],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            menu.stdin.write("add\nBuy milk\n\n")
+            menu.stdin.flush()
+            # Then the menu waits for input; kill it as a closed terminal would
+            deadline = time.monotonic() + 10
+            while journal_path.stat().st_size == empty_size:
+                assert time.monotonic() < deadline, "add was not saved"
+                time.sleep(0.02)
+        finally:
+            menu.kill()
+            menu.wait()
+
+        manager = TodoManager(journal=TaskJournal(data_dir))
+        assert [task.title for task in manager.get_all_tasks()] == ["Buy milk"]
+        manager.close()
+
+    print("[PASS] Menu saves each command\n")
+
+
+def imported_modules(*args):
+    """Run Python with the given arguments; return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_one_shot_add_imports_little():
+    """Test that a one-shot add leaves optional modules unimported."""
+    print("=" * 60)
+    print("TEST: Lazy Imports")
+    print("=" * 60)
+
+    # Only count what the add imports beyond interpreter startup, which may
+    # import more (for example from .pth files) depending on the environment
+    startup = imported_modules("-c", "pass")
+    with tempfile.TemporaryDirectory() as data_dir:
+        imported = imported_modules(MAIN, "--data-dir", data_dir, "add", "Lazy")
+    added = imported - startup
+    assert "persistence" in added
+    assert not added & HEAVY_MODULES, added & HEAVY_MODULES
+
+    print("[PASS] Lazy imports passed\n")
+
+
+def run_all_tests():
+    """Run all command-line tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING COMMAND-LINE TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_parse_args,
+        test_run_command,
+        test_one_shot_commands_persist,
+        test_menu_saves_each_command,
+        test_one_shot_add_imports_little,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
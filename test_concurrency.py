@@ -0,0 +1,230 @@
+"""
+Test script for the thread-safe ConcurrentTodoManager.
+
+Each test runs several threads against one shared manager.
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from concurrent_manager import ConcurrentTodoManager
+from persistence import FSYNC_NEVER, TaskJournal
+from todo_manager import TodoManager
+
+
+def run_threads(count, target, *args):
+    """Start count threads running target(index, *args) and wait for them."""
+    threads = [
+        threading.Thread(target=target, args=(index, *args)) for index in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_adds_get_unique_ids():
+    """Test that concurrent adds allocate every ID exactly once."""
+    print("=" * 60)
+    print("TEST: Concurrent Adds")
+    print("=" * 60)
+
+    manager = ConcurrentTodoManager()
+    ids = [[] for _ in range(8)]
+
+    def worker(index):
+        for i in range(500):
+            task, error = manager.add_task(f"Worker {index} task {i}")
+            assert error is None
+            ids[index].append(task.id)
+
+    run_threads(8, worker)
+
+    all_ids = sorted(task_id for worker_ids in ids for task_id in worker_ids)
+    assert all_ids == list(range(1, 4001))
+    # Each thread saw its own IDs in increasing order
+    assert all(worker_ids == sorted(worker_ids) for worker_ids in ids)
+    assert manager.task_count() == 4000
+
+    print("[PASS] Concurrent adds passed\n")
+
+
+def test_readers_never_see_partial_updates():
+    """Test that lock-free reads always see whole versions of a task."""
+    print("=" * 60)
+    print("TEST: Readers See Whole Updates")
+    print("=" * 60)
+
+    manager = ConcurrentTodoManager()
+    for _ in range(50):
+        manager.add_task("Version 0", "Version 0")
+    done = threading.Event()
+    torn = []
+
+    def writer(index):
+        for version in range(1, 300):
+            for task_id in range(1, 51):
+                text = f"Version {version}"
+                manager.update_task(task_id, new_title=text, new_description=text)
+        done.set()
+
+    def reader(index):
+        while not done.is_set():
+            task = manager.get_task(index % 50 + 1)
+            if task.title != task.description:
+                torn.append(task)
+            for task in manager.get_all_tasks():
+                if task.title != task.description:
+                    torn.append(task)
+
+    threads = [threading.Thread(target=writer, args=(0,))]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert torn == []
+    assert all(t.title == "Version 299" for t in manager.get_all_tasks())
+
+    print("[PASS] Readers see whole updates\n")
+
+
+def test_snapshot_is_stable():
+    """Test that a list snapshot is unaffected by later writes."""
+    print("=" * 60)
+    print("TEST: Stable Snapshots")
+    print("=" * 60)
+
+    manager = ConcurrentTodoManager()
+    manager.add_many([(f"Task {i}", None) for i in range(10)])
+    tasks = manager.iter_tasks(start_id=4, limit=3)
+    before = manager.get_all_tasks()
+
+    manager.mark_complete(5)
+    manager.delete_task(6)
+    manager.update_task(4, new_title="Renamed")
+
+    assert [(t.id, t.title, t.status) for t in tasks] == [
+        (4, "Task 3", False),
+        (5, "Task 4", False),
+        (6, "Task 5", False),
+    ]
+    assert len(before) == 10 and not before[4].status
+    assert [t.id for t in manager.iter_tasks(4, 3)] == [4, 5, 7]
+    assert [t.id for t in manager.iter_page(1, 2, status=True)] == [5]
+    assert [t.id for t in manager.iter_page(3, 4)] == [10]
+    assert manager.count_by_status() == {"complete": 1, "incomplete": 8}
+    assert [t.id for t in manager.search("renamed")] == [4]
+
+    print("[PASS] Stable snapshots passed\n")
+
+
+def test_concurrent_mixed_operations():
+    """Test that mixed concurrent operations leave a consistent manager."""
+    print("=" * 60)
+    print("TEST: Mixed Concurrent Operations")
+    print("=" * 60)
+
+    manager = ConcurrentTodoManager()
+    manager.add_many([(f"Task {i}", None) for i in range(1000)])
+
+    def worker(index):
+        # Each thread owns the IDs congruent to its index
+        for task_id in range(index + 1, 1001, 4):
+            if task_id % 3 == 0:
+                manager.delete_task(task_id)
+            else:
+                manager.mark_complete(task_id)
+            manager.add_task(f"Extra {index}")
+
+    run_threads(4, worker)
+
+    deleted = len(range(3, 1001, 3))
+    counts = manager.count_by_status()
+    assert counts == {"complete": 1000 - deleted, "incomplete": 1000}
+    assert manager.task_count() == 2000 - deleted
+    ids = [t.id for t in manager.get_all_tasks()]
+    assert ids == sorted(ids) and ids[-1] == 2000
+
+    print("[PASS] Mixed concurrent operations passed\n")
+
+
+def test_flush_during_writes_keeps_journal_whole():
+    """Test that flushing while other threads write loses no journal records."""
+    print("=" * 60)
+    print("TEST: Flush During Concurrent Writes")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        journal = TaskJournal(data_dir, fsync=FSYNC_NEVER, group_size=50)
+        manager = ConcurrentTodoManager(journal)
+        done = threading.Event()
+
+        def writer(index):
+            for batch in range(50):
+                manager.add_many(
+                    [(f"Worker {index} batch {batch} task {i}", None) for i in range(7)]
+                )
+
+        def flusher():
+            while not done.is_set():
+                manager.flush()
+
+        flushing = threading.Thread(target=flusher)
+        flushing.start()
+        run_threads(4, writer)
+        done.set()
+        flushing.join()
+        manager.close()
+
+        reopened = TodoManager(journal=TaskJournal(data_dir))
+        assert reopened.task_count() == 1400
+        ids = [t.id for t in reopened.get_all_tasks()]
+        assert ids == list(range(1, 1401))
+        reopened.close()
+
+    print("[PASS] Flush during concurrent writes passed\n")
+
+
+def run_all_tests():
+    """Run all concurrency tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING CONCURRENCY TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_concurrent_adds_get_unique_ids,
+        test_readers_never_see_partial_updates,
+        test_snapshot_is_stable,
+        test_concurrent_mixed_operations,
+        test_flush_during_writes_keeps_journal_whole,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,217 @@
+"""
+Test script for journal and snapshot persistence.
+
+Each test works in its own temporary data directory.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from persistence import JOURNAL_NAME, PersistenceError, TaskJournal
+from storage import ColumnarTaskStore
+from todo_manager import TodoManager
+
+
+def reopen(data_dir, **options):
+    """Open a new manager on an existing data directory."""
+    return TodoManager(journal=TaskJournal(data_dir, **options))
+
+
+def snapshot_state(manager):
+    """Return all task fields as plain tuples for comparison."""
+    return [
+        (t.id, t.title, t.description, t.status, t.created_at)
+        for t in manager.get_all_tasks()
+    ]
+
+
+def test_journal_round_trip():
+    """Test that every kind of change survives a restart."""
+    print("=" * 60)
+    print("TEST: Journal Round Trip")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = reopen(data_dir)
+        manager.add_task("Buy groceries", "Milk\nEggs")
+        manager.add_task("Café ☕")
+        manager.add_task("Temporary")
+        manager.update_task(1, new_title="Shopping", new_description="")
+        manager.mark_complete(2)
+        manager.delete_task(3)
+        expected = snapshot_state(manager)
+        manager.close()
+
+        manager = reopen(data_dir)
+        assert snapshot_state(manager) == expected
+        # Deleted IDs are never reused
+        task, _ = manager.add_task("After restart")
+        assert task.id == 4
+        manager.close()
+
+    print("[PASS] Journal round trip passed\n")
+
+
+def test_snapshot_and_replay():
+    """Test recovery from a snapshot plus a journal tail."""
+    print("=" * 60)
+    print("TEST: Snapshot and Replay")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = reopen(data_dir, snapshot_every=50)
+        for i in range(120):
+            manager.add_task(f"Task {i}")
+        for task_id in range(1, 120, 3):
+            manager.mark_complete(task_id)
+        manager.delete_task(120)
+        expected = snapshot_state(manager)
+        manager.close()
+
+        journal = TaskJournal(data_dir)
+        manager = TodoManager(journal=journal)
+        # Only the operations since the last snapshot were replayed
+        assert journal._generation > 0
+        assert journal._journal_length < 50
+        assert snapshot_state(manager) == expected
+        task, _ = manager.add_task("Next")
+        assert task.id == 121
+        manager.close()
+
+    print("[PASS] Snapshot and replay passed\n")
+
+
+def test_torn_tail_is_discarded():
+    """Test that a partially written last record is ignored and truncated."""
+    print("=" * 60)
+    print("TEST: Torn Journal Tail")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = reopen(data_dir, fsync="always")
+        manager.add_task("Kept")
+        manager.add_task("Torn")
+        manager.close()
+
+        journal_path = Path(data_dir) / JOURNAL_NAME
+        data = journal_path.read_bytes()
+        journal_path.write_bytes(data[:-3])
+
+        manager = reopen(data_dir)
+        assert [t.title for t in manager.get_all_tasks()] == ["Kept"]
+        manager.add_task("Appended")
+        manager.close()
+
+        manager = reopen(data_dir)
+        assert [t.title for t in manager.get_all_tasks()] == ["Kept", "Appended"]
+        manager.close()
+
+    print("[PASS] Torn tail test passed\n")
+
+
+def test_group_commit_buffers_writes():
+    """Test that batch mode buffers operations until the group is full."""
+    print("=" * 60)
+    print("TEST: Group Commit")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        journal = TaskJournal(data_dir, group_size=10, group_interval=60)
+        manager = TodoManager(journal=journal)
+        journal_path = Path(data_dir) / JOURNAL_NAME
+        empty_size = journal_path.stat().st_size
+
+        for i in range(9):
+            manager.add_task(f"Task {i}")
+        assert journal_path.stat().st_size == empty_size
+        manager.add_task("Task 9")
+        assert journal_path.stat().st_size > empty_size
+        manager.close()
+
+    print("[PASS] Group commit test passed\n")
+
+
+def test_columnar_store_recovery():
+    """Test recovering into the columnar storage engine."""
+    print("=" * 60)
+    print("TEST: Columnar Store Recovery")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = reopen(data_dir, snapshot_every=20)
+        for i in range(45):
+            manager.add_task(f"Task {i}", f"Details {i}")
+        manager.update_task(44, new_title="Last one")
+        expected = snapshot_state(manager)
+        manager.close()
+
+        journal = TaskJournal(data_dir)
+        manager = TodoManager(ColumnarTaskStore(), journal=journal)
+        assert snapshot_state(manager) == expected
+        manager.close()
+
+    print("[PASS] Columnar store recovery passed\n")
+
+
+def test_unknown_journal_format_is_rejected():
+    """Test that a journal in another format is reported, not overwritten."""
+    print("=" * 60)
+    print("TEST: Unknown Journal Format")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        journal_path = Path(data_dir) / JOURNAL_NAME
+        old_journal = b"TODOJNL1" + bytes(8) + b"old records"
+        journal_path.write_bytes(old_journal)
+
+        try:
+            reopen(data_dir)
+            raise AssertionError("Expected PersistenceError")
+        except PersistenceError:
+            pass
+        assert journal_path.read_bytes() == old_journal
+
+    print("[PASS] Unknown journal format test passed\n")
+
+
+def run_all_tests():
+    """Run all persistence tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING PERSISTENCE TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_journal_round_trip,
+        test_snapshot_and_replay,
+        test_torn_tail_is_discarded,
+        test_group_commit_buffers_writes,
+        test_columnar_store_recovery,
+        test_unknown_journal_format_is_rejected,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,138 @@
+"""
+Test script for task list rendering and the view command options.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from main import parse_view_options
+from render import render_page, render_task_list, write_buffered
+from todo_manager import TodoManager
+
+
+def render(chunks):
+    """Collect rendered chunks into one string."""
+    out = io.StringIO()
+    write_buffered(chunks, out)
+    return out.getvalue()
+
+
+def test_parse_view_options():
+    """Test parsing of view command options."""
+    print("=" * 60)
+    print("TEST: parse_view_options()")
+    print("=" * 60)
+
+    options, error = parse_view_options([])
+    assert error is None
+    assert options == {"page": None, "size": 20, "compact": False, "status": None}
+
+    options, _ = parse_view_options(["--page", "3", "--size", "5", "--compact"])
+    assert options == {"page": 3, "size": 5, "compact": True, "status": None}
+
+    assert parse_view_options(["--complete"])[0]["status"] is True
+    assert parse_view_options(["--incomplete"])[0]["status"] is False
+    assert parse_view_options(["--complete", "--incomplete"])[1] is not None
+
+    options, _ = parse_view_options(["--size", "5"])
+    assert options["page"] == 1
+
+    assert parse_view_options(["--page"])[1] == "--page needs a positive number"
+    assert parse_view_options(["--size", "0"])[1] is not None
+    assert parse_view_options(["--all"])[1] == "Unknown view option: '--all'"
+
+    print("[PASS] View option parsing passed\n")
+
+
+def test_render_full_list():
+    """Test the full list rendering from a generator."""
+    print("=" * 60)
+    print("TEST: Render Full List")
+    print("=" * 60)
+
+    manager = TodoManager()
+    manager.add_task("Buy groceries", "Milk\nEggs")
+    manager.add_task("Call mom")
+    manager.mark_complete(2)
+
+    text = render(render_task_list(manager.iter_tasks()))
+    assert "Task #1" in text and "Task #2" in text
+    assert "Description:\n  Milk\n  Eggs" in text
+    assert text.count("-" * 60) == 1
+    assert "Summary: 2 task(s) (1 complete, 1 incomplete)" in text
+
+    text = render(render_task_list(manager.iter_tasks(), compact=True))
+    assert "Milk" not in text
+    assert "     1  [ ]" in text
+    assert "     2  [x]" in text
+
+    text = render(render_task_list(iter([])))
+    assert "Your todo list is empty" in text
+    assert "Summary" not in text
+
+    print("[PASS] Full list rendering passed\n")
+
+
+def test_render_pages():
+    """Test paged rendering, including pages past the end."""
+    print("=" * 60)
+    print("TEST: Render Pages")
+    print("=" * 60)
+
+    manager = TodoManager()
+    for i in range(25):
+        manager.add_task(f"Task {i + 1}")
+    manager.delete_task(3)
+
+    text = render(render_page(manager.iter_page(3, 10), 3, 10, 24))
+    assert "Page 3 of 3 (24 task(s))" in text
+    assert text.count("Task #") == 4
+    assert "Task #22" in text and "Task #25" in text
+
+    text = render(render_page(manager.iter_page(1, 2), 1, 2, 24))
+    assert "Task #1\n" in text and "Task #2\n" in text and "Task #4" not in text
+
+    text = render(render_page(manager.iter_page(9, 10), 9, 10, 24))
+    assert "Page 9 is empty. The list has 3 page(s)." in text
+
+    print("[PASS] Page rendering passed\n")
+
+
+def run_all_tests():
+    """Run all rendering tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING RENDERING TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_parse_view_options,
+        test_render_full_list,
+        test_render_pages,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,158 @@
+"""
+Test script for full-text search.
+
+Checks that the search index follows adds, updates and deletes.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from batch import run_script
+from search_index import SearchIndex, tokenize
+from storage import ColumnarTaskStore
+from todo_manager import TodoManager
+
+
+def ids(tasks):
+    """Return the IDs of a list of tasks."""
+    return [task.id for task in tasks]
+
+
+def test_tokenize():
+    """Test tokenization of titles and descriptions."""
+    print("=" * 60)
+    print("TEST: tokenize()")
+    print("=" * 60)
+
+    assert tokenize("Buy MILK, eggs & bread!") == ["buy", "milk", "eggs", "bread"]
+    assert tokenize("Café ☕ at 10:30") == ["café", "at", "10", "30"]
+    assert tokenize("   ") == []
+
+    print("[PASS] Tokenize tests passed\n")
+
+
+def test_and_prefix_and_ranking():
+    """Test AND queries, prefix terms and title-first ranking."""
+    print("=" * 60)
+    print("TEST: AND, Prefix and Ranking")
+    print("=" * 60)
+
+    manager = TodoManager()
+    manager.add_task("Buy groceries", "milk and eggs")
+    manager.add_task("Call mom", "ask about groceries")
+    manager.add_task("Grocery budget")
+    manager.add_task("Fix bike")
+
+    # Title matches rank above description matches
+    assert ids(manager.search("groceries")) == [1, 2]
+    assert ids(manager.search("GROCERIES milk")) == [1]
+    assert ids(manager.search("groceries bike")) == []
+    assert sorted(ids(manager.search("groc*"))) == [1, 2, 3]
+    assert ids(manager.search("nothing*")) == []
+    assert ids(manager.search("")) == []
+    assert len(manager.search("groc*", limit=2)) == 2
+
+    print("[PASS] AND, prefix and ranking tests passed\n")
+
+
+def test_index_follows_changes():
+    """Test that updates and deletes after the first search are indexed."""
+    print("=" * 60)
+    print("TEST: Index Follows Changes")
+    print("=" * 60)
+
+    for store in (None, ColumnarTaskStore()):
+        manager = TodoManager(store)
+        manager.add_task("Write report", "quarterly numbers")
+        assert ids(manager.search("report")) == [1]
+
+        manager.add_task("Review report")
+        manager.update_task(1, new_title="Write summary")
+        assert ids(manager.search("report")) == [2]
+        assert ids(manager.search("summary quarterly")) == [1]
+
+        manager.delete_task(2)
+        assert ids(manager.search("report")) == []
+        assert ids(manager.search("rev*")) == []
+
+        manager.add_many([("Review budget", None), ("Report bug", None)])
+        assert ids(manager.search("rev*")) == [3]
+        manager.delete_many([3])
+        assert ids(manager.search("rev*")) == []
+        assert ids(manager.search("report")) == [4]
+
+    print("[PASS] Index follows changes\n")
+
+
+def test_search_index_removal_cleans_up():
+    """Test that removing the last task with a token drops the token."""
+    print("=" * 60)
+    print("TEST: Search Index Cleanup")
+    print("=" * 60)
+
+    index = SearchIndex()
+    index.add(1, "alpha beta", "")
+    index.add(2, "alpha", "")
+    index.remove(1, "alpha beta", "")
+    assert "beta" not in index._postings
+    assert [task_id for task_id, _ in index.search("alpha")] == [2]
+    assert len(index) == 1
+
+    print("[PASS] Search index cleanup passed\n")
+
+
+def test_search_script_command():
+    """Test the search command in script mode."""
+    print("=" * 60)
+    print("TEST: Script Search Command")
+    print("=" * 60)
+
+    output = io.StringIO()
+    run_script(TodoManager(), ["add Buy milk\n", "search mil*\n"], output)
+    result = json.loads(output.getvalue().splitlines()[1])
+    assert [task["id"] for task in result["tasks"]] == [1]
+
+    print("[PASS] Script search command passed\n")
+
+
+def run_all_tests():
+    """Run all search tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING SEARCH TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_tokenize,
+        test_and_prefix_and_ranking,
+        test_index_follows_changes,
+        test_search_index_removal_cleans_up,
+        test_search_script_command,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
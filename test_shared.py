@@ -0,0 +1,283 @@
+"""
+Test script for the shared-memory TodoManager.
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import shared_manager
+from main import main
+from persistence import PersistenceError
+from shared_manager import DATA_NAME, SharedTodoManager
+from todo_manager import TodoManager
+
+SRC = str(Path(__file__).parent / "src")
+
+# Adds tasks from a separate process: argv is directory, name, count
+ADD_SCRIPT = """
+import sys
+sys.path.insert(0, {src!r})
+from shared_manager import SharedTodoManager
+manager = SharedTodoManager(sys.argv[1])
+for number in range(int(sys.argv[3])):
+    task, error = manager.add_task(f"{{sys.argv[2]}} {{number}}")
+    assert error is None, error
+    if number % 3 == 0:
+        manager.mark_complete(task.id)
+manager.close()
+"""
+
+
+def test_managers_share_tasks():
+    """Test that two managers on one directory see each other's changes."""
+    print("=" * 60)
+    print("TEST: Managers Share Tasks")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        first = SharedTodoManager(directory)
+        second = SharedTodoManager(directory)
+
+        task, _ = first.add_task("Buy milk", "2 liters")
+        assert second.get_task(task.id).title == "Buy milk"
+        # IDs are allocated from the shared table
+        other, _ = second.add_task("Call mom")
+        assert other.id == task.id + 1
+        assert first.add_task("Walk dog")[0].id == other.id + 1
+
+        second.update_task(task.id, "Buy oat milk", "")
+        second.mark_complete(other.id)
+        first.delete_task(other.id + 1)
+        assert [(t.title, t.status) for t in first.get_all_tasks()] == [
+            ("Buy oat milk", False),
+            ("Call mom", True),
+        ]
+        assert first.count_by_status() == {"complete": 1, "incomplete": 1}
+
+        # Search indexes catch up with changes made by the other manager
+        assert [t.id for t in first.search("milk")] == [task.id]
+        second.update_task(task.id, "Buy bread", "")
+        assert first.search("milk") == []
+        assert [t.id for t in first.search("bread")] == [task.id]
+
+        # Returned tasks are copies
+        copy = first.get_task(task.id)
+        second.mark_complete(task.id)
+        assert copy.status is False and first.get_task(task.id).status is True
+
+        first.close()
+        second.close()
+
+        # The table outlives the processes that used it
+        reopened = SharedTodoManager(directory)
+        assert [t.title for t in reopened.iter_tasks()] == ["Buy bread", "Call mom"]
+        assert reopened.add_task("Again")[0].id == 4
+        reopened.close()
+
+    print("[PASS] Managers share tasks passed\n")
+
+
+def test_iteration_streams_in_chunks():
+    """Test that iterating reads the table a chunk at a time, between writes."""
+    print("=" * 60)
+    print("TEST: Iteration Streams in Chunks")
+    print("=" * 60)
+
+    saved = shared_manager.READ_CHUNK
+    shared_manager.READ_CHUNK = 10
+    with tempfile.TemporaryDirectory() as directory:
+        reader = SharedTodoManager(directory)
+        writer = SharedTodoManager(directory)
+        try:
+            # One by one, so that every task has its own creation time
+            for i in range(95):
+                writer.add_task(f"Task {i}")
+            writer.complete_many(range(1, 96, 3))
+            tasks = writer.get_all_tasks()
+
+            assert list(reader.iter_tasks()) == tasks
+            assert list(reader.iter_tasks(start_id=8, limit=25)) == tasks[7:32]
+            assert list(reader.iter_tasks(limit=20)) == tasks[:20]
+            assert list(reader.iter_tasks(status=True)) == tasks[::3]
+            after, before = tasks[4].created_at, tasks[57].created_at
+            assert list(reader.iter_created_between(after, before)) == tasks[4:57]
+            assert list(reader.iter_created_between(after, limit=10)) == tasks[4:14]
+
+            # The lock is released between chunks, so writers can go on
+            stream = reader.iter_tasks()
+            assert next(stream).id == 1
+            added = threading.Thread(target=writer.add_task, args=("Late",))
+            added.daemon = True
+            added.start()
+            added.join(5)
+            assert not added.is_alive(), "iteration held the lock"
+            # ... and their changes show up in later chunks
+            assert [t.title for t in stream][-1] == "Late"
+        finally:
+            shared_manager.READ_CHUNK = saved
+            reader.close()
+            writer.close()
+
+    print("[PASS] Iteration streams in chunks passed\n")
+
+
+def test_table_growth():
+    """Test that rebuilding a full table is picked up by other managers."""
+    print("=" * 60)
+    print("TEST: Table Growth")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        writer = SharedTodoManager(directory)
+        reader = SharedTodoManager(directory)
+        expected = TodoManager()
+
+        # Enough rows and text to outgrow the initial table several times
+        for number in range(3000):
+            title = f"Task {number} " + "é" * (number % 50)
+            writer.add_task(title, "x" * (number % 120))
+            expected.add_task(title, "x" * (number % 120))
+            if number % 7 == 0:
+                writer.delete_task(number // 2 + 1)
+                expected.delete_task(number // 2 + 1)
+            if number % 5 == 0:
+                writer.update_task(number + 1, f"Renamed {number}", "")
+                expected.update_task(number + 1, f"Renamed {number}", "")
+
+        def rows(manager):
+            return [
+                (t.id, t.title, t.description, t.status, t.created_at)
+                for t in manager.get_all_tasks()
+            ]
+
+        assert rows(reader) == rows(writer)
+        assert [row[:4] for row in rows(reader)] == [row[:4] for row in rows(expected)]
+        assert reader.task_count() == expected.task_count()
+        assert [t.id for t in reader.iter_page(2, 25)] == [
+            t.id for t in expected.iter_page(2, 25)
+        ]
+        assert [t.id for t in reader.iter_tasks(status=False)] == [
+            t.id for t in expected.iter_tasks(status=False)
+        ]
+        created = rows(writer)[100][4]
+        assert [t.id for t in reader.iter_created_between(created)] == [
+            row[0] for row in rows(writer)[100:]
+        ]
+        writer.close()
+        reader.close()
+
+    print("[PASS] Table growth passed\n")
+
+
+def test_processes_share_tasks():
+    """Test that concurrent processes allocate distinct IDs and lose no tasks."""
+    print("=" * 60)
+    print("TEST: Processes Share Tasks")
+    print("=" * 60)
+
+    processes = 4
+    count = 400
+    with tempfile.TemporaryDirectory() as directory:
+        script = ADD_SCRIPT.format(src=SRC)
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, directory, f"p{n}", str(count)]
+            )
+            for n in range(processes)
+        ]
+        assert all(worker.wait(timeout=120) == 0 for worker in workers)
+
+        manager = SharedTodoManager(directory)
+        tasks = manager.get_all_tasks()
+        assert [t.id for t in tasks] == list(range(1, processes * count + 1))
+        assert sorted(t.title for t in tasks) == sorted(
+            f"p{n} {number}" for n in range(processes) for number in range(count)
+        )
+        # ID order is creation order across processes too
+        assert [t.created_at for t in tasks] == sorted(t.created_at for t in tasks)
+        assert manager.count_by_status()["complete"] == processes * ((count + 2) // 3)
+        manager.close()
+
+    print("[PASS] Processes share tasks passed\n")
+
+
+def test_shared_command_line():
+    """Test the --shared option and a file that is not a shared table."""
+    print("=" * 60)
+    print("TEST: Shared Command Line")
+    print("=" * 60)
+
+    def run(*argv):
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                main(list(argv))
+        except SystemExit as e:
+            return e.code, out.getvalue()
+        raise AssertionError("main() did not exit")
+
+    with tempfile.TemporaryDirectory() as directory:
+        code, out = run("--shared", "--data-dir", directory, "add", "Shared task")
+        assert code == 0 and os.path.exists(os.path.join(directory, DATA_NAME))
+        code, out = run("--data-dir", directory, "--shared", "view")
+        assert code == 0 and "Shared task" in out
+
+        code, out = run("--shared", "view")
+        assert code == 2 and "--shared needs --data-dir" in out
+
+        with open(os.path.join(directory, DATA_NAME), "wb") as f:
+            f.write(b"not a table" * 20)
+        try:
+            SharedTodoManager(directory)
+            raise AssertionError("opened a file that is not a shared table")
+        except PersistenceError:
+            pass
+
+    print("[PASS] Shared command line passed\n")
+
+
+def run_all_tests():
+    """Run all shared manager tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING SHARED MANAGER TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_managers_share_tasks,
+        test_iteration_streams_in_chunks,
+        test_table_growth,
+        test_processes_share_tasks,
+        test_shared_command_line,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -0,0 +1,385 @@
+"""
+Test script for the TodoManager storage engines.
+
+Runs the same manager operations against the default, columnar and persistent
+stores.
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from concurrent_manager import ConcurrentTodoManager
+from models import datetime_to_timestamp, format_timestamp, text_pool
+from storage import ColumnarTaskStore, DictTaskStore, PersistentTaskStore
+from todo_manager import TodoManager
+
+
+def test_columnar_basic_operations():
+    """Test add, get, update, complete and delete on the columnar store."""
+    print("=" * 60)
+    print("TEST: Columnar Store Basic Operations")
+    print("=" * 60)
+
+    manager = TodoManager(ColumnarTaskStore())
+
+    task, error = manager.add_task("  Buy groceries  ", "Milk\nEggs")
+    assert error is None
+    assert task.id == 1
+    assert task.title == "Buy groceries"
+    assert task.description == "Milk\nEggs"
+    assert task.status is False
+
+    manager.add_task("Café ☕ meeting")
+    assert manager.get_task(2).title == "Café ☕ meeting"
+    assert manager.get_task(2).description == ""
+
+    updated, error, changed = manager.update_task(1, new_title="Shopping")
+    assert changed is True
+    assert updated.title == "Shopping"
+    assert updated.description == "Milk\nEggs"
+
+    task, error, changed = manager.mark_complete(2)
+    assert changed is True
+    assert manager.get_task(2).status is True
+
+    deleted, error = manager.delete_task(1)
+    assert deleted.title == "Shopping"
+    assert manager.get_task(1) is None
+    assert manager.task_count() == 1
+
+    _, error = manager.delete_task(1)
+    assert error == "Task with ID 1 not found"
+
+    print("[PASS] Columnar store basic operations passed\n")
+
+
+def test_stores_agree():
+    """Test that all stores produce identical results for the same workload."""
+    print("=" * 60)
+    print("TEST: Stores Agree")
+    print("=" * 60)
+
+    managers = [
+        TodoManager(DictTaskStore()),
+        TodoManager(ColumnarTaskStore()),
+        TodoManager(PersistentTaskStore()),
+    ]
+
+    for manager in managers:
+        for i in range(3000):
+            manager.add_task(f"Task {i}", "x" * (i % 7))
+        # Enough deletes and rewrites to trigger compaction
+        for task_id in range(1, 3001, 2):
+            manager.delete_task(task_id)
+        for task_id in range(2, 3001, 4):
+            manager.update_task(task_id, new_title=f"Renamed {task_id}")
+            manager.mark_complete(task_id)
+
+    dict_tasks, *other_tasks = (m.get_all_tasks() for m in managers)
+    assert len(dict_tasks) == 1500
+    for tasks in other_tasks:
+        assert len(tasks) == 1500
+        assert [t.id for t in tasks] == sorted(t.id for t in tasks)
+        for expected, actual in zip(dict_tasks, tasks, strict=True):
+            assert actual.id == expected.id
+            assert actual.title == expected.title
+            assert actual.description == expected.description
+            assert actual.status == expected.status
+
+    print("[PASS] Stores agree\n")
+
+
+def test_view_survives_compaction():
+    """Test that a task view stays valid after the store compacts."""
+    print("=" * 60)
+    print("TEST: View Survives Compaction")
+    print("=" * 60)
+
+    store = ColumnarTaskStore()
+    manager = TodoManager(store)
+    for i in range(2000):
+        manager.add_task(f"Task {i}")
+
+    view = manager.get_task(2000)
+    for task_id in range(1, 1999):
+        manager.delete_task(task_id)
+
+    assert store._generation > 0
+    assert view.title == "Task 1999"
+    assert view.to_task() == manager.get_task(2000)
+
+    print("[PASS] View survives compaction\n")
+
+
+def test_iter_tasks_paging():
+    """Test paging through tasks with iter_tasks on every store."""
+    print("=" * 60)
+    print("TEST: iter_tasks Paging")
+    print("=" * 60)
+
+    for store in (DictTaskStore(), ColumnarTaskStore(), PersistentTaskStore()):
+        manager = TodoManager(store)
+        for i in range(3000):
+            manager.add_task(f"Task {i}")
+        # Delete most tasks so the ordered index compacts
+        for task_id in range(1, 2500):
+            manager.delete_task(task_id)
+        manager.delete_task(2700)
+
+        # Walk in pages of 100, resuming after the last ID seen
+        seen = []
+        next_id = 1
+        while True:
+            page = list(manager.iter_tasks(start_id=next_id, limit=100))
+            if not page:
+                break
+            assert len(page) <= 100
+            seen.extend(task.id for task in page)
+            next_id = page[-1].id + 1
+
+        expected = [t for t in range(2500, 3001) if t != 2700]
+        assert seen == expected
+        assert [t.id for t in manager.get_all_tasks()] == expected
+        assert [t.id for t in manager.iter_tasks(2699, 3)] == [2699, 2701, 2702]
+        assert list(manager.iter_tasks(5000)) == []
+
+    print("[PASS] iter_tasks paging passed\n")
+
+
+def test_paging_across_deletes():
+    """Test page numbers and time seeks while deletes interleave with paging."""
+    print("=" * 60)
+    print("TEST: Paging Across Deletes")
+    print("=" * 60)
+
+    store = DictTaskStore()
+    manager = TodoManager(store)
+    for i in range(3000):
+        manager.add_task(f"Task {i}")
+    expected = list(range(1, 3001))
+    order = store._order
+
+    for page in range(1, 31):
+        # Delete one task ahead of the page and one already read
+        for task_id in (page * 97, page * 31):
+            if manager.delete_task(task_id)[0] is not None:
+                expected.remove(task_id)
+        ids = [t.id for t in manager.iter_page(page, 50)]
+        assert ids == expected[(page - 1) * 50 : page * 50]
+
+        task = manager.get_task(expected[page * 40])
+        assert store.id_created_from(task.created_at) == task.id
+        assert store.id_created_from(task.created_at + 1) == expected[page * 40 + 1]
+
+    # Removed IDs are stepped over, not rebuilt away
+    assert store._order is order
+    assert store.id_at(len(expected)) is None
+    assert store.id_at(len(expected) - 1) == 3000
+
+    print("[PASS] Paging across deletes passed\n")
+
+
+def test_status_index():
+    """Test status counts and filtered iteration on every store."""
+    print("=" * 60)
+    print("TEST: Status Index")
+    print("=" * 60)
+
+    for store in (DictTaskStore(), ColumnarTaskStore(), PersistentTaskStore()):
+        manager = TodoManager(store)
+        for i in range(2000):
+            manager.add_task(f"Task {i}")
+        for task_id in range(1, 2001, 10):
+            manager.mark_complete(task_id)
+        manager.mark_incomplete(11)
+        manager.delete_task(21)
+        manager.delete_task(22)
+
+        complete = [t for t in range(1, 2001, 10) if t not in (11, 21)]
+        assert manager.count_by_status() == {
+            "complete": len(complete),
+            "incomplete": 1998 - len(complete),
+        }
+        assert [t.id for t in manager.iter_tasks(status=True)] == complete
+        assert [t.id for t in manager.iter_tasks(500, 3, status=True)] == [
+            501,
+            511,
+            521,
+        ]
+        incomplete = [t.id for t in manager.iter_tasks(status=False)]
+        assert len(incomplete) == 1998 - len(complete)
+        assert 11 in incomplete and 21 not in incomplete and 22 not in incomplete
+
+        # Filtered pages match slices of the filtered list
+        assert [t.id for t in manager.iter_page(2, 5, status=True)] == complete[5:10]
+        assert list(manager.iter_page(100, 5, status=True)) == []
+
+    print("[PASS] Status index passed\n")
+
+
+def test_created_between():
+    """Test creation time range queries on every manager."""
+    print("=" * 60)
+    print("TEST: Created-Between Range Queries")
+    print("=" * 60)
+
+    managers = [
+        TodoManager(DictTaskStore()),
+        TodoManager(ColumnarTaskStore()),
+        TodoManager(PersistentTaskStore()),
+        ConcurrentTodoManager(),
+    ]
+    for manager in managers:
+        for i in range(2000):
+            manager.add_task(f"Task {i}")
+        for task_id in range(1, 1500):
+            manager.delete_task(task_id)
+
+        tasks = manager.get_all_tasks()
+        created = [task.created_at for task in tasks]
+        assert all(isinstance(value, int) for value in created)
+        assert created == sorted(created)
+
+        after, before = tasks[100].created_at, tasks[200].created_at
+        expected = [t.id for t in tasks if after <= t.created_at < before]
+        found = manager.iter_created_between(after, before)
+        assert [t.id for t in found] == expected
+        assert [t.id for t in manager.iter_created_between(before=after)] == [
+            t.id for t in tasks if t.created_at < after
+        ]
+        assert len(list(manager.iter_created_between(after, limit=7))) == 7
+        assert list(manager.iter_created_between(created[-1] + 1)) == []
+
+    # Timestamps round-trip through datetimes at microsecond precision
+    seconds, nanoseconds = divmod(created[0], 1_000_000_000)
+    moment = datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+    assert format_timestamp(created[0]) == moment.isoformat()
+    assert datetime_to_timestamp(moment) == created[0] // 1000 * 1000
+
+    print("[PASS] Created-between range queries passed\n")
+
+
+def test_snapshots():
+    """Test that snapshots keep showing the tasks as they were."""
+    print("=" * 60)
+    print("TEST: Snapshots")
+    print("=" * 60)
+
+    store = PersistentTaskStore()
+    manager = TodoManager(store)
+    for i in range(2000):
+        manager.add_task(f"Task {i}")
+    manager.mark_complete(3)
+    held = manager.get_task(5)
+
+    snapshot = manager.snapshot()
+    # Taking a snapshot shares the store's trie instead of copying it
+    assert snapshot._root is store._root
+
+    manager.update_task(5, new_title="Renamed")
+    manager.mark_complete(6)
+    manager.mark_incomplete(3)
+    for task_id in range(1, 1001):
+        manager.delete_task(task_id)
+    # Enough adds to make the trie grow a level
+    manager.add_many((f"Extra {i}", None) for i in range(40000))
+
+    assert len(snapshot) == 2000 and snapshot.count_complete() == 1
+    assert [t.id for t in snapshot] == list(range(1, 2001))
+    assert snapshot.get(5).title == "Task 4" and held.title == "Task 4"
+    assert 7 in snapshot and 2001 not in snapshot
+    assert [t.id for t in snapshot.iter_from(0, status=True)] == [3]
+    assert snapshot.id_at(1999) == 2000 and snapshot.id_at(2000) is None
+    created = snapshot.get(1500).created_at
+    first = min(t.id for t in snapshot if t.created_at >= created)
+    assert snapshot.id_created_from(created) == first
+
+    current = manager.snapshot()
+    assert len(current) == 41000 and current.count_complete() == 0
+    assert current.id_at(0) == 1001 and current.id_at(40999) == 42000
+    assert current.id_created_from(created) == max(first, 1001)
+    assert manager.get_task(5) is None and 5 in snapshot
+    assert manager.count_by_status() == {"complete": 0, "incomplete": 41000}
+
+    # Other stores mutate tasks in place, so their snapshots are copies
+    for other in (DictTaskStore(), ColumnarTaskStore()):
+        manager = TodoManager(other)
+        manager.add_task("Original")
+        snapshot = manager.snapshot()
+        manager.update_task(1, new_title="Changed")
+        manager.mark_complete(1)
+        assert [(t.title, t.status) for t in snapshot] == [("Original", False)]
+
+    print("[PASS] Snapshots passed\n")
+
+
+def test_columnar_memory():
+    """Test that the columnar store is far smaller per task."""
+    print("=" * 60)
+    print("TEST: Columnar Memory Footprint")
+    print("=" * 60)
+
+    # Earlier tests may have filled the pool, which then stops sharing titles
+    text_pool.clear()
+    sizes = {}
+    for store_class in (DictTaskStore, ColumnarTaskStore):
+        tracemalloc.start()
+        manager = TodoManager(store_class())
+        for i in range(20000):
+            manager.add_task(f"Task {i}")
+        sizes[store_class], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del manager
+
+    ratio = sizes[DictTaskStore] / sizes[ColumnarTaskStore]
+    print(f"Dict store is {ratio:.1f}x larger")
+    assert ratio > 5
+
+    print("[PASS] Columnar memory test passed\n")
+
+
+def run_all_tests():
+    """Run all storage tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING STORAGE ENGINE TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_columnar_basic_operations,
+        test_stores_agree,
+        test_view_survives_compaction,
+        test_iter_tasks_paging,
+        test_paging_across_deletes,
+        test_status_index,
+        test_created_between,
+        test_snapshots,
+        test_columnar_memory,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
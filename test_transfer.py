@@ -0,0 +1,208 @@
+"""
+Test script for streaming import and export.
+"""
+
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from main import main
+from todo_manager import TodoManager
+from transfer import FORMATS, TransferError, export_tasks, import_tasks
+
+
+def sample_manager():
+    """Return a manager holding tasks with awkward text."""
+    manager = TodoManager()
+    manager.add_task("Buy milk", "2 liters")
+    manager.add_task('Café, "quoted"', "Line one\nLine two, with comma")
+    manager.add_task("No description")
+    manager.mark_complete(2)
+    manager.delete_task(3)
+    manager.add_task("  Tab\tand backslash \\ ")
+    return manager
+
+
+def fields(manager):
+    """Return the transferable fields of every task."""
+    return [(t.title, t.description, t.status) for t in manager.get_all_tasks()]
+
+
+def import_bytes(data, file_format, batch_size=10_000):
+    """Import data into a new manager; return (manager, counts, rejections)."""
+    manager = TodoManager()
+    rejections = []
+    counts = import_tasks(
+        manager,
+        io.BytesIO(data),
+        file_format,
+        lambda row, message: rejections.append((row, message)),
+        batch_size,
+    )
+    return manager, counts, rejections
+
+
+def test_round_trip():
+    """Test that every format exports and imports tasks unchanged."""
+    print("=" * 60)
+    print("TEST: Round Trip")
+    print("=" * 60)
+
+    source = sample_manager()
+    for file_format in FORMATS:
+        output = io.BytesIO()
+        assert export_tasks(source.iter_tasks(), output, file_format) == 3
+
+        manager, counts, rejections = import_bytes(output.getvalue(), file_format)
+        assert counts == (3, 0) and rejections == [], file_format
+        assert fields(manager) == fields(source), file_format
+        # Imported tasks get new, contiguous IDs
+        assert [t.id for t in manager.get_all_tasks()] == [1, 2, 3]
+
+    print("[PASS] Round trip passed\n")
+
+
+def test_rejected_rows():
+    """Test that bad rows are reported in order without stopping the import."""
+    print("=" * 60)
+    print("TEST: Rejected Rows")
+    print("=" * 60)
+
+    data = (
+        b'{"title": "First"}\n'
+        b'{"title": ""}\n'
+        b"not json\n"
+        b"\n"
+        b'{"title": "Done", "status": true}\n'
+        b'{"description": "no title"}\n'
+        b'{"title": "' + b"x" * 201 + b'"}\n'
+        b'{"title": "Last", "status": "yes"}\n'
+    )
+    # A small batch size spreads the rows over several add_many calls
+    manager, counts, rejections = import_bytes(data, "jsonl", batch_size=2)
+    assert counts == (2, 5)
+    assert [row for row, _ in rejections] == [2, 3, 6, 7, 8]
+    assert rejections[0] == (2, "Title cannot be empty")
+    assert rejections[2] == (6, "Missing title")
+    assert fields(manager) == [("First", "", False), ("Done", "", True)]
+
+    data = b"Title,Status,Extra\nOne,complete,x\n,\nTwo,maybe\nThree,\n"
+    manager, counts, rejections = import_bytes(data, "csv")
+    assert counts == (2, 2)
+    assert rejections == [(3, "Title cannot be empty"), (4, "Invalid status: 'maybe'")]
+    assert fields(manager) == [("One", "", True), ("Three", "", False)]
+
+    print("[PASS] Rejected rows passed\n")
+
+
+def test_unreadable_files():
+    """Test that files that cannot be read as a whole raise TransferError."""
+    print("=" * 60)
+    print("TEST: Unreadable Files")
+    print("=" * 60)
+
+    exported = io.BytesIO()
+    export_tasks(sample_manager().iter_tasks(), exported, "binary")
+    truncated = exported.getvalue()[:-3]
+
+    for data, file_format in (
+        (b"name,description\nA,B\n", "csv"),
+        (b"PK\x03\x04", "binary"),
+        (truncated, "binary"),
+    ):
+        manager = TodoManager()
+        try:
+            import_tasks(manager, io.BytesIO(data), file_format)
+            raise AssertionError(f"{file_format} import did not fail")
+        except TransferError:
+            pass
+    # Records before the truncated one were imported
+    assert manager.task_count() == 2
+
+    print("[PASS] Unreadable files passed\n")
+
+
+def test_import_export_commands():
+    """Test the one-shot export and import commands."""
+    print("=" * 60)
+    print("TEST: Import/Export Commands")
+    print("=" * 60)
+
+    def run(*argv):
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                main(list(argv))
+        except SystemExit as e:
+            return e.code, out.getvalue(), err.getvalue()
+        raise AssertionError("main() did not exit")
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source")
+        target = os.path.join(directory, "target")
+        csv_path = os.path.join(directory, "tasks.csv")
+        run("--data-dir", source, "add", "Exported task", "With text")
+        run("--data-dir", source, "complete", "1")
+
+        code, out, _ = run("--data-dir", source, "export", csv_path)
+        assert code == 0 and "Exported 1 task(s)" in out
+        code, out, _ = run("--data-dir", target, "import", csv_path)
+        assert code == 0 and "Imported 1 task(s)" in out
+
+        bad_path = os.path.join(directory, "bad.jsonl")
+        with open(bad_path, "w", encoding="utf-8") as f:
+            f.write('{"title": "Good"}\n{"title": ""}\n')
+        code, out, err = run("--data-dir", target, "import", bad_path)
+        assert code == 1 and "1 row(s) rejected" in out
+        assert "Rejected row 2: Title cannot be empty" in err
+
+        code, out, _ = run("--data-dir", target, "import", "tasks.txt")
+        assert code == 1 and "use --format" in out
+
+        code, out, _ = run("--data-dir", target, "view", "--complete")
+        assert "Exported task" in out and "Good" not in out
+
+    print("[PASS] Import/export commands passed\n")
+
+
+def run_all_tests():
+    """Run all import/export tests."""
+    print("\n" + "=" * 60)
+    print("RUNNING IMPORT/EXPORT TESTS")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_round_trip,
+        test_rejected_rows,
+        test_unreadable_files,
+        test_import_export_commands,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__}: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)